@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from src.api.v1.routers.auth import router_auth
 from src.api.v1.routers.feedback import router_feedback
+from src.api.v1.routers.metrics import router_metrics
 from src.api.v1.routers.product import router_product
 from src.api.v1.routers.user import router_users
 
@@ -12,6 +13,7 @@ router_api_v1: APIRouter = APIRouter()
 ROUTERS: list[APIRouter] = [
     router_auth,
     router_feedback,
+    router_metrics,
     router_product,
     router_users,
 ]
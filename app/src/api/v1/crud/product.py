@@ -1,12 +1,37 @@
 """Модуль с классом CRUD запросов в базу данных для модели Product."""
 
+from sqlalchemy.orm import joinedload
+
+from src.api.v1.schemas.product import ProductRepresentSchema
 from src.database.base_async_crud import BaseAsyncCrud
-from src.models.product import Product
+from src.database.load_options import load_options_from_schema
+from src.models.product import (
+    PRODUCT_CACHE_TAGS,
+    Product,
+)
+from src.models.user import User
 
 
 class ProductV1Crud(BaseAsyncCrud):
     """Класс CRUD запросов к базе данных к таблице Product."""
 
+    cache_tags: tuple[str, ...] = PRODUCT_CACHE_TAGS
+
+    load_profiles: dict[str, tuple] = {
+        'with_category': (
+            joinedload(Product.category),
+        ),
+        'with_salesman': (
+            joinedload(Product.salesman).joinedload(User.user_salesman),
+        ),
+        'full': (
+            joinedload(Product.category),
+            joinedload(Product.salesman).joinedload(User.user_salesman),
+        ),
+        # INFO. Только колонки, входящие в ProductRepresentSchema (с категорией и продавцом).
+        'represent': load_options_from_schema(model=Product, schema=ProductRepresentSchema),
+    }
+
 
 product_v1_crud = ProductV1Crud(
     model=Product,
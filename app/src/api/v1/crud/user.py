@@ -1,35 +1,102 @@
 """Модуль с классом CRUD запросов в базу данных для модели User."""
 
+from typing import Iterable
+
 from fastapi import (
     HTTPException,
     status,
 )
-from sqlalchemy.sql import select
+from sqlalchemy.orm import (
+    joinedload,
+    selectinload,
+)
+from sqlalchemy.sql import (
+    bindparam,
+    select,
+)
 from sqlalchemy.sql.selectable import Select
 
 from src.database.base_async_crud import BaseAsyncCrud
-from src.database.database import AsyncSession
+from src.database.database import (
+    AsyncSession,
+    Base,
+)
 from src.models.user import User
-from src.utils.password import hash_password
+from src.utils.password import verify_password_async
+from src.utils.revocation import revocation_user_sync
+from src.utils.user_cache import user_cache_delete
 
 
 # TODO. Запретить прочие методы.
 class UserV1Crud(BaseAsyncCrud):
     """Класс CRUD запросов к базе данных к таблице User."""
 
+    # INFO. Данные продавца входят в кэшированные страницы товаров
+    #       (смотри UserSalesmanRepresentForProduct).
+    cache_tags: tuple[str, ...] = ('salesman:{id}:products',)
+    cache_tags_columns: tuple[str, ...] = ('email', 'name_first', 'name_last', 'user_salesman_id')
+
+    load_profiles: dict[str, tuple] = {
+        'with_address': (
+            joinedload(User.address),
+        ),
+        'with_salesman': (
+            joinedload(User.user_salesman),
+        ),
+        'full': (
+            joinedload(User.address),
+            joinedload(User.user_salesman),
+            selectinload(User.bank_cards),
+            selectinload(User.products),
+        ),
+    }
+
+    def __init__(
+        self,
+        *,
+        model: Base,
+        **kwargs,
+    ):
+        super().__init__(model=model, **kwargs)
+        self._query_by_email: Select = (
+            select(self.model)
+            .where(self.model.email == bindparam('obj_email'))
+        )
+
+    async def cache_tags_purge_for_objs(
+        self,
+        *,
+        objs: Iterable[User],
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Удаляет из кэша записи с тегами cache_tags пользователей,
+        сбрасывает снимки пользователей в кэше между запросами
+        и синхронизирует множество отозванных пользователей.
+
+        Вызывается после commit (в методах записи или вызывающим кодом
+        при perform_commit=False): до commit другой запрос мог бы сохранить
+        в кэш еще не измененную строку пользователя.
+        """
+        users: tuple[User, ...] = tuple(objs)
+        for user in users:
+            await user_cache_delete(user_id=user.id)
+            await revocation_user_sync(user=user)
+        await super().cache_tags_purge_for_objs(objs=users, columns=columns)
+        return
+
     async def retrieve_by_email(
         self,
         *,
         obj_email: str,
         session: AsyncSession,
+        raise_404: bool = True,
     ) -> User:
         """Получает один объект User из базы данных по указанному email."""
-        query: Select = (
-            select(self.model)
-            .where(self.model.email == obj_email)
-        )
-        user: User | None = (await session.execute(query)).scalars().first()
-        if user is None:
+        user: User | None = (
+            await session.execute(self._query_by_email, {'obj_email': obj_email})
+        ).scalars().first()
+        if user is None and raise_404:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail='Объект не найден',
@@ -44,18 +111,18 @@ class UserV1Crud(BaseAsyncCrud):
         session: AsyncSession,
     ) -> User:
         """Получает один объект User из базы данных по указанному email и password."""
-        query: Select = (
-            select(self.model)
-            .where(
-                self.model.email == obj_email,
-                self.model.hashed_password == hash_password(raw_password=obj_raw_password),
-            )
+        user: User | None = await self.retrieve_by_email(
+            obj_email=obj_email,
+            session=session,
+            raise_404=False,
         )
-        user: User | None = (await session.execute(query)).scalars().first()
-        if user is None:
+        if user is None or not await verify_password_async(
+            raw_password=obj_raw_password,
+            hashed_password=user.password_hashed,
+        ):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail='Объект не найден',
+                detail='Объект не найден',
             )
         return user
 
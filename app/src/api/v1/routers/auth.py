@@ -35,12 +35,12 @@ from src.config.config import (
 )
 from src.database.database import (
     AsyncSession,
-    RedisKeys,
     get_async_session,
 )
 from src.models.user import User
 from src.utils.auth import (
     get_user,
+    get_user_fresh,
     send_email_confirm_code,
 )
 from src.utils.custom_exception import (
@@ -54,17 +54,34 @@ from src.utils.itsdangerous import (
 from src.utils.jwt import (
     jwt_decode,
     jwt_generate_pair,
+    jwt_keyring,
 )
 from src.utils.logger_json import (
     Logger,
     LoggerJsonAuth,
 )
-from src.utils.password import hash_password
-from src.utils.redis_data import (
-    redis_delete,
-    redis_get,
-    redis_get_ttl,
-    redis_set,
+from src.utils.one_shot_token import (
+    ONE_SHOT_TOKEN_PURPOSE_PASSWORD_RESET,
+    one_shot_token_consume,
+)
+from src.utils.outbox import outbox_task_add
+from src.utils.password import (
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from src.utils.rate_limiter import (
+    RateLimitResult,
+    rate_limiter_login,
+    rate_limiter_password_reset,
+    rate_limiter_register,
+)
+from src.utils.revocation import (
+    revocation_payload_is_revoked,
+    revocation_token_add,
+    revocation_user_add,
+    revocation_user_should_be_revoked,
+    revocation_user_tokens_revoke_all,
 )
 
 logger: Logger = LoggerJsonAuth
@@ -80,6 +97,7 @@ router_auth: APIRouter = APIRouter(
 )
 async def post_email_confirm_send(
     user: User = Depends(get_user),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Отправляет ссылку подтверждения электронной почты."""
     if user.email_is_confirmed:
@@ -91,11 +109,8 @@ async def post_email_confirm_send(
             status_code=status.HTTP_200_OK,
         )
 
-    await send_email_confirm_code(
-        user_id=user.id,
-        user_email=user.email,
-        user_full_name=user.get_full_name,
-    )
+    await send_email_confirm_code(user=user, session=session)
+    await session.commit()
 
     logger.info(msg=f'User id={user.id} successfully requested email confirm code.')
 
@@ -148,6 +163,22 @@ async def get_email_confirm_verify(
     )
 
 
+@router_auth.get(
+    path='/jwks.json',
+)
+async def get_jwks(
+    response: Response,
+):
+    """
+    Возвращает публичные ключи проверки JWT токенов в формате JWKS.
+
+    Ответ кэшируется клиентами (Cache-Control): при ротации новый ключ
+    добавляется в JWKS до начала подписи им токенов.
+    """
+    response.headers['Cache-Control'] = f'public, max-age={TimeIntervals.SECONDS_IN_5_MINUTES}'
+    return jwt_keyring.jwks()
+
+
 @router_auth.post(
     path='/login/',
     response_model=JwtTokenAccessRepresentSchema,
@@ -165,19 +196,19 @@ async def post_login(
         session=session,
     )
 
-    if user.is_deleted:
+    if not user.is_active:
 
-        logger.info(msg=f'User id={user.id} try to login to the is_deleted account.')
+        logger.info(msg=f'User id={user.id} try to login to the blocked account.')
 
         raise HTTPException(
             detail='Аккаунт заблокирован',
             status_code=status.HTTP_403_FORBIDDEN,
         )
 
-    bad_login_count: int | None = redis_get(key=RedisKeys.AUTH_USER_BAD_LOGIN_COUNT.format(user_email=user.email))
-    bad_login_count: int = bad_login_count if bad_login_count is not None else 0
-
-    if bad_login_count > settings.BAD_LOGIN_MAX_ATTEMPTS:
+    # INFO. Попытка учитывается до проверки пароля одним атомарным запросом:
+    #       параллельные попытки не могут пройти проверку лимита одновременно.
+    bad_login: RateLimitResult = await rate_limiter_login.hit(email=user.email)
+    if not bad_login.allowed:
 
         logger.warning(
             msg=(
@@ -186,26 +217,17 @@ async def post_login(
             ),
         )
 
-        ttl: int = redis_get_ttl(key=RedisKeys.AUTH_USER_BAD_LOGIN_COUNT.format(user_email=user.email))
         raise HTTPException(
-            detail=f'Превышено количество попыток входа. Пожалуйста, повторите попытку через {ttl} с.',
+            detail=f'Превышено количество попыток входа. Пожалуйста, повторите попытку через {bad_login.retry_after_sec} с.',
             status_code=status.HTTP_403_FORBIDDEN,
         )
 
     obj_raw_password=user_data.get('password')
 
-    if user.hashed_password != hash_password(raw_password=obj_raw_password):
-        bad_login_count += 1
-        if bad_login_count > settings.BAD_LOGIN_MAX_ATTEMPTS:
-            ex_sec: int = settings.BAD_LOGIN_BAN_SEC
-        else:
-            ex_sec: int = settings.BAD_LOGIN_EXPIRATION_SEC
-        redis_set(
-            key=RedisKeys.AUTH_USER_BAD_LOGIN_COUNT.format(user_email=user.email),
-            value=bad_login_count,
-            ex_sec=ex_sec,
-        )
-
+    if not await verify_password_async(
+        raw_password=obj_raw_password,
+        hashed_password=user.password_hashed,
+    ):
         logger.info(msg=f'User id={user.id} try to login to the account with bad password.')
 
         raise HTTPException(
@@ -213,7 +235,17 @@ async def post_login(
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
 
-    redis_delete(key=RedisKeys.AUTH_USER_BAD_LOGIN_COUNT.format(user_email=user.email))
+    await rate_limiter_login.reset(email=user.email)
+
+    # INFO. Прозрачно пересчитывает хэш, если изменились алгоритм или стоимость.
+    if password_needs_rehash(hashed_password=user.password_hashed):
+        await user_v1_crud.update_by_id(
+            obj_id=user.id,
+            obj_data={'password_hashed': await hash_password_async(raw_password=obj_raw_password)},
+            session=session,
+        )
+
+        logger.info(msg=f'User id={user.id} password hash was upgraded.')
 
     access_token, _, refresh_token, expires = jwt_generate_pair(
         user_id=user.id,
@@ -244,8 +276,19 @@ async def post_login(
 )
 async def post_logout(
     response: Response,
+    refresh: Annotated[str, Cookie()] = '',
 ):
-    """Осуществляет разлогинивание пользователя на сайте."""
+    """
+    Осуществляет разлогинивание пользователя на сайте.
+
+    Отзывает токен обновления, чтобы его нельзя было использовать повторно.
+    """
+    if refresh:
+        try:
+            await revocation_token_add(payload=jwt_decode(jwt_token=refresh))
+        except HTTPException:
+            pass
+
     if settings.DEBUG:
         cookie_domain: str = 'localhost'
     else:
@@ -267,14 +310,16 @@ async def post_logout(
 )
 async def post_password_change(
     passwords: AuthPasswordChangeSchema,
-    user: User = Depends(get_user),
+    user: User = Depends(get_user_fresh),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Изменяет старый пароль на новый."""
     passwords: dict[str, str] = passwords.model_dump()
 
-    hashed_password: str = hash_password(raw_password=passwords.get('password'))
-    if hashed_password != user.hashed_password:
+    if not await verify_password_async(
+        raw_password=passwords.get('password'),
+        hashed_password=user.password_hashed,
+    ):
         detail: dict[str, any] = form_pydantic_like_validation_error(
             type_=CustomValidationTypes.VALUE_ERROR,
             loc=[
@@ -293,16 +338,8 @@ async def post_password_change(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    new_hashed_password: str = hash_password(raw_password=passwords.get('new_password'))
-    await user_v1_crud.update_by_id(
-        obj_id=user.id,
-        obj_data={'hashed_password': new_hashed_password},
-        session=session,
-    )
-
-    send_password_has_changed_to_mail_task.apply_async(
-        args=(user.get_full_name, user.email),
-    )
+    new_hashed_password: str = await hash_password_async(raw_password=passwords.get('new_password'))
+    await __password_update(user=user, password_hashed=new_hashed_password, session=session)
 
     logger.info(msg=f'User id={user.id} successfully changed password.')
 
@@ -314,6 +351,7 @@ async def post_password_change(
 
 @router_auth.post(
     path='/password-reset/',
+    dependencies=[Depends(rate_limiter_password_reset)],
 )
 async def post_password_reset(
     email: AuthPasswordResetSchema,
@@ -347,9 +385,12 @@ async def post_password_reset(
         url_pass_reset_confirm: str = (
             f'https://{settings.DOMAIN_NAME}/recovery-password/{reset_token}/'
         )
-    send_password_restore_to_mail_task.apply_async(
+    outbox_task_add(
+        session=session,
+        task=send_password_restore_to_mail_task,
         args=(url_pass_reset_confirm, user.email),
     )
+    await session.commit()
 
     logger.info(msg=f'User with email={email} successfully requested password reset.')
 
@@ -378,16 +419,26 @@ async def post_password_reset_confirm(
     )
 
     user: None = None
-    redis_key: str = RedisKeys.USED_PASSWORD_RESET_TOKEN.format(reset_token=reset_token)
     if token_data:
-        token: str | None = redis_get(key=redis_key)
-        # INFO. Токен восстановления не может использоваться повторно.
-        if not token:
-            user: User | None = await user_v1_crud.retrieve_by_id(
-                obj_id=token_data.get('id'),
-                session=session,
-                raise_404=False,
-            )
+        user: User | None = await user_v1_crud.retrieve_by_id(
+            obj_id=token_data.get('id'),
+            session=session,
+            raise_404=False,
+        )
+
+    # INFO. Пароль хэшируется до "погашения" токена: при перегрузке пула
+    #       хэширования (503) токен остается действительным.
+    new_hashed_password: str | None = None
+    if user is not None:
+        new_hashed_password = await hash_password_async(raw_password=passwords.get('new_password'))
+        # INFO. Токен восстановления не может использоваться повторно:
+        #       токен "погашается" атомарно (SET NX) до смены пароля.
+        if not await one_shot_token_consume(
+            purpose=ONE_SHOT_TOKEN_PURPOSE_PASSWORD_RESET,
+            token=reset_token,
+            ex_sec=TimeIntervals.SECONDS_IN_1_DAY,
+        ):
+            user = None
 
     if user is None:
         if settings.DEBUG_EMAIL:
@@ -417,22 +468,7 @@ async def post_password_reset_confirm(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    new_hashed_password: str = hash_password(raw_password=passwords.get('new_password'))
-
-    redis_set(
-        key=redis_key,
-        value=1,
-        ex_sec=TimeIntervals.SECONDS_IN_1_DAY,
-    )
-    await user_v1_crud.update_by_id(
-        obj_id=user.id,
-        obj_data={'hashed_password': new_hashed_password},
-        session=session,
-    )
-
-    send_password_has_changed_to_mail_task.apply_async(
-        args=(user.get_full_name, user.email),
-    )
+    await __password_update(user=user, password_hashed=new_hashed_password, session=session)
 
     logger.info(msg=f'User id={user.id} successfully reset password.')
 
@@ -455,6 +491,11 @@ async def post_refresh(
     """
     Осуществляет обновление токена доступа
     при предъявлении валидного токена обновления.
+
+    Проверка отзыва токена и блокировки пользователя выполняется по Redis.
+    Пока множество отозванных пользователей не объявлено полным
+    (AUTH_REVOKED_USERS_IS_AUTHORITATIVE), пользователь дополнительно
+    проверяется по БД.
     """
     token_data: dict[str, any] = jwt_decode(jwt_token=refresh)
     if token_data.get('type') != settings.JWT_TYPE_REFRESH:
@@ -463,18 +504,31 @@ async def post_refresh(
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
 
-    user: User = await user_v1_crud.retrieve_by_id(
-        obj_id=token_data.get('sub'),
-        session=session,
-    )
-    if user.is_deleted:
+    if await revocation_payload_is_revoked(payload=token_data):
 
-        logger.info(msg=f'User id={user.id} try to refresh password with is_deleted account.')
+        logger.info(msg=f'User id={token_data.get("sub")} try to refresh with revoked token.')
 
         raise HTTPException(
-            detail='Аккаунт заблокирован',
-            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Указанный токен недействителен',
+            status_code=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    if not settings.AUTH_REVOKED_USERS_IS_AUTHORITATIVE:
+        user: User | None = await user_v1_crud.retrieve_by_id(
+            obj_id=int(token_data.get('sub')),
+            session=session,
+            raise_404=False,
         )
+        if user is None or revocation_user_should_be_revoked(user=user):
+
+            logger.info(msg=f'User id={token_data.get("sub")} try to refresh with blocked or deleted account.')
+
+            if user is not None:
+                await revocation_user_add(user_id=user.id)
+            raise HTTPException(
+                detail='Аккаунт заблокирован',
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
 
     access, *_ = jwt_generate_pair(
         user_id=token_data.get('sub'),
@@ -486,6 +540,7 @@ async def post_refresh(
 
 @router_auth.post(
     path='/register/',
+    dependencies=[Depends(rate_limiter_register)],
 )
 async def post_register(
     user_data: UserRegisterSchema,
@@ -498,13 +553,16 @@ async def post_register(
     """
     user_data: dict[str, any] = user_data.model_dump()
 
-    user_data['hashed_password'] = hash_password(raw_password=user_data.pop('password'))
+    user_data['password_hashed'] = await hash_password_async(raw_password=user_data.pop('password'))
+    # INFO. Пользователь и задача отправки кода подтверждения фиксируются одним commit.
     new_user: User = await user_v1_crud.create(
         obj_data=user_data,
         session=session,
+        perform_commit=False,
     )
-
-    await send_email_confirm_code(user=new_user)
+    await send_email_confirm_code(user=new_user, session=session)
+    await session.commit()
+    await user_v1_crud.cache_tags_purge_for_objs(objs=(new_user,))
 
     logger.info(msg=f'User id={new_user.id} successfully registered and requested email confirm code.')
 
@@ -517,3 +575,30 @@ async def post_register(
         },
         status_code=status.HTTP_201_CREATED,
     )
+
+
+async def __password_update(user: User, password_hashed: str, session: AsyncSession) -> None:
+    """
+    Сохраняет новый хэш пароля, ставит в очередь письмо о смене пароля
+    и отзывает все выпущенные токены пользователя.
+
+    Новый пароль и задача отправки письма фиксируются одним commit.
+    Вызывает HTTPException 404, если строка пользователя не обновлена.
+    """
+    outbox_task_add(
+        session=session,
+        task=send_password_has_changed_to_mail_task,
+        args=(user.get_full_name, user.email),
+    )
+    # INFO. Без очистки полей: неизвестная колонка вызывает ошибку, а не пропускается молча.
+    user_updated: User = await user_v1_crud.update_by_id(
+        obj_id=user.id,
+        obj_data={'password_hashed': password_hashed},
+        session=session,
+        perform_cleanup=False,
+        perform_commit=False,
+    )
+    await session.commit()
+    await user_v1_crud.cache_tags_purge_for_objs(objs=(user_updated,), columns=('password_hashed',))
+    await revocation_user_tokens_revoke_all(user_id=user.id)
+    return
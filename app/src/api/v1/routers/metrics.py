@@ -0,0 +1,34 @@
+"""
+Модуль с эндпоинтами метрик процесса приложения.
+
+Метрики относятся к текущему воркеру: при нескольких воркерах каждый
+запрос попадает в один из них.
+"""
+
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+
+from src.utils.auth import get_admin_payload
+from src.utils.cache import cache_metrics
+from src.utils.jwt import jwt_verified_cache
+from src.utils.password import password_hash_pool
+
+router_metrics: APIRouter = APIRouter(
+    prefix='/metrics',
+    tags=['Metrics'],
+)
+
+
+@router_metrics.get(
+    path='/',
+    dependencies=[Depends(get_admin_payload)],
+)
+async def metrics_retrieve() -> dict[str, any]:
+    """Возвращает метрики пула хэширования паролей и кэшей воркера (только администраторам)."""
+    return {
+        'password_hash_pool': password_hash_pool.metrics(),
+        'jwt_verified_cache': jwt_verified_cache.metrics(),
+        'cache': cache_metrics(),
+    }
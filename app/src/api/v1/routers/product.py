@@ -5,6 +5,7 @@
 from fastapi import (
     APIRouter,
     Depends,
+    Response,
 )
 
 from src.api.v1.crud.product import product_v1_crud
@@ -12,18 +13,44 @@ from src.api.v1.schemas.product import (
     ProductCreateSchema,
     ProductRepresentSchema,
 )
+from src.config.config import (
+    Pagination,
+    TimeIntervals,
+)
 from src.database.database import (
     AsyncSession,
     get_async_session,
 )
+from src.models.product import Product
 from src.models.user import User
 from src.utils.auth import get_user
+from src.utils.cache import TieredCache
 
 router_product: APIRouter = APIRouter(
     prefix='/products',
     tags=['Product'],
 )
 
+# INFO. Страницы товаров (cursor пагинация) кэшируются в памяти воркера и в Redis.
+#       Страницы удаляются из кэша по тегам (смотри product_page_tags) при записи
+#       товаров, категорий, пользователей и компаний продавцов через CRUD
+#       и админ-панель. Короткий TTL ограничивает устаревание при записи в обход них.
+cache_product_pages: TieredCache = TieredCache(
+    namespace='product_pages',
+    ex_sec=TimeIntervals.SECONDS_IN_5_MINUTES,
+)
+
+
+def product_page_tags(products: list[Product]) -> set[str]:
+    """Возвращает теги кэша страницы: товары, их категории и продавцы."""
+    tags: set[str] = {'products'}
+    for product in products:
+        tags.add(f'category:{product.category_id}')
+        tags.add(f'salesman:{product.salesman_id}:products')
+        if product.salesman.user_salesman_id is not None:
+            tags.add(f'user_salesman:{product.salesman.user_salesman_id}')
+    return tags
+
 
 @router_product.post(
     path='/',
@@ -47,17 +74,55 @@ async def product_create(
     response_model=list[ProductRepresentSchema],
 )
 async def product_retrieve_all(
+    response: Response,
     offset: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_async_session),
 ):
     """
     Возвращает все продукты.
 
     Сортировка производится по id в порядке убывания: от новинок к старым.
+
+    Поддерживает два режима пагинации:
+        - cursor: keyset пагинация, время ответа не зависит от глубины страницы
+        - offset: устаревший режим LIMIT/OFFSET, используется при offset > 0
+
+    Курсор следующей страницы возвращается в заголовке X-Next-Cursor
+    (отсутствует, если следующей страницы нет).
+    Размер страницы ограничен значением Pagination.LIMIT_MAX.
+
+    Страницы в режиме cursor кэшируются (cache_product_pages).
     """
-    return await product_v1_crud.retrieve_all(
-        offset=offset,
-        limit=limit,
-        session=session,
-    )
+    limit: int = max(min(limit, Pagination.LIMIT_MAX), 1)
+
+    if cursor is None and offset > 0:
+        return await product_v1_crud.retrieve_all(
+            offset=offset,
+            limit=limit,
+            session=session,
+            load='represent',
+        )
+
+    cache_key: str = f'{cursor or ""}_{limit}'
+    page: dict[str, any] | None = await cache_product_pages.get(key=cache_key)
+    if page is None:
+        products, next_cursor = await product_v1_crud.retrieve_page_after(
+            cursor=cursor,
+            limit=limit,
+            session=session,
+            load='represent',
+        )
+        page = {
+            'items': [
+                ProductRepresentSchema.model_validate(product, from_attributes=True).model_dump(mode='json')
+                for product in products
+            ],
+            'next_cursor': next_cursor,
+        }
+        await cache_product_pages.set(key=cache_key, value=page, tags=product_page_tags(products=products))
+
+    if page['next_cursor'] is not None:
+        response.headers['X-Next-Cursor'] = page['next_cursor']
+    return page['items']
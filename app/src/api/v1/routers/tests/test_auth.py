@@ -0,0 +1,170 @@
+"""
+Модуль с тестами эндпоинтов приложения "auth".
+"""
+
+from hashlib import pbkdf2_hmac
+from typing import AsyncGenerator
+
+from httpx import (
+    AsyncClient,
+    Response,
+)
+import pytest_asyncio as pytest
+from sqlalchemy import select
+
+from src.config.config import settings
+from src.database.database import AsyncSession
+from src.models.user import User
+from src.utils.itsdangerous import dangerous_token_generate
+from src.utils.jwt import jwt_generate_pair
+from src.utils.password import (
+    PASSWORD_HASHER_CURRENT,
+    hash_password,
+    password_needs_rehash,
+)
+from src.utils.rate_limiter import rate_limiter_login
+
+USER_EMAIL: str = 'user@example.com'
+USER_PASSWORD: str = 'Password_1'
+USER_PASSWORD_NEW: str = 'Password_2'
+
+
+@pytest.fixture(autouse=True)
+async def rate_limiter_login_reset() -> AsyncGenerator[None, None]:
+    """Сбрасывает счетчик неудачных входов тестового пользователя (ключи Redis не очищаются между тестами)."""
+    await rate_limiter_login.reset(email=USER_EMAIL)
+    yield
+    await rate_limiter_login.reset(email=USER_EMAIL)
+
+
+async def _user_create(session: AsyncSession, password_hashed: str) -> int:
+    """Создает пользователя с указанным хэшем пароля и возвращает его id."""
+    user: User = User(
+        email=USER_EMAIL,
+        name_first='Имя',
+        name_last='Фамилия',
+        password_hashed=password_hashed,
+    )
+    session.add(user)
+    await session.flush()
+    user_id: int = user.id
+    session.expunge_all()
+    return user_id
+
+
+async def _user_password_hashed(session: AsyncSession, user_id: int) -> str:
+    """Возвращает хэш пароля пользователя из БД."""
+    return (await session.execute(select(User.password_hashed).where(User.id == user_id))).scalar_one()
+
+
+async def test_post_refresh_rejects_access_token(test_api_client: AsyncClient) -> None:
+    """Токен доступа не принимается вместо токена обновления."""
+    access_token, *_ = jwt_generate_pair(user_id=1)
+
+    response: Response = await test_api_client.post(
+        'auth/refresh/',
+        headers={'Cookie': f'refresh={access_token}'},
+    )
+    assert response.status_code == 401
+
+
+async def test_post_login_rehashes_legacy_password(
+    test_api_client: AsyncClient,
+    test_async_session: AsyncSession,
+) -> None:
+    """Хэш устаревшего формата пересчитывается и сохраняется при успешном входе."""
+    password_hashed_legacy: str = str(
+        pbkdf2_hmac(
+            hash_name=settings.LEGACY_HASH_NAME,
+            password=USER_PASSWORD.encode(settings.PASS_ENCODE),
+            salt=settings.SALT.encode(settings.PASS_ENCODE),
+            iterations=settings.LEGACY_ITERATIONS,
+        ),
+    )
+    user_id: int = await _user_create(session=test_async_session, password_hashed=password_hashed_legacy)
+
+    response: Response = await test_api_client.post(
+        'auth/login/',
+        json={'email': USER_EMAIL, 'password': USER_PASSWORD},
+    )
+    assert response.status_code == 200
+    assert response.json()['access']
+
+    password_hashed: str = await _user_password_hashed(session=test_async_session, user_id=user_id)
+    assert password_hashed != password_hashed_legacy
+    assert password_hashed.startswith(PASSWORD_HASHER_CURRENT.algorithm)
+    assert not password_needs_rehash(hashed_password=password_hashed)
+
+    response = await test_api_client.post(
+        'auth/login/',
+        json={'email': USER_EMAIL, 'password': USER_PASSWORD},
+    )
+    assert response.status_code == 200
+
+
+async def test_post_password_reset_confirm_then_login(
+    test_api_client: AsyncClient,
+    test_async_session: AsyncSession,
+) -> None:
+    """После восстановления пароля вход выполняется с новым паролем, а не со старым."""
+    user_id: int = await _user_create(
+        session=test_async_session,
+        password_hashed=hash_password(raw_password=USER_PASSWORD),
+    )
+    reset_token: str = await dangerous_token_generate({'id': user_id})
+
+    response: Response = await test_api_client.post(
+        'auth/password-reset-confirm/',
+        json={
+            'reset_token': reset_token,
+            'new_password': USER_PASSWORD_NEW,
+            'new_password_confirm': USER_PASSWORD_NEW,
+        },
+    )
+    assert response.status_code == 200
+
+    response = await test_api_client.post(
+        'auth/login/',
+        json={'email': USER_EMAIL, 'password': USER_PASSWORD_NEW},
+    )
+    assert response.status_code == 200
+
+    response = await test_api_client.post(
+        'auth/login/',
+        json={'email': USER_EMAIL, 'password': USER_PASSWORD},
+    )
+    assert response.status_code == 401
+
+
+async def test_post_login_ban_after_max_attempts(
+    test_api_client: AsyncClient,
+    test_async_session: AsyncSession,
+) -> None:
+    """Допускается BAD_LOGIN_MAX_ATTEMPTS неудачных попыток: следующая неудачная попытка включает бан."""
+    await _user_create(session=test_async_session, password_hashed=hash_password(raw_password=USER_PASSWORD))
+
+    for _ in range(settings.BAD_LOGIN_MAX_ATTEMPTS):
+        response: Response = await test_api_client.post(
+            'auth/login/',
+            json={'email': USER_EMAIL, 'password': USER_PASSWORD_NEW},
+        )
+        assert response.status_code == 401
+
+    response = await test_api_client.post(
+        'auth/login/',
+        json={'email': USER_EMAIL, 'password': USER_PASSWORD},
+    )
+    assert response.status_code == 200
+
+    for _ in range(settings.BAD_LOGIN_MAX_ATTEMPTS + 1):
+        response = await test_api_client.post(
+            'auth/login/',
+            json={'email': USER_EMAIL, 'password': USER_PASSWORD_NEW},
+        )
+        assert response.status_code == 401
+
+    response = await test_api_client.post(
+        'auth/login/',
+        json={'email': USER_EMAIL, 'password': USER_PASSWORD},
+    )
+    assert response.status_code == 403
@@ -0,0 +1,75 @@
+"""
+Модуль с тестами эндпоинтов приложения "product".
+"""
+
+from typing import Callable
+
+import pytest
+from httpx import (
+    AsyncClient,
+    Response,
+)
+
+from src.api.v1.routers.product import cache_product_pages
+from src.database.database import AsyncSession
+from src.models.product import Product
+from src.models.product_category import ProductCategory
+from src.models.user import (
+    User,
+    UserSalesman,
+)
+
+
+async def _products_create(session: AsyncSession, count: int) -> None:
+    """Создает товары разных продавцов в одной категории."""
+    category: ProductCategory = ProductCategory(title='Категория')
+    session.add(category)
+    for number in range(count):
+        salesman: User = User(
+            email=f'salesman_{number}@example.com',
+            name_first='Имя',
+            name_last='Фамилия',
+            user_salesman=UserSalesman(company_name=f'Компания {number}'),
+        )
+        session.add(
+            Product(
+                title=f'Товар {number}',
+                description='Описание',
+                in_stock=1,
+                price=100,
+                category=category,
+                salesman=salesman,
+            ),
+        )
+    await session.flush()
+    # INFO. Иначе связанные объекты будут взяты из identity map сессии без запросов.
+    session.expunge_all()
+    return
+
+
+@pytest.mark.parametrize('products_count', (1, 10))
+async def test_product_retrieve_all_queries_count(
+    products_count: int,
+    test_api_client: AsyncClient,
+    test_async_session: AsyncSession,
+    assert_queries_count: Callable,
+) -> None:
+    """Количество SQL запросов страницы товаров не зависит от количества товаров (N+1)."""
+    await _products_create(session=test_async_session, count=products_count)
+    await cache_product_pages.clear()
+
+    with assert_queries_count(1) as statements:
+        response: Response = await test_api_client.get('products/')
+    assert response.status_code == 200
+    assert len(response.json()) == products_count
+    assert all(product['salesman']['company']['company_name'] for product in response.json())
+    # INFO. Загружаются только колонки схемы ответа (load_only), без данных продавца вне схемы.
+    assert 'password_hashed' not in statements[0]
+
+    with assert_queries_count(1):
+        response = await test_api_client.get('products/', params={'offset': 1})
+    assert response.status_code == 200
+    assert len(response.json()) == products_count - 1
+
+    await cache_product_pages.clear()
+    return
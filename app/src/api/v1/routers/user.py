@@ -10,6 +10,7 @@ from src.api.v1.schemas.user import (
     UserUpdate,
 )
 from src.database.database import AsyncSession, get_async_session
+from src.models.user import User
 from src.utils.auth import get_user
 
 router_users: APIRouter = APIRouter(
@@ -24,14 +25,14 @@ router_users: APIRouter = APIRouter(
     status_code=status.HTTP_200_OK,
 )
 async def user_me(
-    current_user: dict[str, any] = Depends(get_user),
-    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_user),
 ):
-    """Возвращает данные активного пользователя."""
-    return await user_v1_crud.retrieve_by_id(
-        obj_id=current_user.id,
-        session=session,
-    )
+    """
+    Возвращает данные активного пользователя.
+
+    Пользователь уже загружен зависимостью get_user, повторный запрос не нужен.
+    """
+    return current_user
 
 
 @router_users.patch(
@@ -41,7 +42,7 @@ async def user_me(
 )
 async def user_me_update(
     user_update: UserUpdate,
-    current_user: dict[str, any] = Depends(get_user),
+    current_user: User = Depends(get_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Изменяет данные активного пользователя."""
@@ -9,6 +9,7 @@ from typing import Optional
 from pydantic import (
     BaseModel,
     EmailStr,
+    Field,
     field_validator,
     model_validator,
 )
@@ -202,4 +203,5 @@ class UserSalesmanRepresentForProduct(BaseModel):
     name_first: str
     name_last: str
     email: EmailStr
-    company: UserSalesmanCompanyForProductRepresent
+    # INFO. Данные компании хранятся в связанной модели User.user_salesman.
+    company: UserSalesmanCompanyForProductRepresent = Field(validation_alias='user_salesman')
@@ -10,10 +10,19 @@ DIR_MEDIA: Path = Path(DIR_SRC, 'media')
 DIR_EMAIL_LOCAL: Path = Path(DIR_MEDIA, 'email_local')
 
 
+class BulkParams:
+    """Класс представления параметров массовых операций в базе данных."""
+
+    CHUNK_SIZE_DEFAULT: int = 1000
+    # INFO. Максимальное количество параметров в одном запросе PostgreSQL.
+    POSTGRES_BIND_PARAMS_MAX: int = 32767
+
+
 class Pagination:
     """Класс представления параметров пагинации."""
 
     LIMIT_DEFAULT: int = 15
+    LIMIT_MAX: int = 100
     OFFSET_DEFAULT: int = 0
 
 
@@ -64,7 +73,6 @@ class Settings(BaseSettings):
     REDIS_DB_CELERY_BACKEND: int
     REDIS_DB_CELERY_BROKER: int
     REDIS_DB_CACHE: int
-    REDIS_DB_CACHE_FASTAPI: int
 
     """Настройки брокера сообщений RabbitMQ."""
     RABBITMQ_HOST: str
@@ -78,6 +86,9 @@ class Settings(BaseSettings):
     ADMIN_PASSWORD: str
     ADMIN_SECRET_KEY: str
 
+    """Настройки безопасности: отзыв доступа."""
+    AUTH_REVOKED_USERS_IS_AUTHORITATIVE: bool = False
+
     """Настройки безопасности: тротлинг."""
     BAD_LOGIN_BAN_SEC: int
     BAD_LOGIN_MAX_ATTEMPTS: int
@@ -86,8 +97,26 @@ class Settings(BaseSettings):
     """Настройки безопасности: шифрование пароля."""
     HASH_NAME: str
     ITERATIONS: int
+    LEGACY_HASH_NAME: str
+    LEGACY_ITERATIONS: int
     PASS_ENCODE: str
+    PASSWORD_HASH_QUEUE_MAX: int = 32
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASHER: str = 'pbkdf2'
     SALT: str
+    SCRYPT_N: int = 16384
+    SCRYPT_P: int = 1
+    SCRYPT_R: int = 8
+
+    """Настройки кэширования."""
+    REDIS_COMPRESS_MIN_BYTES: int = 1024
+    REDIS_SERIALIZER: str = 'json'
+    USER_CACHE_EXPIRATION_SEC: int = 0
+
+    """Настройки очереди исходящих задач Celery (outbox)."""
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    OUTBOX_RELAY_INTERVAL_SEC: float = 1
+    OUTBOX_RELAY_MAX_ATTEMPTS: int = 10
 
     """Настройки безопасности: Dangerous токены."""
     SECRET_KEY: str
@@ -96,9 +125,12 @@ class Settings(BaseSettings):
     COOKIE_KEY_JWT_REFRESH: str = 'refresh'
     JWT_ALGORITHM: str
     JWT_ACCESS_EXPIRATION_SEC: int
+    JWT_KEY_ID: str = ''
+    JWT_KEYS_DIR: str = ''
     JWT_REFRESH_EXPIRATION_SEC: int
     JWT_TYPE_ACCESS: str = 'access'
     JWT_TYPE_REFRESH: str = 'refresh'
+    JWT_VERIFIED_CACHE_MAX_SIZE: int = 10000
 
     """Настройки почтового клиента SMTP."""
     SMTP_HOST: str
@@ -117,6 +149,7 @@ class Settings(BaseSettings):
     DEBUG_LOGGING: bool
     DOMAIN_IP: str
     DOMAIN_NAME: str
+    FORWARDED_ALLOW_IPS: str
     WORKERS_AMOUNT: int
 
 
@@ -4,10 +4,12 @@
 Осуществляет подготовку Pytest.
 """
 
+from contextlib import contextmanager
 import os
 import sys
 from typing import (
     AsyncGenerator,
+    Callable,
     Generator,
 )
 
@@ -18,7 +20,10 @@ from httpx import (
     AsyncClient,
 )
 import pytest_asyncio as pytest
-from sqlalchemy import text
+from sqlalchemy import (
+    event,
+    text,
+)
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -35,6 +40,7 @@ from src.config.config import settings
 from src.database.database import (
     Base,
     get_async_session,
+    redis_async,
 )
 from src.main import app
 
@@ -114,6 +120,18 @@ async def setup_test_db() -> AsyncGenerator[None, None]:
         await connection.close()
 
 
+@pytest.fixture(scope="function", autouse=True)
+async def redis_async_open() -> AsyncGenerator[None, None]:
+    """
+    Создает пул соединений Redis на время теста (вместо lifespan).
+
+    Соединения асинхронного пула привязаны к event loop теста.
+    """
+    await redis_async.open()
+    yield
+    await redis_async.close()
+
+
 @pytest.fixture(scope="function", autouse=True)
 async def truncate_test_db(test_async_session: AsyncSession) -> AsyncGenerator[None, None]:
     """Очистка тестовой БД перед каждым тестовым запуском."""
@@ -129,3 +147,33 @@ async def test_api_client() -> AsyncGenerator[AsyncClient, None]:
         transport=ASGITransport(app=app),
     ) as test_client:
         yield test_client
+
+
+@pytest.fixture()
+def assert_queries_count() -> Callable:
+    """
+    Фикстура для проверки количества SQL запросов (защита от N+1).
+
+    Пример использования:
+        with assert_queries_count(2):
+            await test_api_client.get('products/')
+    """
+    @contextmanager
+    def _assert_queries_count(expected: int) -> Generator[list[str], None, None]:
+        statements: list[str] = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_async_engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(test_async_engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+
+        assert len(statements) == expected, (
+            f'Ожидалось SQL запросов: {expected}, выполнено: {len(statements)}.\n'
+            + '\n'.join(statements)
+        )
+
+    return _assert_queries_count
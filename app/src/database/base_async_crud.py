@@ -2,15 +2,21 @@
 Модуль базового класса асинхронных CRUD запросов в базу данных.
 """
 
+from collections import Counter
+from typing import Iterable
 from uuid import UUID
 
 from fastapi import (
     HTTPException,
     status,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql.dml import Insert as PgInsert
 from sqlalchemy.sql import (
+    bindparam,
     insert,
     select,
+    tuple_,
     update,
 )
 from sqlalchemy.sql.dml import (
@@ -19,11 +25,23 @@ from sqlalchemy.sql.dml import (
 )
 from sqlalchemy.sql.selectable import Select
 
-from src.config.config import Pagination
+from src.config.config import (
+    BulkParams,
+    Pagination,
+)
 from src.database.database import (
     AsyncSession,
     Base,
 )
+from src.database.model_meta import (
+    ModelMeta,
+    model_meta_build,
+)
+from src.utils.cache import cache_tags_purge_after_commit
+from src.utils.cursor import (
+    cursor_decode,
+    cursor_encode,
+)
 from src.utils.custom_exception import (
     CustomValidationTypes,
     form_pydantic_like_validation_error,
@@ -34,6 +52,22 @@ from src.utils.datetime_calc import datetime_now_utc
 class BaseAsyncCrud():
     """Базовый класс CRUD запросов к базе данных."""
 
+    # INFO. Профили жадной загрузки связей: название профиля -> опции загрузчика
+    #       (selectinload / joinedload). Переопределяются в дочерних классах
+    #       и используются через параметр load, например retrieve_all(load='full').
+    load_profiles: dict[str, tuple] = {}
+
+    # INFO. Шаблоны тегов кэша, форматируемые колонками строки, например
+    #       ('products', 'product:{id}'). Записи кэша с этими тегами удаляются
+    #       после commit в методах записи (смотри cache_tags_purge в cache.py).
+    #       При perform_commit=False необходимо вызвать cache_tags_purge_for_objs
+    #       самостоятельно после commit.
+    cache_tags: tuple[str, ...] = ()
+
+    # INFO. Колонки, входящие в закэшированные данные. Обновление других колонок
+    #       (update_*) не удаляет записи кэша. None - любые колонки.
+    cache_tags_columns: tuple[str, ...] | None = None
+
     def __init__(
         self,
         *,
@@ -42,8 +76,22 @@ class BaseAsyncCrud():
         unique_columns_err: str = 'Объект уже существует',
     ):
         self.model = model
+        self.meta: ModelMeta = model_meta_build(model=model, unique_columns=unique_columns)
         self.unique_columns_err = unique_columns_err
-        self.unique_columns = unique_columns
+        self.unique_columns = self.meta.unique_columns
+        # INFO. Запросы частых выборок строятся один раз на модель: значения
+        #       передаются через bindparam, а скомпилированный SQL берется
+        #       из кэша SQLAlchemy без повторного построения конструкции select().
+        self._query_by_id: Select = (
+            select(self.model)
+            .where(self.model.id == bindparam('obj_id'))
+        )
+        self._query_by_uuid: Select | None = None
+        if 'uuid' in self.meta.column_names:
+            self._query_by_uuid = (
+                select(self.model)
+                .where(self.model.uuid == bindparam('obj_uuid'))
+            )
 
     async def create(
         self,
@@ -64,30 +112,258 @@ class BaseAsyncCrud():
 
         if perform_commit:
             await session.commit()
+            await self.cache_tags_purge_for_objs(objs=(obj,))
 
         return obj
 
+    async def create_many(
+        self,
+        *,
+        objs_data: Iterable[dict[str, any]],
+        session: AsyncSession,
+        chunk_size: int = BulkParams.CHUNK_SIZE_DEFAULT,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+        raise_on_conflict: bool = True,
+    ) -> list[Base]:
+        """
+        Создает множество объектов в базе данных.
+
+        Вместо пары запросов SELECT + INSERT на каждый объект выполняется
+        один запрос INSERT ... ON CONFLICT (unique_columns) DO NOTHING RETURNING
+        на каждую пачку из chunk_size объектов.
+
+        Объекты, не созданные из-за конфликта уникальности, возвращаются
+        в виде HTTPException 422 со списком ошибок в pydantic-like формате
+        (loc содержит индекс объекта в переданных данных), при этом
+        ни один объект не создается.
+        Если raise_on_conflict=False, то такие объекты просто пропускаются.
+
+        Все словари в objs_data должны содержать одинаковый набор ключей.
+        """
+        objs_data: list[dict[str, any]] = self._prepare_objs_data(
+            objs_data=objs_data,
+            perform_cleanup=perform_cleanup,
+        )
+        if not objs_data:
+            return []
+
+        objs: list[Base] = []
+        # INFO. При исключении точка сохранения (SAVEPOINT) откатывает уже вставленные
+        #       пачки, не затрагивая остальные изменения транзакции вызывающего кода.
+        async with session.begin_nested():
+            for chunk in self._split_into_chunks(objs_data=objs_data, chunk_size=chunk_size):
+                stmt: PgInsert = pg_insert(self.model).values(chunk)
+                if self.unique_columns is not None:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=self.unique_columns)
+                stmt = stmt.returning(self.model)
+                objs.extend((await session.execute(stmt)).scalars().all())
+
+            if raise_on_conflict:
+                conflicts: list[dict[str, any]] = self._find_unique_conflicts(
+                    objs_data=objs_data,
+                    objs=objs,
+                )
+                if conflicts:
+                    raise HTTPException(
+                        detail=conflicts,
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    )
+
+        if perform_commit:
+            await session.commit()
+            await self.cache_tags_purge_for_objs(objs=objs)
+
+        return objs
+
+    async def upsert_many(
+        self,
+        *,
+        objs_data: Iterable[dict[str, any]],
+        session: AsyncSession,
+        update_columns: tuple[str] | None = None,
+        chunk_size: int = BulkParams.CHUNK_SIZE_DEFAULT,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+    ) -> list[Base]:
+        """
+        Создает или обновляет множество объектов в базе данных.
+
+        Выполняет один запрос INSERT ... ON CONFLICT (unique_columns) DO UPDATE RETURNING
+        на каждую пачку из chunk_size объектов. При конфликте обновляются колонки
+        update_columns (по умолчанию - все переданные, кроме уникальных и id).
+
+        Если в одной пачке несколько объектов с одинаковыми значениями
+        unique_columns, то сохраняется последний из них.
+        """
+        if self.unique_columns is None:
+            raise ValueError(f'{self.__class__.__name__}: upsert_many требует unique_columns')
+
+        objs_data: list[dict[str, any]] = self._prepare_objs_data(
+            objs_data=objs_data,
+            perform_cleanup=perform_cleanup,
+        )
+        if not objs_data:
+            return []
+
+        if update_columns is None:
+            update_columns: tuple[str] = tuple(
+                column for column in objs_data[0]
+                if column not in self.unique_columns and column != 'id'
+            )
+
+        objs: list[Base] = []
+        for chunk in self._split_into_chunks(objs_data=objs_data, chunk_size=chunk_size):
+            # INFO. PostgreSQL не позволяет одному INSERT ... ON CONFLICT DO UPDATE
+            #       изменить одну и ту же строку дважды.
+            chunk: list[dict[str, any]] = list(
+                {
+                    tuple(obj_data[column] for column in self.unique_columns): obj_data
+                    for obj_data in chunk
+                }.values(),
+            )
+            stmt: PgInsert = pg_insert(self.model).values(chunk)
+            if update_columns:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=self.unique_columns,
+                    set_={column: stmt.excluded[column] for column in update_columns},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=self.unique_columns)
+            stmt = stmt.returning(self.model)
+            objs.extend(
+                (
+                    await session.execute(
+                        stmt,
+                        execution_options={'populate_existing': True},
+                    )
+                ).scalars().all(),
+            )
+
+        if perform_commit:
+            await session.commit()
+            await self.cache_tags_purge_for_objs(objs=objs)
+
+        return objs
+
     async def retrieve_all(
         self,
         *,
         limit: int = Pagination.LIMIT_DEFAULT,
         offset: int = Pagination.OFFSET_DEFAULT,
         session: AsyncSession,
+        load: str | None = None,
     ) -> list[Base]:
-        """Получает все объекты из базы данных."""
-        query: Select = select(self.model).limit(limit).offset(offset)
+        """
+        Получает все объекты из базы данных.
+
+        Объекты сортируются по id в порядке убывания (как в retrieve_page_after):
+        без ORDER BY порядок строк не определен, и страницы LIMIT/OFFSET
+        могут пересекаться или пропускать строки.
+
+        Параметр load указывает профиль жадной загрузки связей (см. load_profiles).
+        """
+        query: Select = (
+            select(self.model)
+            .options(*self._load_options(load=load))
+            .order_by(self.model.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
         return (await session.execute(query)).scalars().all()
 
+    async def retrieve_page_after(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int = Pagination.LIMIT_DEFAULT,
+        order_by: str = 'id',
+        descending: bool = True,
+        session: AsyncSession,
+        load: str | None = None,
+    ) -> tuple[list[Base], str | None]:
+        """
+        Получает страницу объектов из базы данных методом keyset пагинации.
+
+        В отличие от LIMIT/OFFSET не просматривает строки предыдущих страниц:
+        условие WHERE (order_by, id) < (последнее значение) использует индекс,
+        поэтому время ответа не зависит от номера страницы.
+
+        Возвращает список объектов и курсор следующей страницы
+        (None, если следующей страницы нет).
+
+        Параметр load указывает профиль жадной загрузки связей (см. load_profiles).
+
+        Вызывает ValueError, если колонка order_by допускает NULL: сравнение
+        кортежей с NULL не истинно, и такие строки выпадали бы из выдачи.
+        """
+        column_id = self.model.id
+        column_sort = getattr(self.model, order_by)
+        is_sort_by_id: bool = order_by == 'id'
+        if any(column.nullable for column in column_sort.property.columns):
+            raise ValueError(
+                f'{self.__class__.__name__}: retrieve_page_after не поддерживает '
+                f'сортировку по колонке "{order_by}", допускающей NULL',
+            )
+
+        if descending:
+            ordering: tuple = (column_sort.desc(), column_id.desc())
+        else:
+            ordering: tuple = (column_sort.asc(), column_id.asc())
+        if is_sort_by_id:
+            ordering = ordering[:1]
+
+        # INFO. Дополнительный объект нужен, чтобы узнать о наличии следующей страницы.
+        query: Select = (
+            select(self.model)
+            .options(*self._load_options(load=load))
+            .order_by(*ordering)
+            .limit(limit + 1)
+        )
+
+        if cursor is not None:
+            values: list[any] = cursor_decode(
+                cursor=cursor,
+                sort_type=None if is_sort_by_id else self._column_python_type(column=column_sort),
+            )
+            if is_sort_by_id:
+                key_left, key_right = column_id, values[-1]
+            else:
+                key_left = tuple_(column_sort, column_id)
+                key_right = tuple_(values[0], values[-1])
+            query = query.where(key_left < key_right if descending else key_left > key_right)
+
+        objs: list[Base] = (await session.execute(query)).scalars().all()
+        if len(objs) <= limit:
+            return objs, None
+
+        objs = objs[:limit]
+        last: Base = objs[-1]
+        if is_sort_by_id:
+            next_cursor: str = cursor_encode(values=[last.id])
+        else:
+            next_cursor: str = cursor_encode(values=[getattr(last, order_by), last.id])
+        return objs, next_cursor
+
     async def retrieve_by_id(
         self,
         *,
         obj_id: int,
         session: AsyncSession,
         raise_404: bool = True,
+        load: str | None = None,
     ) -> Base:
-        """Получает один объект из базы данных по указанному id."""
-        query: Select = select(self.model).where(self.model.id == obj_id)
-        result: Base | None = (await session.execute(query)).scalars().first()
+        """
+        Получает один объект из базы данных по указанному id.
+
+        Параметр load указывает профиль жадной загрузки связей (см. load_profiles).
+        """
+        query: Select = self._query_by_id
+        if load is not None:
+            query = query.options(*self._load_options(load=load))
+        result: Base | None = (
+            await session.execute(query, {'obj_id': obj_id})
+        ).scalars().first()
         if result is None and raise_404:
             self._raise_httpexception_404_not_found(id=obj_id)
         return result
@@ -98,9 +374,15 @@ class BaseAsyncCrud():
         obj_uuid: UUID,
         session: AsyncSession,
     ) -> Base:
-        """Получает один объект из базы данных по указанному uuid."""
-        query: Select = select(self.model).where(self.model.uuid == obj_uuid)
-        result: Base | None = (await session.execute(query)).scalars().first()
+        """
+        Получает один объект из базы данных по указанному uuid.
+
+        Вызывает ValueError, если модель не содержит колонки uuid.
+        """
+        self._check_uuid_column()
+        result: Base | None = (
+            await session.execute(self._query_by_uuid, {'obj_uuid': obj_uuid})
+        ).scalars().first()
         if result is None:
             self._raise_httpexception_404_not_found(uuid=obj_uuid)
         return result
@@ -112,7 +394,12 @@ class BaseAsyncCrud():
         user_id: int,
         session: AsyncSession,
     ) -> Base:
-        """Получает один объект из базы данных по указанному uuid."""
+        """
+        Получает один объект из базы данных по указанному uuid.
+
+        Вызывает ValueError, если модель не содержит колонки uuid.
+        """
+        self._check_uuid_column()
         query: Select = (
             select(self.model)
             .where(
@@ -142,9 +429,8 @@ class BaseAsyncCrud():
         if perform_obj_unique_check:
             await self._check_unique(obj_data=obj_data, session=session)
 
-        query: Select = select(self.model).where(self.model.id == obj_id)
-        if (await session.execute(query)).scalars().first() is None:
-            self._raise_httpexception_404_not_found(id=obj_id)
+        if not obj_data:
+            return await self.retrieve_by_id(obj_id=obj_id, session=session)
 
         stmt: Update = (
             update(self.model)
@@ -152,13 +438,57 @@ class BaseAsyncCrud():
             .values(**obj_data)
             .returning(self.model)
         )
-        obj: Base = (await session.execute(stmt)).scalars().first()
+        obj: Base | None = (await session.execute(stmt)).scalars().first()
+        if obj is None:
+            self._raise_httpexception_404_not_found(id=obj_id)
 
         if perform_commit:
             await session.commit()
+            await self.cache_tags_purge_for_objs(objs=(obj,), columns=obj_data)
 
         return obj
 
+    async def update_many_by_ids(
+        self,
+        *,
+        obj_ids: list[int],
+        obj_data: dict[str, any],
+        session: AsyncSession,
+        perform_cleanup: bool = True,
+        perform_commit: bool = True,
+    ) -> list[Base]:
+        """
+        Обновляет одним запросом множество объектов из базы данных по указанным id.
+
+        Если часть объектов не найдена, то вызывает HTTPException со статусом 404
+        со списком отсутствующих id.
+        """
+        if perform_cleanup:
+            obj_data: dict[str, any] = self._clean_obj_data_non_model_fields(obj_data=obj_data)
+
+        if not obj_ids:
+            return []
+
+        if not obj_data:
+            query: Select = select(self.model).where(self.model.id.in_(obj_ids))
+            objs: list[Base] = (await session.execute(query)).scalars().all()
+        else:
+            stmt: Update = (
+                update(self.model)
+                .where(self.model.id.in_(obj_ids))
+                .values(**obj_data)
+                .returning(self.model)
+            )
+            objs: list[Base] = (await session.execute(stmt)).scalars().all()
+
+        self._check_all_ids_found(obj_ids=obj_ids, found_ids=[obj.id for obj in objs])
+
+        if perform_commit:
+            await session.commit()
+            await self.cache_tags_purge_for_objs(objs=objs, columns=obj_data)
+
+        return objs
+
     async def delete_soft_by_id(
         self,
         *,
@@ -171,9 +501,7 @@ class BaseAsyncCrud():
             - обновляет поле is_deleted = True
             - обновляет поле datetime_deleted = "сейчас"
         """
-        query: Select = select(self.model).where(self.model.id == obj_id)
-        if (await session.execute(query)).scalars().first() is None:
-            return
+        self._check_soft_deletable()
 
         stmt: Update = (
             update(self.model)
@@ -182,14 +510,59 @@ class BaseAsyncCrud():
                 is_deleted=True,
                 datetime_deleted=datetime_now_utc(),
             )
+            .returning(self.model)
         )
-        await session.execute(stmt)
+        obj: Base | None = (await session.execute(stmt)).scalars().first()
+        if obj is None:
+            return
 
         if perform_commit:
             await session.commit()
+            await self.cache_tags_purge_for_objs(objs=(obj,))
 
         return
 
+    async def delete_soft_many_by_ids(
+        self,
+        *,
+        obj_ids: list[int],
+        session: AsyncSession,
+        perform_commit: bool = True,
+        raise_404: bool = False,
+    ) -> list[int]:
+        """
+        Удаляет фиктивно одним запросом множество объектов из базы данных по указанным id.
+
+        Возвращает список id удаленных объектов.
+        Если raise_404=True и часть объектов не найдена, то вызывает HTTPException
+        со статусом 404 со списком отсутствующих id.
+        """
+        self._check_soft_deletable()
+
+        if not obj_ids:
+            return []
+
+        stmt: Update = (
+            update(self.model)
+            .where(self.model.id.in_(obj_ids))
+            .values(
+                is_deleted=True,
+                datetime_deleted=datetime_now_utc(),
+            )
+            .returning(self.model)
+        )
+        objs: list[Base] = (await session.execute(stmt)).scalars().all()
+        deleted_ids: list[int] = [obj.id for obj in objs]
+
+        if raise_404:
+            self._check_all_ids_found(obj_ids=obj_ids, found_ids=deleted_ids)
+
+        if perform_commit and deleted_ids:
+            await session.commit()
+            await self.cache_tags_purge_for_objs(objs=objs)
+
+        return deleted_ids
+
     async def _check_unique(
         self,
         *,
@@ -225,6 +598,173 @@ class BaseAsyncCrud():
 
         return
 
+    def _column_python_type(
+        self,
+        *,
+        column: any,
+    ) -> type:
+        """Возвращает тип Python колонки модели (object, если тип неизвестен)."""
+        try:
+            return column.type.python_type
+        except NotImplementedError:
+            return object
+
+    def _find_unique_conflicts(
+        self,
+        *,
+        objs_data: list[dict[str, any]],
+        objs: list[Base],
+    ) -> list[dict[str, any]]:
+        """
+        Сопоставляет переданные данные с созданными объектами
+        и формирует ошибки для каждого несозданного объекта.
+        """
+        if self.unique_columns is None:
+            return []
+
+        created: Counter = Counter(
+            tuple(getattr(obj, column) for column in self.unique_columns)
+            for obj in objs
+        )
+        conflicts: list[dict[str, any]] = []
+        for index, obj_data in enumerate(objs_data):
+            key: tuple = tuple(obj_data[column] for column in self.unique_columns)
+            if created[key] > 0:
+                created[key] -= 1
+                continue
+            conflicts.append(
+                form_pydantic_like_validation_error(
+                    type_=CustomValidationTypes.VALUE_ERROR,
+                    loc=[
+                        'body',
+                        index,
+                        *self.unique_columns,
+                    ],
+                    msg=self.unique_columns_err,
+                    input_={
+                        column: obj_data[column] for column in self.unique_columns
+                    },
+                ),
+            )
+        return conflicts
+
+    def _prepare_objs_data(
+        self,
+        *,
+        objs_data: Iterable[dict[str, any]],
+        perform_cleanup: bool,
+    ) -> list[dict[str, any]]:
+        """Приводит переданные данные множества объектов к списку словарей."""
+        if perform_cleanup:
+            return [
+                self._clean_obj_data_non_model_fields(obj_data=obj_data)
+                for obj_data in objs_data
+            ]
+        return list(objs_data)
+
+    def _split_into_chunks(
+        self,
+        *,
+        objs_data: list[dict[str, any]],
+        chunk_size: int,
+    ) -> Iterable[list[dict[str, any]]]:
+        """
+        Разбивает данные на пачки для multi-row INSERT.
+
+        Размер пачки ограничивается так, чтобы количество параметров
+        в запросе не превышало лимит PostgreSQL.
+        """
+        columns_amount: int = max(len(objs_data[0]), 1)
+        chunk_size: int = max(
+            min(chunk_size, BulkParams.POSTGRES_BIND_PARAMS_MAX // columns_amount),
+            1,
+        )
+        for i in range(0, len(objs_data), chunk_size):
+            yield objs_data[i:i + chunk_size]
+
+    async def cache_tags_purge_for_objs(
+        self,
+        *,
+        objs: Iterable[Base],
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Удаляет из кэша записи с тегами cache_tags указанных объектов.
+
+        Теги формируются по текущим значениям колонок: при изменении колонки,
+        входящей в тег (например, category_id), запись со старым тегом
+        истекает по TTL.
+
+        columns - измененные колонки: если ни одна из них не входит
+        в cache_tags_columns, то записи кэша не удаляются.
+
+        Вызывается после commit: ошибки Redis логируются и не превращают
+        уже зафиксированную запись в ответ 500.
+        """
+        if not self.cache_tags:
+            return
+        if (
+            columns is not None
+            and self.cache_tags_columns is not None
+            and set(self.cache_tags_columns).isdisjoint(columns)
+        ):
+            return
+        tags: set[str] = {
+            tag.format(**{column: getattr(obj, column) for column in self.meta.column_names})
+            for obj in objs
+            for tag in self.cache_tags
+        }
+        await cache_tags_purge_after_commit(tags=tags)
+        return
+
+    def _load_options(
+        self,
+        *,
+        load: str | None,
+    ) -> tuple:
+        """
+        Возвращает опции загрузчика для указанного профиля жадной загрузки.
+
+        Вызывает ValueError, если профиль не объявлен в load_profiles.
+        """
+        if load is None:
+            return ()
+        try:
+            return self.load_profiles[load]
+        except KeyError:
+            raise ValueError(
+                f'{self.__class__.__name__} не содержит профиль загрузки "{load}"',
+            )
+
+    def _check_all_ids_found(
+        self,
+        *,
+        obj_ids: list[int],
+        found_ids: list[int],
+    ) -> None:
+        """Вызывает HTTPException со статусом 404, если найдены не все объекты."""
+        found_ids: set[int] = set(found_ids)
+        missing_ids: list[int] = [obj_id for obj_id in obj_ids if obj_id not in found_ids]
+        if missing_ids:
+            self._raise_httpexception_404_not_found(ids=missing_ids)
+        return
+
+    def _check_soft_deletable(self) -> None:
+        """Вызывает ValueError, если модель не поддерживает фиктивное удаление."""
+        if not self.meta.is_soft_deletable:
+            raise ValueError(
+                f'Модель {self.model.__name__} не содержит колонки is_deleted и datetime_deleted',
+            )
+        return
+
+    def _check_uuid_column(self) -> None:
+        """Вызывает ValueError, если модель не содержит колонки uuid."""
+        if self._query_by_uuid is None:
+            raise ValueError(
+                f'Модель {self.model.__name__} не содержит колонки uuid',
+            )
+        return
+
     def _clean_obj_data_non_model_fields(
         self,
         *,
@@ -237,16 +777,12 @@ class BaseAsyncCrud():
         Атрибуты:
             obj_data: dict[str, any] - данные для обновления объекта
         """
-        model_valid_columns: set[str] = {
-            col.name
-            for col
-            in self.model.__table__.columns
-        }
+        column_names: frozenset[str] = self.meta.column_names
         return {
             k: v
             for k, v
             in obj_data.items()
-            if k in model_valid_columns
+            if k in column_names
         }
 
     def _raise_httpexception_404_not_found(
@@ -22,6 +22,10 @@ from sqlalchemy.sql.selectable import Select
 
 from src.config.config import Pagination
 from src.database.database import Base
+from src.database.model_meta import (
+    ModelMeta,
+    model_meta_build,
+)
 from src.utils.datetime_calc import datetime_now_utc
 
 
@@ -38,8 +42,9 @@ class BaseSyncCrud():
         unique_columns_err: str = 'Объект уже существует',
     ):
         self.model = model
+        self.meta: ModelMeta = model_meta_build(model=model, unique_columns=unique_columns)
         self.unique_columns_err = unique_columns_err
-        self.unique_columns = unique_columns
+        self.unique_columns = self.meta.unique_columns
 
     def create(
         self,
@@ -114,9 +119,11 @@ class BaseSyncCrud():
         if perform_obj_unique_check:
             self._check_unique(obj_data=obj_data, session=session)
 
-        query: Select = select(self.model).where(self.model.id == obj_id)
-        if (session.execute(query)).scalars().first() is None:
-            self._raise_httpexception_404_not_found(id=obj_id)
+        if not obj_data:
+            obj: Base | None = self.retrieve_by_id(obj_id=obj_id, session=session)
+            if obj is None:
+                self._raise_httpexception_404_not_found(id=obj_id)
+            return obj
 
         stmt: Update = (
             update(self.model)
@@ -124,7 +131,9 @@ class BaseSyncCrud():
             .values(**obj_data)
             .returning(self.model)
         )
-        obj: Base = (session.execute(stmt)).scalars().first()
+        obj: Base | None = (session.execute(stmt)).scalars().first()
+        if obj is None:
+            self._raise_httpexception_404_not_found(id=obj_id)
 
         if perform_commit:
             session.commit()
@@ -162,9 +171,7 @@ class BaseSyncCrud():
             - обновляет поле is_deleted = True
             - обновляет поле datetime_deleted = "сейчас"
         """
-        query: Select = select(self.model).where(self.model.id == obj_id)
-        if (session.execute(query)).scalars().first() is None:
-            return
+        self._check_soft_deletable()
 
         stmt: Update = (
             update(self.model)
@@ -173,8 +180,10 @@ class BaseSyncCrud():
                 is_deleted=True,
                 datetime_deleted=datetime_now_utc(),
             )
+            .returning(self.model.id)
         )
-        session.execute(stmt)
+        if (session.execute(stmt)).scalar() is None:
+            return
 
         if perform_commit:
             session.commit()
@@ -192,6 +201,14 @@ class BaseSyncCrud():
         """
         ...
 
+    def _check_soft_deletable(self) -> None:
+        """Вызывает ValueError, если модель не поддерживает фиктивное удаление."""
+        if not self.meta.is_soft_deletable:
+            raise ValueError(
+                f'Модель {self.model.__name__} не содержит колонки is_deleted и datetime_deleted',
+            )
+        return
+
     def _clean_obj_data_non_model_fields(
         self,
         *,
@@ -201,16 +218,12 @@ class BaseSyncCrud():
         Удаляет из переданных данных поля, которые не являются колонками модели.
         Возвращает новый словарь obj_data без удаленных полей.
         """
-        model_valid_columns: set[str] = {
-            col.name
-            for col
-            in self.model.__table__.columns
-        }
+        column_names: frozenset[str] = self.meta.column_names
         return {
             k: v
             for k, v
             in obj_data.items()
-            if k in model_valid_columns
+            if k in column_names
         }
 
     def _raise_httpexception_404_not_found(
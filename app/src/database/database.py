@@ -4,7 +4,19 @@
 
 from typing import AsyncGenerator
 
-from redis import Redis
+from redis import (
+    ConnectionPool,
+    Redis,
+)
+from redis.asyncio import (
+    ConnectionPool as RedisAsyncConnectionPool,
+    Redis as RedisAsync,
+)
+from redis.asyncio.client import Pipeline as RedisAsyncPipeline
+from redis.client import (
+    NEVER_DECODE,
+    Pipeline,
+)
 from sqlalchemy import create_engine
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -60,6 +72,8 @@ class TableNames():
     used_pass_reset_token = 'table_used_pass_reset_token'
     # feedback
     feedback = 'table_feedback'
+    # outbox
+    outbox_task = 'table_outbox_task'
     # product
     product = 'table_product'
     product_category = 'table_product_category'
@@ -76,27 +90,189 @@ class RedisKeys:
     INFO. Лучше не превышать длину ключа в 255 символа.
     """
 
-    __PREFIX: str = 'tradings_app_cache_'
+    PREFIX: str = 'tradings_app_cache_'
 
     # Auth
-    __PREFIX_AUTH: str = __PREFIX + 'auth_'
-    AUTH_USER_BAD_LOGIN_COUNT: str = __PREFIX_AUTH + 'user_bad_login_count_' + '{user_email}'
-    USED_PASSWORD_RESET_TOKEN: str = __PREFIX_AUTH + 'used_password_reset_token_' + '{reset_token}'
+    __PREFIX_AUTH: str = PREFIX + 'auth_'
+    # INFO. Отметка использованного одноразового токена (src/utils/one_shot_token.py).
+    AUTH_ONE_SHOT_TOKEN: str = __PREFIX_AUTH + 'one_shot_token_' + '{purpose}:' + '{digest}'
+    # INFO. Отметка использованного токена восстановления пароля в устаревшем формате
+    #       (полная строка токена). Только читается, новые ключи не создаются.
+    USED_PASSWORD_RESET_TOKEN_LEGACY: str = __PREFIX_AUTH + 'used_password_reset_token_' + '{reset_token}'
+    # INFO. Множество (SET) id заблокированных пользователей.
+    AUTH_REVOKED_USERS: str = __PREFIX_AUTH + 'revoked_users'
+    AUTH_REVOKED_JTI: str = __PREFIX_AUTH + 'revoked_jti_' + '{jti}'
+    # INFO. Минимальная допустимая версия (ver) JWT токенов пользователя.
+    AUTH_USER_TOKEN_VERSION_MIN: str = __PREFIX_AUTH + 'user_token_version_min_' + '{user_id}'
+
+    # Cache
+    __PREFIX_CACHE: str = PREFIX + 'cache_'
+    # INFO. Разделитель ":" исключает пересечение ключей разных пространств имен.
+    CACHE: str = __PREFIX_CACHE + '{namespace}:' + '{key}'
+    # INFO. Канал pub/sub для инвалидации локального кэша во всех воркерах.
+    CACHE_INVALIDATION_CHANNEL: str = __PREFIX_CACHE + 'invalidation'
+    # INFO. Записи и блокировки декоратора @cache_data (src/utils/cache_decorator.py).
+    CACHE_ENDPOINT: str = __PREFIX_CACHE + 'endpoint_' + '{key}'
+    CACHE_ENDPOINT_LOCK: str = __PREFIX_CACHE + 'endpoint_lock_' + '{key}'
+    # INFO. Множество (SET) ключей записей кэша с указанным тегом.
+    CACHE_TAG: str = __PREFIX_CACHE + 'tag_' + '{tag}'
+
+    # Rate limit
+    __PREFIX_RATE_LIMIT: str = PREFIX + 'rate_limit_'
+    RATE_LIMIT: str = __PREFIX_RATE_LIMIT + '{policy}_' + '{identity}'
+
+    # User
+    __PREFIX_USER: str = PREFIX + 'user_'
+    USER_CACHE: str = __PREFIX_USER + 'cache_' + '{user_id}'
 
 
     @classmethod
     def all_keys(cls) -> tuple[str]:
-        # TODO. Нужно взять из Redis все текущие ключи по факту.
+        """
+        Возвращает шаблоны всех ключей.
+
+        Каждый шаблон должен быть объявлен семейством ключей
+        в src/database/redis_key_registry.py (проверяется при импорте реестра).
+        """
         return (
-            # cls.AUTH_USER_BAD_LOGIN_COUNT,
-            # cls.USED_PASSWORD_RESET_TOKEN,
-            cls.SERVICE_PRICE_LIST_DICT,
+            cls.AUTH_ONE_SHOT_TOKEN,
+            cls.AUTH_REVOKED_JTI,
+            cls.AUTH_REVOKED_USERS,
+            cls.AUTH_USER_TOKEN_VERSION_MIN,
+            cls.CACHE,
+            cls.CACHE_ENDPOINT,
+            cls.CACHE_ENDPOINT_LOCK,
+            cls.CACHE_INVALIDATION_CHANNEL,
+            cls.CACHE_TAG,
+            cls.RATE_LIMIT,
+            cls.USED_PASSWORD_RESET_TOKEN_LEGACY,
+            cls.USER_CACHE,
         )
 
 
-redis_engine: Redis = Redis(
+class RedisBinaryMixin:
+    """
+    Примесь клиента Redis без декодирования ответов.
+
+    Клиент использует общий пул соединений (decode_responses=True), но читает
+    ответы в байтах (опция NEVER_DECODE): бинарные значения декодируются
+    кодеком redis_codec (src/utils/redis_codec.py), а не пулом соединений.
+
+    Пакеты команд поддерживаются только без транзакции: ответ EXEC
+    декодируется пулом соединений независимо от опций команд.
+    """
+
+    def execute_command(self, *args, **options) -> any:
+        options[NEVER_DECODE] = True
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: any = None) -> any:
+        if transaction:
+            raise ValueError(f'{self.__class__.__name__} не поддерживает транзакции (MULTI/EXEC)')
+        return self.pipeline_class(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+class RedisBinaryPipeline(RedisBinaryMixin, Pipeline):
+    """Пакет команд синхронного клиента Redis без декодирования ответов."""
+
+
+class RedisBinary(RedisBinaryMixin, Redis):
+    """Синхронный клиент Redis без декодирования ответов."""
+
+    pipeline_class: type[Pipeline] = RedisBinaryPipeline
+
+
+class RedisAsyncBinaryPipeline(RedisBinaryMixin, RedisAsyncPipeline):
+    """Пакет команд асинхронного клиента Redis без декодирования ответов."""
+
+
+class RedisAsyncBinary(RedisBinaryMixin, RedisAsync):
+    """Асинхронный клиент Redis без декодирования ответов."""
+
+    pipeline_class: type[RedisAsyncPipeline] = RedisAsyncBinaryPipeline
+
+
+class RedisAsyncEngines:
+    """
+    Держатель асинхронных клиентов Redis.
+
+    Соединения асинхронного пула привязаны к event loop, поэтому пул
+    создается в lifespan (main.py) вызовом open() и закрывается вызовом close().
+    Оба клиента используют один пул соединений:
+        - engine: ответы декодируются в строки
+        - binary: ответы возвращаются в байтах (значения redis_codec)
+
+    Вне FastAPI (CLI, бенчмарки) пул открывается и закрывается вручную:
+
+        ```
+        await redis_async.open()
+        try:
+            ...
+        finally:
+            await redis_async.close()
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.__pool: RedisAsyncConnectionPool | None = None
+        self.__engine: RedisAsync | None = None
+        self.__binary: RedisAsyncBinary | None = None
+
+    @property
+    def engine(self) -> RedisAsync:
+        """Клиент с декодированием ответов в строки."""
+        self.__check_opened()
+        return self.__engine
+
+    @property
+    def binary(self) -> RedisAsyncBinary:
+        """Клиент без декодирования ответов (для значений redis_codec)."""
+        self.__check_opened()
+        return self.__binary
+
+    async def open(self) -> None:
+        """
+        Создает пул соединений и проверяет подключение к Redis.
+
+        Без Redis приложение неработоспособно: ошибка подключения
+        прерывает запуск воркера, а не откладывается до первого запроса.
+        """
+        self.__pool = RedisAsyncConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB_CACHE,
+            decode_responses=True,
+        )
+        self.__engine = RedisAsync(connection_pool=self.__pool)
+        self.__binary = RedisAsyncBinary(connection_pool=self.__pool)
+        await self.__engine.ping()
+        return
+
+    async def close(self) -> None:
+        """Закрывает все соединения пула."""
+        if self.__pool is None:
+            return
+        # INFO. Без close_connection_pool=True aclose() не отключает явно переданный пул.
+        await self.__engine.aclose(close_connection_pool=True)
+        self.__pool = self.__engine = self.__binary = None
+        return
+
+    def __check_opened(self) -> None:
+        """Вызывает RuntimeError, если пул соединений не создан."""
+        if self.__pool is None:
+            raise RuntimeError('Пул соединений Redis не создан: вызовите redis_async.open()')
+        return
+
+
+# INFO. Синхронные клиенты используются только в Celery (вне event loop).
+redis_pool: ConnectionPool = ConnectionPool(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
     db=settings.REDIS_DB_CACHE,
     decode_responses=True,
 )
+redis_engine: Redis = Redis(connection_pool=redis_pool)
+redis_binary_engine: RedisBinary = RedisBinary(connection_pool=redis_pool)
+
+# INFO. Асинхронные клиенты используются в FastAPI (смотри RedisAsyncEngines).
+redis_async: RedisAsyncEngines = RedisAsyncEngines()
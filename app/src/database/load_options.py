@@ -0,0 +1,103 @@
+"""
+Модуль формирования опций загрузчика SQLAlchemy по схемам ответа Pydantic.
+
+Схема ответа определяет, какие колонки модели и связанных моделей загружаются
+из БД (load_only), и какие связи загружаются жадно (joinedload / selectinload).
+Остальные колонки (например, хэш пароля продавца или описание его компании)
+не выбираются, а ORM объекты не заполняются лишними данными:
+
+    ```
+    load_profiles = {
+        'represent': load_options_from_schema(model=Product, schema=ProductRepresentSchema),
+    }
+    ```
+
+Первичные и внешние ключи загружаются всегда: они нужны для связей
+и для тегов кэша (смотри cache_tags в BaseAsyncCrud).
+"""
+
+from inspect import isclass
+from typing import get_args
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapper,
+    joinedload,
+    load_only,
+    selectinload,
+)
+from sqlalchemy.orm.strategy_options import Load
+
+from src.database.database import Base
+
+
+def load_options_from_schema(model: type[Base], schema: type[BaseModel]) -> tuple[Load, ...]:
+    """
+    Возвращает опции загрузчика, загружающие только поля схемы ответа.
+
+    Поле схемы сопоставляется с атрибутом модели по validation_alias (если указан)
+    или по имени поля. Поля с вложенной схемой загружаются связью: joinedload
+    для связей с одним объектом и selectinload для коллекций.
+    """
+    return tuple(__load_options(model=model, schema=schema, path=()))
+
+
+def __load_options(
+    model: type[Base],
+    schema: type[BaseModel],
+    path: tuple[InstrumentedAttribute, ...],
+) -> list[Load]:
+    """Рекурсивно формирует опции загрузчика для модели по пути связей path."""
+    mapper: Mapper = inspect(model)
+    attributes: list[InstrumentedAttribute] = [
+        getattr(model, column_attr.key)
+        for column_attr in mapper.column_attrs
+        if any(column.primary_key or column.foreign_keys for column in column_attr.columns)
+    ]
+    relationships: list[tuple[InstrumentedAttribute, type[BaseModel]]] = []
+
+    for field_name, field in schema.model_fields.items():
+        key: str = field.validation_alias if isinstance(field.validation_alias, str) else field_name
+        if key in mapper.relationships:
+            schema_nested: type[BaseModel] | None = __schema_nested(annotation=field.annotation)
+            if schema_nested is not None:
+                relationships.append((getattr(model, key), schema_nested))
+        elif key in mapper.column_attrs:
+            attribute: InstrumentedAttribute = getattr(model, key)
+            if attribute not in attributes:
+                attributes.append(attribute)
+
+    options: list[Load] = [
+        load_only(*attributes) if not path else __loader(path=path).load_only(*attributes),
+    ]
+    for attribute, schema_nested in relationships:
+        options.extend(
+            __load_options(
+                model=attribute.property.mapper.class_,
+                schema=schema_nested,
+                path=(*path, attribute),
+            ),
+        )
+    return options
+
+
+def __loader(path: tuple[InstrumentedAttribute, ...]) -> Load:
+    """Формирует цепочку жадной загрузки связей по пути path."""
+    loader: Load | None = None
+    for attribute in path:
+        strategy: any = selectinload if attribute.property.uselist else joinedload
+        loader = strategy(attribute) if loader is None else getattr(loader, strategy.__name__)(attribute)
+    return loader
+
+
+def __schema_nested(annotation: any) -> type[BaseModel] | None:
+    """Возвращает вложенную схему из аннотации поля (SomeSchema, SomeSchema | None, list[SomeSchema])."""
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation
+    for argument in get_args(annotation):
+        schema: type[BaseModel] | None = __schema_nested(annotation=argument)
+        if schema is not None:
+            return schema
+    return None
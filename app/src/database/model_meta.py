@@ -0,0 +1,49 @@
+"""
+Модуль метаданных моделей базы данных для CRUD классов.
+
+Метаданные вычисляются один раз при создании CRUD класса,
+чтобы не обращаться к self.model.__table__ при каждом запросе.
+"""
+
+from dataclasses import dataclass
+
+from src.database.database import Base
+
+
+@dataclass(frozen=True, slots=True)
+class ModelMeta:
+    """Класс представления неизменяемых метаданных модели."""
+
+    column_names: frozenset[str]
+    primary_key: tuple[str, ...]
+    unique_columns: tuple[str, ...] | None
+    is_soft_deletable: bool
+
+
+def model_meta_build(
+    model: Base,
+    unique_columns: tuple[str] | None = None,
+) -> ModelMeta:
+    """
+    Формирует метаданные модели.
+
+    Вызывает ValueError, если unique_columns содержит несуществующие колонки.
+    """
+    column_names: frozenset[str] = frozenset(col.name for col in model.__table__.columns)
+
+    if unique_columns is not None:
+        unique_columns: tuple[str, ...] = tuple(unique_columns)
+        unknown_columns: list[str] = [
+            column for column in unique_columns if column not in column_names
+        ]
+        if not unique_columns or unknown_columns:
+            raise ValueError(
+                f'Модель {model.__name__} не содержит колонки unique_columns: {unknown_columns}',
+            )
+
+    return ModelMeta(
+        column_names=column_names,
+        primary_key=tuple(col.name for col in model.__table__.primary_key.columns),
+        unique_columns=unique_columns,
+        is_soft_deletable={'is_deleted', 'datetime_deleted'} <= column_names,
+    )
@@ -0,0 +1,275 @@
+"""
+Модуль реестра семейств ключей Redis.
+
+Каждый шаблон ключа RedisKeys объявляется семейством ключей с политикой TTL
+и модулем-владельцем. Реестр проверяется при импорте: шаблон RedisKeys
+без семейства вызывает ValueError.
+
+Обслуживание ключей выполняется только итеративным SCAN (никогда KEYS),
+чтобы не блокировать Redis на больших базах:
+    - redis_key_families_stats: количество ключей и оценка памяти по семействам
+      (MEMORY USAGE на выборке ключей)
+    - redis_key_family_purge: массовое удаление ключей семейства (UNLINK)
+
+Шаблоны разных семейств могут пересекаться (например, ключи тегов кэша
+подходят и под шаблон двухуровневого кэша), поэтому ключ относится
+к семейству с наиболее специфичным шаблоном (redis_key_family_of).
+
+Управление из командной строки: src/database/redis_keys_cli.py.
+"""
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import re
+from typing import AsyncGenerator
+
+from src.database.database import (
+    RedisKeys,
+    redis_async,
+)
+from src.utils.redis_data import redis_pipeline_async
+
+SCAN_COUNT_DEFAULT: int = 1000
+PURGE_BATCH_SIZE: int = 500
+
+
+@dataclass(frozen=True, slots=True)
+class RedisKeyFamily:
+    """
+    Класс представления семейства ключей Redis.
+
+    Атрибуты:
+        name: str - название семейства
+        template: str - шаблон ключа RedisKeys
+        owner: str - модуль, который создает и использует ключи
+        ttl_policy: str - описание политики TTL
+        is_volatile: bool - должны ли все ключи семейства иметь TTL
+    """
+
+    name: str
+    template: str
+    owner: str
+    ttl_policy: str
+    is_volatile: bool = True
+
+    @property
+    def pattern(self) -> str:
+        """Шаблон SCAN MATCH: параметры шаблона ключа заменяются на "*"."""
+        return re.sub(r'\{[^}]*\}', '*', self.template)
+
+    @property
+    def specificity(self) -> int:
+        """Количество постоянных символов шаблона (чем больше, тем специфичнее)."""
+        return len(self.pattern.replace('*', ''))
+
+
+@dataclass(slots=True)
+class RedisKeyFamilyStats:
+    """
+    Класс представления статистики семейства ключей Redis.
+
+    Атрибуты:
+        count: int - количество ключей
+        sampled: int - количество ключей в выборке MEMORY USAGE
+        sampled_bytes: int - объем памяти ключей выборки
+        sampled_no_ttl: int - количество ключей выборки без TTL
+    """
+
+    count: int = 0
+    sampled: int = 0
+    sampled_bytes: int = 0
+    sampled_no_ttl: int = 0
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Оценка объема памяти всех ключей семейства."""
+        if not self.sampled:
+            return 0
+        return self.sampled_bytes * self.count // self.sampled
+
+
+REDIS_KEY_FAMILIES: tuple[RedisKeyFamily, ...] = (
+    # Auth
+    RedisKeyFamily(
+        name='auth_revoked_users',
+        template=RedisKeys.AUTH_REVOKED_USERS,
+        owner='src/utils/revocation.py',
+        ttl_policy='без TTL: множество id заблокированных/удаленных пользователей',
+        is_volatile=False,
+    ),
+    RedisKeyFamily(
+        name='auth_revoked_jti',
+        template=RedisKeys.AUTH_REVOKED_JTI,
+        owner='src/utils/revocation.py',
+        ttl_policy='до истечения срока жизни JWT токена',
+    ),
+    RedisKeyFamily(
+        name='auth_user_token_version_min',
+        template=RedisKeys.AUTH_USER_TOKEN_VERSION_MIN,
+        owner='src/utils/revocation.py',
+        ttl_policy='JWT_REFRESH_EXPIRATION_SEC',
+    ),
+    RedisKeyFamily(
+        name='auth_one_shot_token',
+        template=RedisKeys.AUTH_ONE_SHOT_TOKEN,
+        owner='src/utils/one_shot_token.py',
+        ttl_policy='срок жизни одноразового токена (для восстановления пароля - TimeIntervals.SECONDS_IN_1_DAY)',
+    ),
+    RedisKeyFamily(
+        name='auth_used_password_reset_token_legacy',
+        template=RedisKeys.USED_PASSWORD_RESET_TOKEN_LEGACY,
+        owner='src/utils/one_shot_token.py',
+        ttl_policy='TimeIntervals.SECONDS_IN_1_DAY (только чтение, ключи истекают сами)',
+    ),
+    # Cache
+    RedisKeyFamily(
+        name='cache_tiered',
+        template=RedisKeys.CACHE,
+        owner='src/utils/cache.py',
+        ttl_policy='TieredCache.ex_sec',
+    ),
+    RedisKeyFamily(
+        name='cache_invalidation_channel',
+        template=RedisKeys.CACHE_INVALIDATION_CHANNEL,
+        owner='src/utils/cache.py',
+        ttl_policy='канал pub/sub: ключ не создается',
+        is_volatile=False,
+    ),
+    RedisKeyFamily(
+        name='cache_endpoint',
+        template=RedisKeys.CACHE_ENDPOINT,
+        owner='src/utils/cache_decorator.py',
+        ttl_policy='expire + stale декоратора @cache_data',
+    ),
+    RedisKeyFamily(
+        name='cache_endpoint_lock',
+        template=RedisKeys.CACHE_ENDPOINT_LOCK,
+        owner='src/utils/cache_decorator.py',
+        ttl_policy='lock_timeout_sec декоратора @cache_data',
+    ),
+    RedisKeyFamily(
+        name='cache_tag',
+        template=RedisKeys.CACHE_TAG,
+        owner='src/utils/cache.py',
+        ttl_policy='максимальный TTL записей с тегом',
+    ),
+    # Rate limit
+    RedisKeyFamily(
+        name='rate_limit',
+        template=RedisKeys.RATE_LIMIT,
+        owner='src/utils/rate_limiter.py',
+        ttl_policy='окно политики лимита (window_sec / ban_sec / время пополнения корзины)',
+    ),
+    # User
+    RedisKeyFamily(
+        name='user_cache',
+        template=RedisKeys.USER_CACHE,
+        owner='src/utils/user_cache.py',
+        ttl_policy='USER_CACHE_EXPIRATION_SEC',
+    ),
+)
+
+REDIS_KEY_FAMILIES_BY_NAME: dict[str, RedisKeyFamily] = {
+    family.name: family for family in REDIS_KEY_FAMILIES
+}
+# INFO. Семейства в порядке убывания специфичности шаблона для redis_key_family_of.
+__families_by_specificity: tuple[RedisKeyFamily, ...] = tuple(
+    sorted(REDIS_KEY_FAMILIES, key=lambda family: family.specificity, reverse=True),
+)
+
+__templates_unregistered: set[str] = set(RedisKeys.all_keys()) - {
+    family.template for family in REDIS_KEY_FAMILIES
+}
+if __templates_unregistered:
+    raise ValueError(
+        f'Шаблоны RedisKeys не объявлены в REDIS_KEY_FAMILIES: {sorted(__templates_unregistered)}',
+    )
+
+
+def redis_key_family_of(key: str) -> RedisKeyFamily | None:
+    """Возвращает семейство ключа (None, если ключ не относится ни к одному семейству)."""
+    for family in __families_by_specificity:
+        if fnmatchcase(key, family.pattern):
+            return family
+    return None
+
+
+async def redis_keys_scan(
+    pattern: str = RedisKeys.PREFIX + '*',
+    count: int = SCAN_COUNT_DEFAULT,
+) -> AsyncGenerator[str, None]:
+    """Итерирует ключи Redis по шаблону командой SCAN."""
+    async for key in redis_async.engine.scan_iter(match=pattern, count=count):
+        yield key
+
+
+async def redis_key_families_stats(
+    sample_size: int = 100,
+    count: int = SCAN_COUNT_DEFAULT,
+) -> dict[str, RedisKeyFamilyStats]:
+    """
+    Возвращает статистику ключей приложения по семействам.
+
+    Ключи, не относящиеся ни к одному семейству, учитываются как "unknown".
+    Память оценивается по первым sample_size ключам каждого семейства.
+    """
+    stats: dict[str, RedisKeyFamilyStats] = {
+        family.name: RedisKeyFamilyStats() for family in REDIS_KEY_FAMILIES
+    }
+    stats['unknown'] = RedisKeyFamilyStats()
+    samples: dict[str, list[str]] = {name: [] for name in stats}
+
+    async for key in redis_keys_scan(count=count):
+        family: RedisKeyFamily | None = redis_key_family_of(key=key)
+        name: str = family.name if family is not None else 'unknown'
+        stats[name].count += 1
+        if len(samples[name]) < sample_size:
+            samples[name].append(key)
+
+    for name, keys in samples.items():
+        if not keys:
+            continue
+        async with redis_pipeline_async() as batch:
+            for key in keys:
+                batch.pipeline.memory_usage(key)
+                batch.pipeline.ttl(key)
+        # INFO. Ключ мог истечь между SCAN и MEMORY USAGE: такие ключи пропускаются.
+        for memory_usage, ttl in zip(batch.results[::2], batch.results[1::2]):
+            if memory_usage is None:
+                continue
+            stats[name].sampled += 1
+            stats[name].sampled_bytes += memory_usage
+            if ttl == -1:
+                stats[name].sampled_no_ttl += 1
+
+    return stats
+
+
+async def redis_key_family_purge(
+    name: str,
+    batch_size: int = PURGE_BATCH_SIZE,
+) -> int:
+    """
+    Удаляет все ключи семейства командой UNLINK пачками по batch_size ключей.
+
+    Возвращает количество удаленных ключей.
+    Вызывает ValueError, если семейство не объявлено в REDIS_KEY_FAMILIES.
+    """
+    family: RedisKeyFamily | None = REDIS_KEY_FAMILIES_BY_NAME.get(name)
+    if family is None:
+        raise ValueError(f'Неизвестное семейство ключей Redis: {name}')
+
+    deleted: int = 0
+    keys: list[str] = []
+    async for key in redis_keys_scan(pattern=family.pattern):
+        # INFO. Ключи более специфичных семейств с пересекающимся шаблоном не удаляются.
+        if redis_key_family_of(key=key) is not family:
+            continue
+        keys.append(key)
+        if len(keys) >= batch_size:
+            deleted += await redis_async.engine.unlink(*keys)
+            keys = []
+    if keys:
+        deleted += await redis_async.engine.unlink(*keys)
+
+    return deleted
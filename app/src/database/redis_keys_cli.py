@@ -0,0 +1,117 @@
+"""
+Модуль командной строки обслуживания ключей Redis (смотри redis_key_registry.py).
+
+Запуск из директории app:
+
+    ```
+    # Семейства ключей, их владельцы и политики TTL.
+    python -m src.database.redis_keys_cli families
+
+    # Количество ключей и оценка памяти по семействам (по убыванию памяти).
+    python -m src.database.redis_keys_cli stats --sample-size 200
+
+    # Удаление всех ключей семейства.
+    python -m src.database.redis_keys_cli purge user_cache --yes
+
+    # Заполнение множества отозванных пользователей из БД.
+    python -m src.database.redis_keys_cli backfill-revoked-users
+    ```
+"""
+
+import argparse
+import asyncio
+
+from src.database.database import (
+    async_session_maker,
+    redis_async,
+)
+from src.database.redis_key_registry import (
+    REDIS_KEY_FAMILIES,
+    REDIS_KEY_FAMILIES_BY_NAME,
+    RedisKeyFamily,
+    RedisKeyFamilyStats,
+    redis_key_families_stats,
+    redis_key_family_purge,
+)
+
+
+def command_families() -> None:
+    """Выводит семейства ключей."""
+    for family in REDIS_KEY_FAMILIES:
+        print(f'{family.name}\n    pattern: {family.pattern}\n    owner: {family.owner}\n    ttl: {family.ttl_policy}')
+    return
+
+
+async def command_stats(sample_size: int) -> None:
+    """Выводит статистику ключей по семействам."""
+    stats: dict[str, RedisKeyFamilyStats] = await redis_key_families_stats(sample_size=sample_size)
+    print(f'{"family":<34}{"keys":>10}{"memory, KiB":>14}{"sampled":>10}{"no ttl":>10}')
+    for name, family_stats in sorted(
+        stats.items(),
+        key=lambda item: item[1].estimated_bytes,
+        reverse=True,
+    ):
+        family: RedisKeyFamily | None = REDIS_KEY_FAMILIES_BY_NAME.get(name)
+        # INFO. Ключи без TTL в семействе с обязательным TTL являются утечкой.
+        warning: str = ' !' if family is not None and family.is_volatile and family_stats.sampled_no_ttl else ''
+        print(
+            f'{name:<34}{family_stats.count:>10}{family_stats.estimated_bytes / 1024:>14.1f}'
+            f'{family_stats.sampled:>10}{family_stats.sampled_no_ttl:>10}{warning}',
+        )
+    return
+
+
+async def command_purge(name: str) -> None:
+    """Удаляет все ключи семейства."""
+    deleted: int = await redis_key_family_purge(name=name)
+    print(f'{name}: удалено ключей {deleted}')
+    return
+
+
+async def command_backfill_revoked_users() -> None:
+    """Заполняет множество отозванных пользователей из БД."""
+    # INFO. Импорт внутри функции: остальным командам не нужны модели БД.
+    from src.utils.revocation import revocation_users_backfill
+
+    async with async_session_maker() as session:
+        count: int = await revocation_users_backfill(session=session)
+    print(f'auth_revoked_users: добавлено пользователей {count}')
+    return
+
+
+async def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='python -m src.database.redis_keys_cli',
+        description='Обслуживание ключей Redis приложения.',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('families', help='семейства ключей')
+    parser_stats: argparse.ArgumentParser = subparsers.add_parser('stats', help='статистика по семействам')
+    parser_stats.add_argument('--sample-size', type=int, default=100, help='ключей в выборке MEMORY USAGE')
+    parser_purge: argparse.ArgumentParser = subparsers.add_parser('purge', help='удаление ключей семейства')
+    parser_purge.add_argument('family', choices=sorted(REDIS_KEY_FAMILIES_BY_NAME))
+    parser_purge.add_argument('--yes', action='store_true', help='подтверждение удаления')
+    subparsers.add_parser('backfill-revoked-users', help='заполнение множества отозванных пользователей из БД')
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.command == 'families':
+        command_families()
+        return
+
+    await redis_async.open()
+    try:
+        if args.command == 'stats':
+            await command_stats(sample_size=args.sample_size)
+        elif args.command == 'purge':
+            if not args.yes:
+                parser.error('удаление ключей требует подтверждения --yes')
+            await command_purge(name=args.family)
+        elif args.command == 'backfill-revoked-users':
+            await command_backfill_revoked_users()
+    finally:
+        await redis_async.close()
+    return
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,194 @@
+"""
+Модуль с тестами базового класса асинхронных CRUD запросов.
+"""
+
+from typing import Callable
+from uuid import uuid4
+
+from fastapi import HTTPException
+import pytest
+from sqlalchemy import (
+    func,
+    select,
+)
+
+from src.api.v1.crud.product import product_v1_crud
+from src.database.database import AsyncSession
+from src.models.product import Product
+from src.models.product_category import ProductCategory
+from src.models.user import User
+
+
+async def _product_data_factory(session: AsyncSession) -> dict[str, any]:
+    """Создает категорию и продавца, возвращает данные товара без названия."""
+    category: ProductCategory = ProductCategory(title='Категория')
+    salesman: User = User(email='salesman@example.com', name_first='Имя', name_last='Фамилия')
+    session.add_all((category, salesman))
+    await session.flush()
+    return {
+        'description': 'Описание',
+        'in_stock': 1,
+        'price': 100,
+        'category_id': category.id,
+        'salesman_id': salesman.id,
+    }
+
+
+async def _products_count(session: AsyncSession) -> int:
+    return (await session.execute(select(func.count()).select_from(Product))).scalar_one()
+
+
+async def test_create_many(test_async_session: AsyncSession) -> None:
+    """Все объекты создаются пачками и возвращаются."""
+    product_data: dict[str, any] = await _product_data_factory(session=test_async_session)
+
+    objs: list[Product] = await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': f'Товар {number}'} for number in range(5)],
+        session=test_async_session,
+        chunk_size=2,
+        perform_commit=False,
+    )
+
+    assert sorted(obj.title for obj in objs) == [f'Товар {number}' for number in range(5)]
+    assert await _products_count(session=test_async_session) == 5
+
+
+async def test_create_many_conflict_skip(test_async_session: AsyncSession) -> None:
+    """При raise_on_conflict=False конфликтующие объекты пропускаются."""
+    product_data: dict[str, any] = await _product_data_factory(session=test_async_session)
+    await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': 'Товар 1'}],
+        session=test_async_session,
+        perform_commit=False,
+    )
+
+    objs: list[Product] = await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': 'Товар 1'}, {**product_data, 'title': 'Товар 2'}],
+        session=test_async_session,
+        perform_commit=False,
+        raise_on_conflict=False,
+    )
+
+    assert [obj.title for obj in objs] == ['Товар 2']
+    assert await _products_count(session=test_async_session) == 2
+
+
+async def test_create_many_conflict_raise(test_async_session: AsyncSession) -> None:
+    """При конфликте вызывается ошибка 422, и ни один объект не создается."""
+    product_data: dict[str, any] = await _product_data_factory(session=test_async_session)
+    await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': 'Товар 1'}],
+        session=test_async_session,
+        perform_commit=False,
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await product_v1_crud.create_many(
+            objs_data=[{**product_data, 'title': 'Товар 2'}, {**product_data, 'title': 'Товар 1'}],
+            session=test_async_session,
+            chunk_size=1,
+            perform_commit=False,
+        )
+
+    assert exc_info.value.status_code == 422
+    assert [error['loc'] for error in exc_info.value.detail] == [['body', 1, 'title', 'salesman_id']]
+    # INFO. Товар 2 из первой пачки откатывается вместе с точкой сохранения.
+    assert await _products_count(session=test_async_session) == 1
+
+
+async def test_upsert_many(test_async_session: AsyncSession) -> None:
+    """Существующие объекты обновляются, новые создаются."""
+    product_data: dict[str, any] = await _product_data_factory(session=test_async_session)
+    await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': 'Товар 1'}],
+        session=test_async_session,
+        perform_commit=False,
+    )
+
+    objs: list[Product] = await product_v1_crud.upsert_many(
+        objs_data=[
+            {**product_data, 'title': 'Товар 1', 'price': 200},
+            {**product_data, 'title': 'Товар 2', 'price': 300},
+        ],
+        session=test_async_session,
+        perform_commit=False,
+    )
+
+    assert sorted((obj.title, obj.price) for obj in objs) == [('Товар 1', 200), ('Товар 2', 300)]
+    assert await _products_count(session=test_async_session) == 2
+
+
+async def test_retrieve_by_uuid_without_uuid_column(test_async_session: AsyncSession) -> None:
+    """Для модели без колонки uuid вызывается понятная ошибка, а не ошибка выполнения запроса."""
+    with pytest.raises(ValueError):
+        await product_v1_crud.retrieve_by_uuid(obj_uuid=uuid4(), session=test_async_session)
+
+
+async def test_update_by_id(test_async_session: AsyncSession, assert_queries_count: Callable) -> None:
+    """Объект обновляется одним запросом UPDATE ... RETURNING, отсутствующий id вызывает 404."""
+    product_data: dict[str, any] = await _product_data_factory(session=test_async_session)
+    objs: list[Product] = await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': 'Товар 1'}],
+        session=test_async_session,
+        perform_commit=False,
+    )
+
+    with assert_queries_count(1) as statements:
+        obj: Product = await product_v1_crud.update_by_id(
+            obj_id=objs[0].id,
+            obj_data={'price': 200, 'not_a_column': 1},
+            session=test_async_session,
+            perform_commit=False,
+        )
+    assert statements[0].startswith('UPDATE')
+    assert obj.price == 200
+
+    with pytest.raises(HTTPException) as exc_info:
+        await product_v1_crud.update_by_id(
+            obj_id=objs[0].id + 1000,
+            obj_data={'price': 300},
+            session=test_async_session,
+            perform_commit=False,
+        )
+    assert exc_info.value.status_code == 404
+
+
+async def test_update_many_by_ids(test_async_session: AsyncSession, assert_queries_count: Callable) -> None:
+    """Объекты обновляются одним запросом, отсутствующие id перечисляются в ошибке 404."""
+    product_data: dict[str, any] = await _product_data_factory(session=test_async_session)
+    objs: list[Product] = await product_v1_crud.create_many(
+        objs_data=[{**product_data, 'title': f'Товар {number}'} for number in range(3)],
+        session=test_async_session,
+        perform_commit=False,
+    )
+    obj_ids: list[int] = [obj.id for obj in objs]
+
+    with assert_queries_count(1) as statements:
+        objs = await product_v1_crud.update_many_by_ids(
+            obj_ids=obj_ids,
+            obj_data={'price': 200},
+            session=test_async_session,
+            perform_commit=False,
+        )
+    assert statements[0].startswith('UPDATE')
+    assert sorted(obj.id for obj in objs) == sorted(obj_ids)
+    assert {obj.price for obj in objs} == {200}
+
+    missing_id: int = max(obj_ids) + 1000
+    with pytest.raises(HTTPException) as exc_info:
+        await product_v1_crud.update_many_by_ids(
+            obj_ids=[obj_ids[0], missing_id],
+            obj_data={'price': 300},
+            session=test_async_session,
+            perform_commit=False,
+        )
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == f'Объекты с id {missing_id} не найдены'
+
+
+async def test_delete_soft_not_soft_deletable(test_async_session: AsyncSession) -> None:
+    """Для модели без колонок is_deleted и datetime_deleted вызывается ValueError до запроса к БД."""
+    with pytest.raises(ValueError):
+        await product_v1_crud.delete_soft_by_id(obj_id=1, session=test_async_session)
+    with pytest.raises(ValueError):
+        await product_v1_crud.delete_soft_many_by_ids(obj_ids=[1, 2], session=test_async_session)
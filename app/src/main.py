@@ -4,6 +4,7 @@
 Осуществляет запуск проекта, подключение базы данных, регистрацию эндпоинтов.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 import os
 import sys
@@ -11,10 +12,6 @@ import sys
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend as RedisCacheBackend
-from redis import (
-    asyncio as aioredis,
-    Redis as RedisClass,
-)
 from starlette.middleware.cors import CORSMiddleware
 from sqladmin import Admin
 import uvicorn
@@ -25,11 +22,17 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.api.base_routers import router_api
 from src.config.config import settings
-from src.database.database import async_engine
+from src.database.database import (
+    async_engine,
+    redis_async,
+)
 from src.models.sqlalchemy_admin import (
     authentication_backend,
     admin_views,
 )
+from src.utils.cache import cache_invalidation_listen
+from src.utils.outbox import outbox_relay_run
+from src.utils.password import password_hash_pool
 
 
 @asynccontextmanager
@@ -40,23 +43,31 @@ async def lifespan(app: FastAPI):
         - yield: запуск приложения
         - после yield: процессы после завершения работы приложения
     """
-    try:
-        redis_fastapi: RedisClass = aioredis.from_url(
-            url=f'redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB_CACHE_FASTAPI}',
-            encoding="utf8",
-            decode_responses=True,
-        )
-        FastAPICache.init(
-            backend=RedisCacheBackend(redis=redis_fastapi),
-            prefix='redis-fastapi-cache',
-        )
+    # INFO. Пул соединений Redis создается в event loop воркера.
+    await redis_async.open()
+
+    # INFO. fastapi_cache использует общий пул соединений приложения,
+    #       ключи отделены префиксом.
+    FastAPICache.init(
+        backend=RedisCacheBackend(redis=redis_async.engine),
+        prefix='redis-fastapi-cache',
+    )
 
+    # INFO. Слушатель сам переподключается к Redis при потере соединения.
+    cache_invalidation_task: asyncio.Task = asyncio.create_task(cache_invalidation_listen())
+    # INFO. Ретранслятор отправляет в брокер задачи Celery из таблицы outbox.
+    outbox_relay_task: asyncio.Task = asyncio.create_task(outbox_relay_run())
+    try:
         yield
 
-    except Exception:
-        pass
+    finally:
+        # INFO. Задачи дожидаются отмены до закрытия соединений, которые они используют.
+        for task in (cache_invalidation_task, outbox_relay_task):
+            task.cancel()
+        await asyncio.gather(cache_invalidation_task, outbox_relay_task, return_exceptions=True)
 
-    await redis_fastapi.close()
+        await redis_async.close()
+        password_hash_pool.shutdown()
     return
 
 
@@ -111,7 +122,10 @@ if __name__ == '__main__':
         reload=True if settings.DEBUG else False,
         # TODO. Разобраться с временем жизни воркеров.
         workers=settings.WORKERS_AMOUNT,
-        # INFO. Нужно, чтобы подгружались стили в SQLAdmin
+        # INFO. Адрес клиента и схема берутся из заголовков X-Forwarded-*
+        #       только от доверенных прокси (gateway): IP клиента нужен для
+        #       ограничения частоты запросов, схема - для стилей SQLAdmin
         #       https://aminalaee.dev/sqladmin/cookbook/deployment_with_https/
-        forwarded_allow_ips='*',
+        proxy_headers=True,
+        forwarded_allow_ips=settings.FORWARDED_ALLOW_IPS,
     )
@@ -2,6 +2,7 @@ from src.models.address import Address
 from src.models.feedback import (
     Feedback, FeedbackAdmin,
 )
+from src.models.outbox import OutboxTask
 from src.models.product import (
     Product, ProductAdmin,
 )
@@ -20,6 +21,8 @@ __all__ = (
     #   - feedback
     'Feedback',
     'FeedbackAdmin',
+    #   - outbox
+    'OutboxTask',
     #   - product
     'Product',
     'ProductAdmin',
@@ -0,0 +1,75 @@
+"""
+Модуль с ORM моделями базы данных очереди исходящих задач (transactional outbox).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    SmallInteger,
+    String,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+from sqlalchemy.sql import (
+    expression,
+    func,
+)
+
+from src.database.database import (
+    Base,
+    TableNames,
+)
+
+OUTBOX_TASK_NAME_LEN_MAX: int = 255
+
+
+class OutboxTask(Base):
+    """
+    Декларативная модель представления задачи Celery, ожидающей отправки в брокер.
+
+    Строка сохраняется в той же транзакции, что и изменение данных,
+    и отправляется в брокер фоновым ретранслятором (смотри src/utils/outbox.py).
+    """
+
+    __tablename__ = TableNames.outbox_task
+    __table_args__ = {
+        'comment': 'Задачи Celery, ожидающие отправки в брокер',
+    }
+
+    # Primary Keys
+    id: Mapped[int] = mapped_column(
+        comment='ID',
+        primary_key=True,
+    )
+
+    # Columns
+    args: Mapped[list] = mapped_column(
+        JSONB,
+        comment='позиционные аргументы задачи',
+    )
+    attempts: Mapped[int] = mapped_column(
+        SmallInteger,
+        comment='количество неудачных попыток отправки',
+        server_default=expression.literal(0),
+    )
+    datetime_created: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        comment='дата и время создания',
+        server_default=func.now(),
+    )
+    kwargs: Mapped[dict] = mapped_column(
+        JSONB,
+        comment='именованные аргументы задачи',
+    )
+    priority: Mapped[int | None] = mapped_column(
+        SmallInteger,
+        comment='приоритет задачи (None - приоритет задачи по умолчанию)',
+    )
+    task_name: Mapped[str] = mapped_column(
+        String(length=OUTBOX_TASK_NAME_LEN_MAX),
+        comment='имя задачи Celery',
+    )
@@ -10,6 +10,7 @@ from sqladmin import ModelView
 from sqlalchemy import (
     ForeignKey,
     String,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -21,6 +22,7 @@ from src.database.database import (
     Base,
     TableNames,
 )
+from src.utils.cache import CacheTagsAdminMixin
 from src.validators.product import ProductParams
 
 if TYPE_CHECKING:
@@ -32,9 +34,17 @@ class Product(Base):
     """Декларативная модель представления товаров."""
 
     __tablename__ = TableNames.product
-    __tableargs__ = {
-        'comment': 'Товары',
-    }
+    __table_args__ = (
+        # INFO. Необходим для INSERT ... ON CONFLICT в массовых операциях CRUD.
+        UniqueConstraint(
+            'title',
+            'salesman_id',
+            name=f'{TableNames.product}_title_salesman_id_key',
+        ),
+        {
+            'comment': 'Товары',
+        },
+    )
 
     # Primary Keys
     id: Mapped[int] = mapped_column(
@@ -87,7 +97,16 @@ class Product(Base):
     )
 
 
-class ProductAdmin(ModelView, model=Product):
+# INFO. Теги кэша товара (смотри cache_tags_purge в src/utils/cache.py).
+PRODUCT_CACHE_TAGS: tuple[str, ...] = (
+    'products',
+    'product:{id}',
+    'salesman:{salesman_id}:products',
+    'category:{category_id}',
+)
+
+
+class ProductAdmin(CacheTagsAdminMixin, ModelView, model=Product):
 
     # Metadata.
     name = 'Товар'
@@ -150,5 +169,6 @@ class ProductAdmin(ModelView, model=Product):
     )
 
     # Other.
+    cache_tags = PRODUCT_CACHE_TAGS
     pk_columns = (Product.id,)
     is_async = True
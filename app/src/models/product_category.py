@@ -18,6 +18,7 @@ from src.database.database import (
     Base,
     TableNames,
 )
+from src.utils.cache import CacheTagsAdminMixin
 from src.validators.product_category import ProductCategoryParams
 
 
@@ -66,7 +67,7 @@ class ProductCategory(Base):
     )
 
 
-class ProductCategoryAdmin(ModelView, model=ProductCategory):
+class ProductCategoryAdmin(CacheTagsAdminMixin, ModelView, model=ProductCategory):
 
     # Metadata.
     name = 'Категория товаров'
@@ -119,5 +120,6 @@ class ProductCategoryAdmin(ModelView, model=ProductCategory):
     )
 
     # Other.
+    cache_tags = ('category:{id}',)
     pk_columns = (ProductCategory.id,)
     is_async = True
@@ -41,7 +41,7 @@ class AdminAuth(AuthenticationBackend):
         if username != settings.ADMIN_USERNAME or password != settings.ADMIN_PASSWORD:
             return False
 
-        access_token, _, _, _ = await jwt_generate_pair(
+        access_token, _, _, _ = jwt_generate_pair(
             user_id=1,
             is_admin=True,
         )
@@ -34,6 +34,7 @@ from src.database.database import (
     Base,
     TableNames,
 )
+from src.utils.cache import CacheTagsAdminMixin
 from src.validators.user import (
     CompanyParams,
     UserBankCardParams,
@@ -252,7 +253,7 @@ class UserSalesman(Base):
     )
 
 
-class UserAdmin(ModelView, model=User):
+class UserAdmin(CacheTagsAdminMixin, ModelView, model=User):
 
     # Metadata.
     name = 'Пользователь'
@@ -325,11 +326,34 @@ class UserAdmin(ModelView, model=User):
     )
 
     # Other.
+    # INFO. Данные продавца входят в кэшированные страницы товаров.
+    cache_tags = ('salesman:{id}:products',)
     pk_columns = (User.id,)
     is_async = True
 
+    async def after_model_change(self, data: dict, model: User, is_created: bool, request: any) -> None:
+        """Синхронизирует отзыв доступа и кэш пользователя после изменения в админ-панели."""
+        # INFO. Импорт внутри метода исключает циклический импорт модулей utils.
+        from src.utils.revocation import revocation_user_sync
+        from src.utils.user_cache import user_cache_delete
 
-class UserSalesmanAdmin(ModelView, model=UserSalesman):
+        await super().after_model_change(data=data, model=model, is_created=is_created, request=request)
+        await user_cache_delete(user_id=model.id)
+        await revocation_user_sync(user=model)
+        return
+
+    async def after_model_delete(self, model: User, request: any) -> None:
+        """Отзывает доступ и сбрасывает кэш пользователя после удаления в админ-панели."""
+        from src.utils.revocation import revocation_user_add
+        from src.utils.user_cache import user_cache_delete
+
+        await super().after_model_delete(model=model, request=request)
+        await user_cache_delete(user_id=model.id)
+        await revocation_user_add(user_id=model.id)
+        return
+
+
+class UserSalesmanAdmin(CacheTagsAdminMixin, ModelView, model=UserSalesman):
 
     # Metadata.
     name = 'Продавец'
@@ -387,5 +411,7 @@ class UserSalesmanAdmin(ModelView, model=UserSalesman):
     )
 
     # Other.
+    # INFO. Данные компании продавца входят в кэшированные страницы товаров.
+    cache_tags = ('user_salesman:{id}',)
     pk_columns = (UserSalesman.id,)
     is_async = True
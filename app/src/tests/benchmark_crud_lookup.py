@@ -0,0 +1,80 @@
+"""
+Бенчмарк частых выборок CRUD (retrieve_by_id / retrieve_by_email,
+смотри BaseAsyncCrud._query_by_id).
+
+Измеряет время выборки через публичные методы CRUD в сравнении с запросом,
+который строится при каждом вызове (тот же путь session.execute, включая
+обращение к БД):
+    - rebuild: select(...).where(column == value) строится при каждом вызове
+      (как до появления заранее построенных запросов)
+    - crud: user_v1_crud.retrieve_by_id / retrieve_by_email, запрос с bindparam
+      построен один раз при создании CRUD, значения передаются параметрами
+
+Выборки выполняются по первому пользователю в БД (БД не изменяется).
+
+Запуск из директории app (необходимы переменные окружения приложения
+и доступная БД с хотя бы одним пользователем):
+
+    ```
+    python -m src.tests.benchmark_crud_lookup
+    ```
+"""
+
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import select
+
+from src.api.v1.crud.user import user_v1_crud
+from src.database.database import (
+    async_engine,
+    async_session_maker,
+)
+from src.models.user import User
+
+ROUNDS: int = 2_000
+
+
+def report(name: str, elapsed_sec: float) -> None:
+    """Выводит время на выборку."""
+    print(f'{name:<28}{elapsed_sec / ROUNDS * 1_000_000:>12.1f}')
+    return
+
+
+async def main() -> None:
+    async with async_session_maker() as session:
+        user: User | None = (await session.execute(select(User).limit(1))).scalars().first()
+        if user is None:
+            print('В БД нет пользователей: создайте пользователя для бенчмарка.')
+            return
+        user_id, user_email = user.id, user.email
+
+        print(f'ROUNDS={ROUNDS}, dialect={async_engine.dialect.name}+{async_engine.dialect.driver}')
+        print(f'{"mode":<28}{"мкс/выборка":>12}')
+
+        start: float = perf_counter()
+        for _ in range(ROUNDS):
+            (await session.execute(select(User).where(User.id == user_id))).scalars().first()
+        report(name='retrieve_by_id rebuild', elapsed_sec=perf_counter() - start)
+
+        start = perf_counter()
+        for _ in range(ROUNDS):
+            await user_v1_crud.retrieve_by_id(obj_id=user_id, session=session)
+        report(name='retrieve_by_id crud', elapsed_sec=perf_counter() - start)
+
+        start = perf_counter()
+        for _ in range(ROUNDS):
+            (await session.execute(select(User).where(User.email == user_email))).scalars().first()
+        report(name='retrieve_by_email rebuild', elapsed_sec=perf_counter() - start)
+
+        start = perf_counter()
+        for _ in range(ROUNDS):
+            await user_v1_crud.retrieve_by_email(obj_email=user_email, session=session)
+        report(name='retrieve_by_email crud', elapsed_sec=perf_counter() - start)
+
+    await async_engine.dispose()
+    return
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+Бенчмарк очистки данных обновления в CRUD (BaseAsyncCrud._clean_obj_data_non_model_fields).
+
+Сравнивает процессорное время на один вызов при обновлении пользователя
+(user_v1_crud.update_by_id):
+    - rebuild: множество имен колонок строится из __table__.columns при каждом вызове
+      (как до появления ModelMeta)
+    - meta: имена колонок берутся из ModelMeta, построенной один раз при создании CRUD
+
+Запуск из директории app (необходимы переменные окружения приложения):
+
+    ```
+    python -m src.tests.benchmark_crud_metadata
+    ```
+"""
+
+from time import perf_counter
+
+from src.api.v1.crud.user import user_v1_crud
+from src.models.user import User
+
+ROUNDS: int = 100_000
+
+
+def build_user_update() -> dict[str, any]:
+    """Формирует данные обновления пользователя (с полем, не являющимся колонкой)."""
+    return {
+        'name_first': 'Иван',
+        'name_last': 'Иванов',
+        'phone': '+79990000000',
+        'email': 'user@domain.com',
+        'password': 'not_a_column',
+    }
+
+
+def clean_rebuild(obj_data: dict[str, any]) -> dict[str, any]:
+    """Очищает данные, строя множество имен колонок заново (прежняя реализация)."""
+    model_valid_columns: set[str] = {
+        col.name
+        for col
+        in User.__table__.columns
+    }
+    return {
+        k: v
+        for k, v
+        in obj_data.items()
+        if k in model_valid_columns
+    }
+
+
+def report(name: str, elapsed_sec: float) -> None:
+    """Выводит время на вызов."""
+    print(f'{name:<12}{elapsed_sec / ROUNDS * 1_000_000:>12.2f}')
+    return
+
+
+def main() -> None:
+    obj_data: dict[str, any] = build_user_update()
+    assert clean_rebuild(obj_data=obj_data) == user_v1_crud._clean_obj_data_non_model_fields(obj_data=obj_data)
+
+    print(f'ROUNDS={ROUNDS}, columns={len(User.__table__.columns)}')
+    print(f'{"mode":<12}{"мкс/вызов":>12}')
+
+    start: float = perf_counter()
+    for _ in range(ROUNDS):
+        clean_rebuild(obj_data=obj_data)
+    elapsed_rebuild: float = perf_counter() - start
+    report(name='rebuild', elapsed_sec=elapsed_rebuild)
+
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        user_v1_crud._clean_obj_data_non_model_fields(obj_data=obj_data)
+    elapsed_meta: float = perf_counter() - start
+    report(name='meta', elapsed_sec=elapsed_meta)
+
+    print(f'экономия: {(elapsed_rebuild - elapsed_meta) / ROUNDS * 1_000_000:.2f} мкс/вызов')
+    return
+
+
+if __name__ == '__main__':
+    main()
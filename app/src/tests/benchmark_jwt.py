@@ -0,0 +1,135 @@
+"""
+Бенчмарк выпуска и проверки JWT токенов (src/utils/jwt.py).
+
+Моделирует одну секунду нагрузки RPS запросов с повторяющимися токенами
+ACTIVE_USERS активных пользователей и сравнивает процессорное время
+на один воркер.
+
+Выпуск пары токенов:
+    - jose issue: jwt.encode с заранее созданным ключом из jwt_keyring
+    - issue: jwt_generate_pair (готовые заголовки и шаблоны payload)
+
+Проверка токенов:
+    - jose: jwt.decode с ключом-строкой (ключ создается при каждом вызове)
+    - jose + key: jwt.decode с заранее созданным ключом из jwt_keyring
+    - verify: jwt_decode без кэша проверенных токенов
+    - cache: jwt_decode с LRU кэшем проверенных токенов
+
+Запуск из директории app (необходимы переменные окружения приложения):
+
+    ```
+    python -m src.tests.benchmark_jwt
+    ```
+"""
+
+from random import (
+    choice,
+    seed,
+)
+from time import (
+    perf_counter,
+    time,
+)
+from uuid import uuid4
+
+from jose import jwt
+from jose.backends.base import Key
+
+from src.config.config import settings
+from src.utils.jwt import (
+    JWT_ALGORITHMS,
+    jwt_decode,
+    jwt_generate_pair,
+    jwt_keyring,
+    jwt_verified_cache,
+)
+
+RPS: int = 5000
+ACTIVE_USERS: int = 500
+
+
+def jose_encode(user_id: int, token_type: str, expiration_sec: int) -> str:
+    """Создает токен средствами python-jose (как до появления готовых заголовков)."""
+    kid, key = jwt_keyring.signing_key()
+    return jwt.encode(
+        claims={
+            'sub': str(user_id),
+            'exp': int(time()) + expiration_sec,
+            'iss': settings.DOMAIN_NAME,
+            'jti': uuid4().hex,
+            'type': token_type,
+            'ver': int(time() * 1000),
+        },
+        key=key,
+        algorithm=settings.JWT_ALGORITHM,
+        headers={'kid': kid},
+    )
+
+
+def report(name: str, elapsed_sec: float) -> None:
+    """Выводит время на запрос и долю одной секунды процессора воркера."""
+    print(f'{name:<12}{elapsed_sec / RPS * 1_000_000:>12.1f}{elapsed_sec * 1000:>16.1f}{elapsed_sec * 100:>10.1f}')
+    return
+
+
+def main() -> None:
+    seed(0)
+    print(f'RPS={RPS}, ACTIVE_USERS={ACTIVE_USERS}, JWT_ALGORITHM={settings.JWT_ALGORITHM}')
+    print(f'{"mode":<12}{"мкс/запрос":>12}{"мс CPU за 1 с":>16}{"% CPU":>10}')
+
+    start: float = perf_counter()
+    for request_number in range(RPS):
+        jose_encode(
+            user_id=request_number,
+            token_type=settings.JWT_TYPE_ACCESS,
+            expiration_sec=settings.JWT_ACCESS_EXPIRATION_SEC,
+        )
+        jose_encode(
+            user_id=request_number,
+            token_type=settings.JWT_TYPE_REFRESH,
+            expiration_sec=settings.JWT_REFRESH_EXPIRATION_SEC,
+        )
+    report(name='jose issue', elapsed_sec=perf_counter() - start)
+
+    start = perf_counter()
+    for request_number in range(RPS):
+        jwt_generate_pair(user_id=request_number)
+    report(name='issue', elapsed_sec=perf_counter() - start)
+
+    tokens: list[str] = [
+        jwt_generate_pair(user_id=user_id, is_to_refresh=True)[0]
+        for user_id in range(ACTIVE_USERS)
+    ]
+    requests: list[str] = [choice(tokens) for _ in range(RPS)]
+
+    key: Key = jwt_keyring.verification_key(kid=None)
+    # INFO. Исходные данные ключа: секрет для HS*, публичный ключ JWK для RS* / ES*.
+    key_data: str | dict[str, any] = key.to_dict() if jwt_keyring.is_asymmetric else settings.SECRET_KEY
+
+    start: float = perf_counter()
+    for token in requests:
+        jwt.decode(token=token, key=key_data, algorithms=JWT_ALGORITHMS)
+    report(name='jose', elapsed_sec=perf_counter() - start)
+
+    start = perf_counter()
+    for token in requests:
+        jwt.decode(token=token, key=key, algorithms=JWT_ALGORITHMS)
+    report(name='jose + key', elapsed_sec=perf_counter() - start)
+
+    start = perf_counter()
+    for token in requests:
+        jwt_verified_cache.clear()
+        jwt_decode(jwt_token=token)
+    report(name='verify', elapsed_sec=perf_counter() - start)
+
+    jwt_verified_cache.clear()
+    start = perf_counter()
+    for token in requests:
+        jwt_decode(jwt_token=token)
+    report(name='cache', elapsed_sec=perf_counter() - start)
+    print(f'cache metrics: {jwt_verified_cache.metrics()}')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Бенчмарк задержки запросов во время "шторма" входов (src/utils/password.py).
+
+В одном event loop одновременно выполняются LOGIN_STORM входов (хэширование
+пароля) и независимые запросы, поступающие раз в REQUEST_INTERVAL_SEC
+(например, каталог товаров без хэширования). Для независимых запросов
+измеряется задержка от поступления до начала обработки (p50 / p99 / max):
+    - inline: hash_password вызывается в обработчике и блокирует event loop
+      (как до появления пула хэширования)
+    - pool: hash_password_async выполняет хэширование в PasswordHashPool
+
+Входы сверх емкости пула (PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_MAX)
+отклоняются с кодом 503 и учитываются в метриках пула.
+
+Запуск из директории app (необходимы переменные окружения приложения):
+
+    ```
+    python -m src.tests.benchmark_password_hash_pool
+    ```
+"""
+
+import asyncio
+from time import perf_counter
+
+from fastapi import HTTPException
+
+from src.config.config import settings
+from src.utils.password import (
+    hash_password,
+    hash_password_async,
+    password_hash_pool,
+)
+
+LOGIN_STORM: int = 200
+REQUEST_INTERVAL_SEC: float = 0.005
+
+
+async def login_inline() -> None:
+    """Вход с хэшированием пароля в event loop."""
+    hash_password(raw_password='password')
+    return
+
+
+async def login_pool() -> None:
+    """Вход с хэшированием пароля в пуле потоков (503 при переполнении)."""
+    try:
+        await hash_password_async(raw_password='password')
+    except HTTPException:
+        pass
+    return
+
+
+async def storm(login: any) -> list[float]:
+    """
+    Выполняет шторм входов и возвращает задержки независимых запросов (мс).
+
+    Независимые запросы поступают по расписанию: задержка отсчитывается
+    от времени поступления по расписанию, а не от фактического пробуждения.
+    """
+    logins: asyncio.Future = asyncio.gather(*(login() for _ in range(LOGIN_STORM)))
+    latencies_ms: list[float] = []
+    arrival: float = perf_counter()
+    while not logins.done():
+        arrival += REQUEST_INTERVAL_SEC
+        await asyncio.sleep(max(arrival - perf_counter(), 0))
+        latencies_ms.append((perf_counter() - arrival) * 1000)
+    await logins
+    return latencies_ms
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Возвращает перцентиль q (0..1) значений."""
+    values_sorted: list[float] = sorted(values)
+    return values_sorted[min(int(len(values_sorted) * q), len(values_sorted) - 1)]
+
+
+def report(name: str, latencies_ms: list[float], elapsed_sec: float) -> None:
+    """
+    Выводит перцентили задержки независимых запросов.
+
+    При блокировке event loop запросов обрабатывается меньше, чем поступило:
+    все они ждут окончания шторма.
+    """
+    print(
+        f'{name:<8}{len(latencies_ms):>10}{percentile(latencies_ms, 0.5):>10.1f}'
+        f'{percentile(latencies_ms, 0.99):>10.1f}{max(latencies_ms):>10.1f}{elapsed_sec:>12.2f}',
+    )
+    return
+
+
+async def main() -> None:
+    print(
+        f'LOGIN_STORM={LOGIN_STORM}, PASSWORD_HASHER={settings.PASSWORD_HASHER}, '
+        f'PASSWORD_HASH_WORKERS={settings.PASSWORD_HASH_WORKERS}, '
+        f'PASSWORD_HASH_QUEUE_MAX={settings.PASSWORD_HASH_QUEUE_MAX}',
+    )
+    print(f'{"mode":<8}{"запросов":>10}{"p50, мс":>10}{"p99, мс":>10}{"max, мс":>10}{"шторм, с":>12}')
+
+    for name, login in (('inline', login_inline), ('pool', login_pool)):
+        start: float = perf_counter()
+        latencies_ms: list[float] = await storm(login=login)
+        report(name=name, latencies_ms=latencies_ms, elapsed_sec=perf_counter() - start)
+    print(f'pool metrics: {password_hash_pool.metrics()}')
+
+    password_hash_pool.shutdown()
+    return
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
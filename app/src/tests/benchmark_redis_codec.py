@@ -0,0 +1,118 @@
+"""
+Бенчмарк кодека данных Redis (src/utils/redis_codec.py).
+
+Сравнивает время кодирования / декодирования и размер сохраняемого значения
+(объем памяти Redis под значение) для типичных кэшируемых данных:
+    - снимок пользователя (USER_CACHE)
+    - страница товаров (product_retrieve_all) на 10 и 100 объектов
+
+Запуск из директории app:
+
+    ```
+    python -m src.tests.benchmark_redis_codec
+    ```
+"""
+
+from datetime import (
+    datetime,
+    timedelta,
+)
+import json
+from time import perf_counter
+
+from src.utils.redis_codec import RedisCodec
+
+ROUNDS: int = 2000
+
+
+def build_user() -> dict[str, any]:
+    """Формирует снимок пользователя."""
+    return {
+        'id': 1,
+        'email': 'user@domain.com',
+        'password_hashed': 'pbkdf2$sha256:1001$' + 'a' * 32 + '$' + 'b' * 64,
+        'name_first': 'Иван',
+        'name_last': 'Иванов',
+        'date_birth': '1990-01-01',
+        'is_active': True,
+        'is_admin': False,
+        'is_verified': True,
+        'datetime_created': datetime(2024, 1, 1).isoformat(),
+    }
+
+
+def build_product_page(size: int) -> list[dict[str, any]]:
+    """Формирует страницу товаров с категорией и продавцом (load='full')."""
+    datetime_created: datetime = datetime(2024, 1, 1)
+    return [
+        {
+            'id': index,
+            'title': f'Товар {index}',
+            'description': 'Описание товара средней длины. ' * 4,
+            'price': 100 + index,
+            'in_stock': index % 10,
+            'is_deleted': False,
+            'datetime_created': (datetime_created + timedelta(minutes=index)).isoformat(),
+            'category': {
+                'id': index % 5,
+                'title': f'Категория {index % 5}',
+            },
+            'salesman': {
+                'id': index % 7,
+                'name': f'Продавец {index % 7}',
+                'email': f'salesman_{index % 7}@domain.com',
+            },
+        }
+        for index in range(size)
+    ]
+
+
+def measure(codec: RedisCodec, value: any) -> tuple[float, float, int]:
+    """Возвращает среднее время кодирования, декодирования (мкс) и размер значения (байт)."""
+    start: float = perf_counter()
+    for _ in range(ROUNDS):
+        data: bytes = codec.encode(value=value)
+    encode_us: float = (perf_counter() - start) / ROUNDS * 1_000_000
+
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        codec.decode(data=data)
+    decode_us: float = (perf_counter() - start) / ROUNDS * 1_000_000
+
+    return encode_us, decode_us, len(data)
+
+
+def main() -> None:
+    payloads: dict[str, any] = {
+        'user': build_user(),
+        'product_page_10': build_product_page(size=10),
+        'product_page_100': build_product_page(size=100),
+    }
+    codecs: dict[str, RedisCodec] = {
+        'json': RedisCodec(serializer='json', compress_min_bytes=0),
+        'json+zlib': RedisCodec(serializer='json', compress_min_bytes=1024),
+        'msgpack': RedisCodec(serializer='msgpack', compress_min_bytes=0),
+        'msgpack+zlib': RedisCodec(serializer='msgpack', compress_min_bytes=1024),
+    }
+
+    print(f'{"payload":<18}{"codec":<14}{"encode, мкс":>12}{"decode, мкс":>12}{"size, байт":>12}')
+    for payload_name, payload in payloads.items():
+        # INFO. Точка отсчета: прежнее сохранение через json.dumps / json.loads.
+        start: float = perf_counter()
+        for _ in range(ROUNDS):
+            data: str = json.dumps(payload)
+        encode_us: float = (perf_counter() - start) / ROUNDS * 1_000_000
+        start = perf_counter()
+        for _ in range(ROUNDS):
+            json.loads(data)
+        decode_us: float = (perf_counter() - start) / ROUNDS * 1_000_000
+        print(f'{payload_name:<18}{"stdlib json":<14}{encode_us:>12.1f}{decode_us:>12.1f}{len(data.encode()):>12}')
+
+        for codec_name, codec in codecs.items():
+            encode_us, decode_us, size = measure(codec=codec, value=payload)
+            print(f'{payload_name:<18}{codec_name:<14}{encode_us:>12.1f}{decode_us:>12.1f}{size:>12}')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Бенчмарк задержки event loop при обращениях к Redis во время одновременных входов.
+
+CONCURRENT_LOGINS входов одновременно выполняют по REDIS_CALLS_PER_LOGIN
+обращений к Redis (ограничение частоты, проверка отзыва, кэш пользователя).
+Параллельно измеряется задержка event loop: насколько позже запланированного
+просыпается задача, ожидающая LAG_PROBE_INTERVAL_SEC (p50 / p99 / max):
+    - sync: синхронный клиент redis_engine (как до появления redis_async),
+      каждое обращение блокирует event loop на время обмена с Redis
+    - async: клиент redis_async.engine на общем пуле соединений
+
+Запуск из директории app (необходимы переменные окружения приложения
+и доступный Redis):
+
+    ```
+    python -m src.tests.benchmark_redis_event_loop
+    ```
+"""
+
+import asyncio
+from time import perf_counter
+
+from src.database.database import (
+    redis_async,
+    redis_engine,
+)
+
+CONCURRENT_LOGINS: int = 500
+REDIS_CALLS_PER_LOGIN: int = 4
+LAG_PROBE_INTERVAL_SEC: float = 0.001
+KEY: str = 'benchmark_redis_event_loop'
+
+
+async def login_sync(user_id: int) -> None:
+    """Вход с обращениями к Redis синхронным клиентом."""
+    for _ in range(REDIS_CALLS_PER_LOGIN):
+        redis_engine.get(f'{KEY}:{user_id}')
+        # INFO. Переключение на другие задачи, как между await в обработчике.
+        await asyncio.sleep(0)
+    return
+
+
+async def login_async(user_id: int) -> None:
+    """Вход с обращениями к Redis асинхронным клиентом."""
+    for _ in range(REDIS_CALLS_PER_LOGIN):
+        await redis_async.engine.get(f'{KEY}:{user_id}')
+    return
+
+
+async def lag_probe(stop: asyncio.Event) -> list[float]:
+    """Возвращает задержки пробуждения event loop (мс) до установки stop."""
+    lags_ms: list[float] = []
+    while not stop.is_set():
+        start: float = perf_counter()
+        await asyncio.sleep(LAG_PROBE_INTERVAL_SEC)
+        lags_ms.append((perf_counter() - start - LAG_PROBE_INTERVAL_SEC) * 1000)
+    return lags_ms
+
+
+async def logins_run(login: any) -> tuple[list[float], float]:
+    """Выполняет одновременные входы и возвращает задержки event loop и время входов."""
+    stop: asyncio.Event = asyncio.Event()
+    probe: asyncio.Task = asyncio.create_task(lag_probe(stop=stop))
+    # INFO. Проба успевает запланировать первое ожидание до начала входов.
+    await asyncio.sleep(0)
+    start: float = perf_counter()
+    await asyncio.gather(*(login(user_id=user_id) for user_id in range(CONCURRENT_LOGINS)))
+    elapsed_sec: float = perf_counter() - start
+    stop.set()
+    return await probe, elapsed_sec
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Возвращает перцентиль q (0..1) значений."""
+    values_sorted: list[float] = sorted(values)
+    return values_sorted[min(int(len(values_sorted) * q), len(values_sorted) - 1)]
+
+
+def report(name: str, lags_ms: list[float], elapsed_sec: float) -> None:
+    """Выводит перцентили задержки event loop."""
+    print(
+        f'{name:<8}{len(lags_ms):>8}{percentile(lags_ms, 0.5):>10.2f}'
+        f'{percentile(lags_ms, 0.99):>10.2f}{max(lags_ms):>10.2f}{elapsed_sec:>12.3f}',
+    )
+    return
+
+
+async def main() -> None:
+    print(f'CONCURRENT_LOGINS={CONCURRENT_LOGINS}, REDIS_CALLS_PER_LOGIN={REDIS_CALLS_PER_LOGIN}')
+    print(f'{"mode":<8}{"проб":>8}{"p50, мс":>10}{"p99, мс":>10}{"max, мс":>10}{"входы, с":>12}')
+
+    # INFO. Соединения создаются заранее, чтобы не учитывать их установку.
+    redis_engine.ping()
+    await redis_async.open()
+
+    for name, login in (('sync', login_sync), ('async', login_async)):
+        lags_ms, elapsed_sec = await logins_run(login=login)
+        report(name=name, lags_ms=lags_ms, elapsed_sec=elapsed_sec)
+
+    redis_engine.close()
+    await redis_async.close()
+    return
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
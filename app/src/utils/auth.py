@@ -2,6 +2,16 @@
 Модуль с вспомогательными функциями приложения "auth".
 
 Включает в себя функции аутентификации и получения данных пользователей.
+
+Зависимости аутентификации разделены по уровням, эндпоинт объявляет нужный:
+    - get_user_payload / get_admin_payload: только данные JWT токена
+      (без запросов в БД)
+    - get_user / get_active_user: снимок пользователя из кэша запроса или Redis,
+      при его отсутствии - строка из БД
+    - get_user_fresh: всегда актуальная строка пользователя из БД
+
+На всех уровнях доступ заблокированных и удаленных пользователей, а также
+отозванные токены проверяются по данным в Redis (см. src/utils/revocation.py).
 """
 
 from typing import (
@@ -32,6 +42,15 @@ from src.utils.logger_json import (
     Logger,
     LoggerJsonAuth,
 )
+from src.utils.outbox import outbox_task_add
+from src.utils.revocation import revocation_payload_is_revoked
+from src.utils.user_cache import (
+    UserSnapshot,
+    user_cache_get,
+    user_cache_set,
+    user_request_cache_get,
+    user_request_cache_set,
+)
 
 logger: Logger = LoggerJsonAuth
 
@@ -87,23 +106,25 @@ async def get_user_payload(
 
 
 async def get_user(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
     session: AsyncSession = Depends(get_async_session),
-) -> User:
+) -> User | UserSnapshot:
     """Возвращает объект пользователя из данных JWT токена доступа."""
-    return await __get_user(token=token, session=session)
+    return await __get_user(request=request, token=token, session=session)
 
 
 async def get_active_user(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
     session: AsyncSession = Depends(get_async_session),
-) -> User | None:
+) -> User | UserSnapshot:
     """
     Возвращает объект пользователя из данных JWT токена доступа.
 
     Если статус is_active False, то вызывает HTTPException с кодом 403.
     """
-    user: User = await __get_user(token=token, session=session)
+    user: User | UserSnapshot = await __get_user(request=request, token=token, session=session)
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -113,15 +134,32 @@ async def get_active_user(
 
 
 async def __get_user(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
     session: AsyncSession = Depends(get_async_session),
-) -> User:
-    """Возвращает объект пользователя из данных JWT токена доступа."""
+) -> User | UserSnapshot:
+    """
+    Возвращает объект пользователя из данных JWT токена доступа.
+
+    Пользователь загружается из базы данных не более одного раза за запрос:
+    сначала проверяется кэш текущего запроса, затем снимок в Redis
+    (если включен USER_CACHE_EXPIRATION_SEC, возвращается UserSnapshot).
+    """
     payload: dict[str, any] = await __get_jwt_payload(token=str(token))
-    user: User = await user_v1_crud.retrieve_by_id(
-        obj_id=int(payload.get('sub')),
-        session=session,
-    )
+    user_id: int = int(payload.get('sub'))
+
+    user: User | UserSnapshot | None = user_request_cache_get(request=request, user_id=user_id)
+    if user is not None:
+        return user
+
+    user: User | UserSnapshot | None = await user_cache_get(user_id=user_id)
+    if user is None:
+        user: User = await user_v1_crud.retrieve_by_id(
+            obj_id=user_id,
+            session=session,
+        )
+        await user_cache_set(user=user)
+    user_request_cache_set(request=request, user=user)
 
     msg: str = f'User id={user.id} successfully accessed.'
     if user.is_admin:
@@ -130,6 +168,26 @@ async def __get_user(
 
     return user
 
+async def get_user_fresh(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: AsyncSession = Depends(get_async_session),
+) -> User:
+    """
+    Возвращает актуальный объект пользователя из базы данных.
+
+    Используется в эндпоинтах, которым нужна строка пользователя
+    в текущей сессии (например, для проверки пароля).
+    """
+    payload: dict[str, any] = await __get_jwt_payload(token=str(token))
+    user: User = await user_v1_crud.retrieve_by_id(
+        obj_id=int(payload.get('sub')),
+        session=session,
+    )
+    user_request_cache_set(request=request, user=user)
+    return user
+
+
 async def __optional_oauth2_scheme(
     request: Request,
 ) -> Optional[str]:
@@ -145,9 +203,10 @@ async def __optional_oauth2_scheme(
 
 
 async def get_user_or_anonymous(
+    request: Request,
     token: Optional[str] = Depends(__optional_oauth2_scheme),
     session: AsyncSession = Depends(get_async_session),
-) -> User | None:
+) -> User | UserSnapshot | None:
     """
     Возвращает объект пользователя из данных JWT токена доступа.
 
@@ -155,13 +214,19 @@ async def get_user_or_anonymous(
     """
     if token is None:
         return None
-    return await get_user(token=token, session=session)
+    return await get_user(request=request, token=token, session=session)
 
 
 async def send_email_confirm_code(
     user: User,
+    session: AsyncSession,
 ) -> None:
-    """Ставит задачу Celery для отправки ссылки подтверждения электронной почты."""
+    """
+    Ставит задачу Celery для отправки ссылки подтверждения электронной почты.
+
+    Задача добавляется в очередь исходящих задач сессии (src/utils/outbox.py)
+    и отправляется в брокер после commit сессии вызывающим кодом.
+    """
     confirm_code: str = await dangerous_token_generate(data={'user_id': user.id})
 
     logger.info(
@@ -173,7 +238,9 @@ async def send_email_confirm_code(
         url_email_confirm: str = f'http://127.0.0.1:8000/api/v1/auth/email-confirm/{confirm_code}'
     else:
         url_email_confirm: str = f'https://{settings.DOMAIN_NAME}/api/v1/auth/email-confirm/{confirm_code}'
-    send_email_confirm_code_to_email_task.apply_async(
+    outbox_task_add(
+        session=session,
+        task=send_email_confirm_code_to_email_task,
         kwargs={
             'user_full_name': user.get_full_name,
             'url_email_confirm': url_email_confirm,
@@ -184,7 +251,7 @@ async def send_email_confirm_code(
     logger.info(
         msg=(
             f'Successfully add Celery task "send_email_confirm_code_to_email_task" '
-            f'for user id={user.id}.'
+            f'to outbox for user id={user.id}.'
         ),
     )
 
@@ -214,4 +281,13 @@ async def __get_jwt_payload(token: str) -> dict[str, any]:
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
 
+    if await revocation_payload_is_revoked(payload=payload):
+
+        logger.info(msg=f'User id={payload.get("sub")} try to access with revoked token.')
+
+        raise HTTPException(
+            detail='Указанный токен недействителен',
+            status_code=status.HTTP_401_UNAUTHORIZED,
+        )
+
     return payload
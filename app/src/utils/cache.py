@@ -0,0 +1,456 @@
+"""
+Модуль двухуровневого кэша данных.
+
+Уровни кэша:
+    - local: ограниченный LRU кэш с TTL в памяти процесса (воркера uvicorn)
+    - redis: общий для всех воркеров кэш в Redis (смотри redis_data.py)
+
+Чтение сначала проверяет локальный кэш, затем Redis (с сохранением значения
+в локальный кэш). Запись и удаление выполняются в Redis, после чего
+в канал pub/sub RedisKeys.CACHE_INVALIDATION_CHANNEL публикуется сообщение
+об инвалидации, и каждый воркер удаляет ключ из своего локального кэша.
+
+Pub/sub не гарантирует доставку (например, при переподключении),
+поэтому TTL локального кэша должен быть коротким: он ограничивает
+время, в течение которого воркер может отдавать устаревшее значение.
+
+Локальный кэш хранит значения в закодированном виде (redis_codec),
+поэтому вызывающий код получает новый объект при каждом чтении
+и не может случайно изменить закэшированное значение.
+
+Пример использования:
+
+    ```
+    cache_products: TieredCache = TieredCache(namespace='products', ex_sec=60)
+
+    data: any = await cache_products.get(key='page_1')
+    if data is None:
+        data = ...
+        await cache_products.set(key='page_1', value=data)
+    ```
+
+Слушатель инвалидации cache_invalidation_listen запускается в lifespan (main.py).
+
+Теги кэша:
+    Записи кэша (TieredCache.set и декоратор @cache_data) могут иметь теги,
+    например "product:1" или "salesman:1:products". Для каждого тега в Redis
+    хранится множество ключей записей. cache_tags_purge удаляет все записи
+    с указанными тегами во всех воркерах (BaseAsyncCrud и админ-панель
+    через CacheTagsAdminMixin вызывают ее после записи в БД).
+    Запись должна иметь теги всех данных, которые она содержит (например,
+    страница товаров - теги категорий и продавцов товаров), иначе изменение
+    этих данных будет видно только после истечения TTL записи.
+
+    Множества тегов не растут неограниченно: при добавлении ключа в большое
+    множество из него удаляются ключи уже истекших записей (по выборке).
+    Записи тега удаляются пачками (SSCAN + UNLINK), а не одной командой.
+"""
+
+import asyncio
+from collections import OrderedDict
+from logging import Logger
+from time import monotonic
+from typing import Iterable
+from uuid import uuid4
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from src.database.database import (
+    RedisKeys,
+    redis_async,
+)
+from src.utils.logger_json import LoggerJsonCache
+from src.utils.redis_data import (
+    RedisScriptAsync,
+    redis_decode,
+    redis_encode,
+    redis_pipeline_async,
+    redis_script_register_async,
+)
+
+logger: Logger = LoggerJsonCache
+
+# INFO. Сообщение инвалидации: "{process_id}:{namespace}:{key}".
+#       Собственные сообщения процесс пропускает: его локальный кэш уже обновлен.
+INVALIDATION_PROCESS_ID: str = uuid4().hex
+INVALIDATION_SEPARATOR: str = ':'
+# INFO. Ключ сообщения инвалидации всего пространства имен.
+INVALIDATION_ALL: str = '*'
+INVALIDATION_RECONNECT_SEC: int = 1
+
+# INFO. Общий префикс ключей Redis двухуровневых кэшей: "{prefix}{namespace}:{key}".
+TIERED_KEY_PREFIX: str = RedisKeys.CACHE.partition('{namespace}')[0]
+
+# INFO. Добавляет ключ записи в множества тегов. TTL множества не уменьшается,
+#       чтобы тег не истек раньше самой долгоживущей записи.
+#       Если в множестве больше ARGV[3] ключей, из случайной выборки ARGV[4] ключей
+#       удаляются ключи истекших записей.
+LUA_TAGS_ADD: str = """
+local ex = tonumber(ARGV[2])
+for _, tag in ipairs(KEYS) do
+    redis.call('SADD', tag, ARGV[1])
+    if redis.call('SCARD', tag) > tonumber(ARGV[3]) then
+        for _, key in ipairs(redis.call('SRANDMEMBER', tag, tonumber(ARGV[4]))) do
+            if redis.call('EXISTS', key) == 0 then
+                redis.call('SREM', tag, key)
+            end
+        end
+    end
+    if redis.call('TTL', tag) < ex then
+        redis.call('EXPIRE', tag, ex)
+    end
+end
+return 0
+"""
+
+# INFO. Переименовывает существующие множества тегов в ключи "{tag}:purge:{ARGV[1]}"
+#       и возвращает их. Новые записи после этого добавляются в новые множества тегов,
+#       а содержимое переименованных удаляется пачками вне Lua (не блокируя Redis).
+LUA_TAGS_DETACH: str = """
+local detached = {}
+for _, tag in ipairs(KEYS) do
+    if redis.call('EXISTS', tag) == 1 then
+        local key = tag .. ':purge:' .. ARGV[1]
+        redis.call('RENAME', tag, key)
+        table.insert(detached, key)
+    end
+end
+return detached
+"""
+
+TAG_PRUNE_MIN_SIZE: int = 64
+TAG_PRUNE_SAMPLE_SIZE: int = 16
+# INFO. Количество ключей записей, удаляемых одной командой UNLINK.
+TAG_PURGE_BATCH_SIZE: int = 500
+
+__tags_add: RedisScriptAsync = redis_script_register_async(script=LUA_TAGS_ADD)
+__tags_detach: RedisScriptAsync = redis_script_register_async(script=LUA_TAGS_DETACH)
+
+
+class LocalCache:
+    """
+    Класс ограниченного LRU кэша с TTL в памяти процесса.
+
+    При превышении max_size удаляется наиболее давно использованный ключ.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ex_sec: float,
+    ):
+        self.max_size = max_size
+        self.ex_sec = ex_sec
+        self.__data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        """Возвращает значение или None, если ключа нет или его TTL истек."""
+        item: tuple[float, bytes] | None = self.__data.get(key)
+        if item is None:
+            return None
+        expires_at, data = item
+        if expires_at <= monotonic():
+            del self.__data[key]
+            return None
+        self.__data.move_to_end(key)
+        return data
+
+    def set(self, key: str, data: bytes) -> None:
+        """Сохраняет значение."""
+        self.__data[key] = (monotonic() + self.ex_sec, data)
+        self.__data.move_to_end(key)
+        while len(self.__data) > self.max_size:
+            self.__data.popitem(last=False)
+        return
+
+    def delete(self, key: str) -> None:
+        """Удаляет значение."""
+        self.__data.pop(key, None)
+        return
+
+    def clear(self) -> None:
+        """Удаляет все значения."""
+        self.__data.clear()
+        return
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+
+class TieredCache:
+    """
+    Класс двухуровневого кэша (локальный LRU + Redis).
+
+    Атрибуты:
+        hits_local: int - количество попаданий в локальный кэш
+        misses_local: int - количество промахов локального кэша
+        hits_redis: int - количество попаданий в Redis
+        misses_redis: int - количество промахов Redis
+
+    Вызывает ValueError, если пространство имен уже зарегистрировано
+    или содержит разделитель INVALIDATION_SEPARATOR.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str,
+        ex_sec: int,
+        local_ex_sec: float = 5,
+        local_max_size: int = 1024,
+    ):
+        if namespace in CACHE_REGISTRY or INVALIDATION_SEPARATOR in namespace:
+            raise ValueError(f'Недопустимое пространство имен кэша: {namespace}')
+
+        self.namespace = namespace
+        self.ex_sec = ex_sec
+        self.local: LocalCache = LocalCache(
+            max_size=local_max_size,
+            ex_sec=min(local_ex_sec, ex_sec),
+        )
+        self.hits_local: int = 0
+        self.misses_local: int = 0
+        self.hits_redis: int = 0
+        self.misses_redis: int = 0
+        CACHE_REGISTRY[namespace] = self
+
+    async def get(self, key: str, schema: type[BaseModel] | None = None) -> any:
+        """
+        Извлекает данные из кэша (None, если данных нет).
+
+        Если указана pydantic схема schema, то возвращается экземпляр этой схемы.
+        """
+        data: bytes | None = self.local.get(key=key)
+        if data is not None:
+            self.hits_local += 1
+            return redis_decode(data=data, schema=schema)
+        self.misses_local += 1
+
+        data = await redis_async.binary.get(name=self._redis_key(key=key))
+        if data is None:
+            self.misses_redis += 1
+            return None
+        self.hits_redis += 1
+
+        self.local.set(key=key, data=data)
+        return redis_decode(data=data, schema=schema)
+
+    async def set(
+        self,
+        key: str,
+        value: any,
+        ex_sec: int | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Сохраняет данные в кэш и инвалидирует ключ в других воркерах.
+
+        Запись удаляется из кэша при вызове cache_tags_purge с любым из тегов tags.
+        """
+        data: bytes = redis_encode(value=value)
+        await redis_async.binary.set(
+            name=self._redis_key(key=key),
+            value=data,
+            ex=ex_sec or self.ex_sec,
+        )
+        await cache_tags_add(key=self._redis_key(key=key), tags=tags, ex_sec=ex_sec or self.ex_sec)
+        await self._publish_invalidation(key=key)
+        self.local.set(key=key, data=data)
+        return
+
+    async def delete(self, key: str) -> None:
+        """Удаляет данные из кэша во всех воркерах."""
+        await redis_async.binary.delete(self._redis_key(key=key))
+        self.local.delete(key=key)
+        await self._publish_invalidation(key=key)
+        return
+
+    async def clear(self) -> None:
+        """Удаляет все данные пространства имен из кэша во всех воркерах."""
+        keys: list[str] = [
+            key async for key in redis_async.engine.scan_iter(
+                match=self._redis_key(key=INVALIDATION_ALL),
+                count=500,
+            )
+        ]
+        if keys:
+            await redis_async.engine.delete(*keys)
+        self.local.clear()
+        await self._publish_invalidation(key=INVALIDATION_ALL)
+        return
+
+    def metrics(self) -> dict[str, int]:
+        """Возвращает метрики кэша по уровням."""
+        return {
+            'local_size': len(self.local),
+            'local_max_size': self.local.max_size,
+            'hits_local': self.hits_local,
+            'misses_local': self.misses_local,
+            'hits_redis': self.hits_redis,
+            'misses_redis': self.misses_redis,
+        }
+
+    def _invalidate_local(self, key: str) -> None:
+        """Удаляет ключ (или все ключи) из локального кэша."""
+        if key == INVALIDATION_ALL:
+            self.local.clear()
+        else:
+            self.local.delete(key=key)
+        return
+
+    async def _publish_invalidation(self, key: str) -> None:
+        """Публикует сообщение об инвалидации ключа для других воркеров."""
+        await redis_async.engine.publish(
+            channel=RedisKeys.CACHE_INVALIDATION_CHANNEL,
+            message=_invalidation_message(namespace=self.namespace, key=key),
+        )
+        return
+
+    def _redis_key(self, key: str) -> str:
+        return RedisKeys.CACHE.format(namespace=self.namespace, key=key)
+
+
+CACHE_REGISTRY: dict[str, TieredCache] = {}
+
+
+def cache_metrics() -> dict[str, dict[str, int]]:
+    """Возвращает метрики всех двухуровневых кэшей процесса."""
+    return {namespace: cache.metrics() for namespace, cache in CACHE_REGISTRY.items()}
+
+
+async def cache_tags_add(key: str, tags: Iterable[str], ex_sec: int) -> None:
+    """Добавляет ключ Redis записи кэша к указанным тегам."""
+    tag_keys: list[str] = [RedisKeys.CACHE_TAG.format(tag=tag) for tag in tags]
+    if not tag_keys:
+        return
+    await __tags_add(keys=tag_keys, args=[key, ex_sec, TAG_PRUNE_MIN_SIZE, TAG_PRUNE_SAMPLE_SIZE])
+    return
+
+
+async def cache_tags_purge(tags: Iterable[str]) -> None:
+    """
+    Удаляет из кэша все записи с указанными тегами.
+
+    Множества тегов атомарно отделяются (RENAME), после чего их ключи
+    читаются командой SSCAN и удаляются командой UNLINK пачками
+    по TAG_PURGE_BATCH_SIZE ключей: размер тега не влияет на время
+    блокировки Redis одной командой.
+
+    Записи двухуровневых кэшей удаляются также из локальных кэшей всех воркеров.
+    """
+    tag_keys: list[str] = sorted({RedisKeys.CACHE_TAG.format(tag=tag) for tag in tags})
+    if not tag_keys:
+        return
+    detached_keys: list[str] = await __tags_detach(keys=tag_keys, args=[uuid4().hex])
+
+    for detached_key in detached_keys:
+        purged_keys: list[str] = []
+        async for purged_key in redis_async.engine.sscan_iter(name=detached_key, count=TAG_PURGE_BATCH_SIZE):
+            purged_keys.append(purged_key)
+            if len(purged_keys) >= TAG_PURGE_BATCH_SIZE:
+                await __tags_keys_unlink(keys=purged_keys)
+                purged_keys = []
+        if purged_keys:
+            await __tags_keys_unlink(keys=purged_keys)
+        await redis_async.engine.unlink(detached_key)
+    return
+
+
+async def __tags_keys_unlink(keys: list[str]) -> None:
+    """Удаляет ключи записей кэша и публикует инвалидацию записей двухуровневых кэшей."""
+    async with redis_pipeline_async() as batch:
+        batch.pipeline.unlink(*keys)
+        for purged_key in keys:
+            if not purged_key.startswith(TIERED_KEY_PREFIX):
+                continue
+            namespace, _, key = purged_key[len(TIERED_KEY_PREFIX):].partition(INVALIDATION_SEPARATOR)
+            cache: TieredCache | None = CACHE_REGISTRY.get(namespace)
+            if cache is None:
+                continue
+            cache._invalidate_local(key=key)
+            batch.pipeline.publish(
+                channel=RedisKeys.CACHE_INVALIDATION_CHANNEL,
+                message=_invalidation_message(namespace=namespace, key=key),
+            )
+    return
+
+
+async def cache_tags_purge_after_commit(tags: Iterable[str]) -> None:
+    """
+    Удаляет из кэша записи с указанными тегами после фиксации изменений в БД.
+
+    Ошибки Redis логируются и не пробрасываются: изменения уже зафиксированы,
+    а устаревшие записи истекут по TTL.
+    """
+    try:
+        await cache_tags_purge(tags=tags)
+    except RedisError as exc:
+        logger.error(
+            msg=f'Cache tags purge failed: {exc}',
+            extra={'tags': sorted(tags)},
+        )
+    return
+
+
+class CacheTagsAdminMixin:
+    """
+    Примесь представлений админ-панели (sqladmin ModelView), удаляющая записи кэша
+    с тегами cache_tags измененного или удаленного объекта.
+
+    Шаблоны тегов форматируются колонками объекта, как в BaseAsyncCrud.cache_tags:
+
+        ```
+        class ProductAdmin(CacheTagsAdminMixin, ModelView, model=Product):
+            cache_tags = ('products', 'product:{id}')
+        ```
+    """
+
+    cache_tags: tuple[str, ...] = ()
+
+    async def after_model_change(self, data: dict, model: any, is_created: bool, request: any) -> None:
+        await self._cache_tags_purge(model=model)
+        return
+
+    async def after_model_delete(self, model: any, request: any) -> None:
+        await self._cache_tags_purge(model=model)
+        return
+
+    async def _cache_tags_purge(self, model: any) -> None:
+        """Удаляет записи кэша с тегами объекта."""
+        columns: dict[str, any] = {column.name: getattr(model, column.name) for column in model.__table__.columns}
+        await cache_tags_purge_after_commit(tags={tag.format(**columns) for tag in self.cache_tags})
+        return
+
+
+async def cache_invalidation_listen() -> None:
+    """
+    Слушает канал инвалидации и удаляет ключи из локальных кэшей процесса.
+
+    При потере соединения с Redis локальные кэши очищаются целиком
+    (сообщения за время разрыва могли быть потеряны), после чего
+    выполняется повторная подписка.
+    """
+    while True:
+        try:
+            async with redis_async.engine.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(RedisKeys.CACHE_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    parts: list[str] = message['data'].split(INVALIDATION_SEPARATOR, 2)
+                    if len(parts) != 3 or parts[0] == INVALIDATION_PROCESS_ID:
+                        continue
+                    _, namespace, key = parts
+                    cache: TieredCache | None = CACHE_REGISTRY.get(namespace)
+                    if cache is not None:
+                        cache._invalidate_local(key=key)
+        except RedisError as exc:
+            logger.warning(msg=f'Cache invalidation listener disconnected: {exc}')
+            for cache in CACHE_REGISTRY.values():
+                cache.local.clear()
+            await asyncio.sleep(INVALIDATION_RECONNECT_SEC)
+
+
+def _invalidation_message(namespace: str, key: str) -> str:
+    """Формирует сообщение инвалидации ключа."""
+    return INVALIDATION_SEPARATOR.join((INVALIDATION_PROCESS_ID, namespace, key))
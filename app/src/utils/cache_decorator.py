@@ -0,0 +1,235 @@
+"""
+Модуль декоратора кэширования эндпоинтов с защитой от "давки" (cache stampede).
+
+Декоратор @cache_data является заменой декоратора @cache(expire=...) из fastapi_cache:
+
+    ```
+    from src.utils.cache_decorator import cache_data
+    @router.get(...)
+    @cache_data(expire=10)
+    async def get(...):
+        return ...
+    ```
+
+Отличия от простого кэширования по TTL:
+    - single-flight: при отсутствии значения его вычисляет только один запрос,
+      захвативший блокировку в Redis (SET NX PX), остальные ожидают результат
+    - stale-while-revalidate: после истечения expire значение еще stale секунд
+      отдается из кэша, пока один запрос (владелец блокировки) его обновляет
+    - вероятностное раннее истечение (XFetch): чем ближе истечение и чем дольше
+      вычисление значения, тем выше вероятность обновить его заранее
+
+Эндпоинт должен возвращать JSON-совместимые данные (pydantic модели, словари,
+списки) или Response, как и при использовании fastapi_cache.
+
+Ключ кэша формируется из имени эндпоинта и аргументов простых типов
+(str, int, float, bool, None, Enum, pydantic модели, коллекции).
+Остальные аргументы (Request, Response, сессии БД, пользователи) в ключ
+не входят: для эндпоинтов, результат которых зависит от них,
+необходимо указать key_builder.
+
+Теги записи указываются шаблонами с аргументами эндпоинта
+(смотри cache_tags_purge в cache.py):
+
+    ```
+    @cache_data(expire=3600, tags=('products', 'product:{product_id}'))
+    async def product_retrieve(product_id: int, ...):
+        ...
+    ```
+"""
+
+import asyncio
+from enum import Enum
+from functools import wraps
+from hashlib import sha1
+import json
+from math import log
+from random import random
+from time import time
+from typing import Callable
+from uuid import uuid4
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from src.database.database import (
+    RedisKeys,
+    redis_async,
+)
+from src.utils.cache import cache_tags_add
+from src.utils.redis_data import (
+    RedisScriptAsync,
+    redis_get_async,
+    redis_script_register_async,
+    redis_set_async,
+)
+
+# INFO. Удаляет блокировку, только если она принадлежит текущему владельцу.
+LUA_LOCK_RELEASE: str = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+LOCK_POLL_SEC: float = 0.05
+
+ENTRY_KIND_JSON: str = 'json'
+ENTRY_KIND_RESPONSE: str = 'response'
+
+__lock_release: RedisScriptAsync = redis_script_register_async(script=LUA_LOCK_RELEASE)
+
+
+def cache_data(
+    expire: int,
+    stale: int | None = None,
+    beta: float = 1.0,
+    lock_timeout_sec: float = 10,
+    key_builder: Callable[[Callable, dict[str, any]], str] | None = None,
+    tags: tuple[str, ...] = (),
+) -> Callable:
+    """
+    Декоратор кэширования результата асинхронного эндпоинта.
+
+    Параметры:
+        expire: int - время в секундах, в течение которого значение свежее
+        stale: int | None - время в секундах после expire, в течение которого
+            отдается устаревшее значение (по умолчанию равно expire)
+        beta: float - коэффициент раннего истечения (0 - отключено, > 1 - раньше)
+        lock_timeout_sec: float - максимальное время вычисления значения
+            владельцем блокировки (и ожидания остальными запросами)
+        key_builder: Callable | None - функция (func, kwargs) -> str формирования ключа
+        tags: tuple[str, ...] - шаблоны тегов записи, форматируемые аргументами эндпоинта
+    """
+    stale_sec: int = expire if stale is None else stale
+
+    def decorator(func: Callable) -> Callable:
+
+        @wraps(func)
+        async def wrapper(*args: any, **kwargs: any) -> any:
+            cache_key: str = (key_builder or _key_build)(func, kwargs)
+            key: str = RedisKeys.CACHE_ENDPOINT.format(key=cache_key)
+            lock_key: str = RedisKeys.CACHE_ENDPOINT_LOCK.format(key=cache_key)
+
+            entry: dict[str, any] | None = await _entry_get(key=key)
+            if entry is not None and not _entry_needs_refresh(entry=entry, beta=beta):
+                return _entry_value(entry=entry)
+
+            lock_token: str | None = await _lock_acquire(lock_key=lock_key, timeout_sec=lock_timeout_sec)
+            if lock_token is None:
+                # INFO. Значение обновляет другой запрос: отдаем устаревшее значение
+                #       или ожидаем появления нового.
+                if entry is None:
+                    entry = await _entry_wait(key=key, timeout_sec=lock_timeout_sec)
+                if entry is not None:
+                    return _entry_value(entry=entry)
+                return await func(*args, **kwargs)
+
+            try:
+                started_at: float = time()
+                result: any = await func(*args, **kwargs)
+                finished_at: float = time()
+                await redis_set_async(
+                    key=key,
+                    value=_entry_build(
+                        result=result,
+                        delta=finished_at - started_at,
+                        expire_at=finished_at + expire,
+                    ),
+                    ex_sec=expire + stale_sec,
+                )
+                await cache_tags_add(
+                    key=key,
+                    tags=[tag.format(**kwargs) for tag in tags],
+                    ex_sec=expire + stale_sec,
+                )
+            finally:
+                await __lock_release(keys=[lock_key], args=[lock_token])
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _entry_build(result: any, delta: float, expire_at: float) -> dict[str, any]:
+    """Формирует запись кэша из результата эндпоинта."""
+    entry: dict[str, any] = {
+        'delta': delta,
+        'expire_at': expire_at,
+    }
+    if isinstance(result, Response):
+        entry['kind'] = ENTRY_KIND_RESPONSE
+        entry['value'] = {
+            'body': bytes(result.body).decode(),
+            'media_type': result.media_type,
+            'status_code': result.status_code,
+        }
+    else:
+        entry['kind'] = ENTRY_KIND_JSON
+        entry['value'] = jsonable_encoder(result)
+    return entry
+
+
+async def _entry_get(key: str) -> dict[str, any] | None:
+    """Извлекает запись кэша."""
+    entry: any = await redis_get_async(key=key)
+    return entry if isinstance(entry, dict) else None
+
+
+def _entry_needs_refresh(entry: dict[str, any], beta: float) -> bool:
+    """
+    Проверяет, нужно ли обновить запись кэша (XFetch):
+    истекла ли запись с учетом вероятностного раннего истечения.
+    """
+    # INFO. log(1 - random()) <= 0, поэтому момент проверки сдвигается вперед
+    #       пропорционально времени вычисления значения (delta).
+    return time() - entry['delta'] * beta * log(1 - random()) >= entry['expire_at']
+
+
+def _entry_value(entry: dict[str, any]) -> any:
+    """Возвращает результат эндпоинта из записи кэша."""
+    if entry['kind'] == ENTRY_KIND_RESPONSE:
+        return Response(
+            content=entry['value']['body'],
+            media_type=entry['value']['media_type'],
+            status_code=entry['value']['status_code'],
+        )
+    return entry['value']
+
+
+async def _entry_wait(key: str, timeout_sec: float) -> dict[str, any] | None:
+    """Ожидает появления записи кэша, вычисляемой другим запросом."""
+    deadline: float = time() + timeout_sec
+    while time() < deadline:
+        await asyncio.sleep(LOCK_POLL_SEC)
+        entry: dict[str, any] | None = await _entry_get(key=key)
+        if entry is not None:
+            return entry
+    return None
+
+
+def _key_build(func: Callable, kwargs: dict[str, any]) -> str:
+    """Формирует ключ кэша из имени эндпоинта и аргументов простых типов."""
+    params: dict[str, any] = {
+        name: value.model_dump(mode='json') if isinstance(value, BaseModel) else value
+        for name, value in kwargs.items()
+        if isinstance(value, (str, int, float, bool, Enum, BaseModel, list, tuple, dict)) or value is None
+    }
+    digest: str = sha1(
+        json.dumps(params, sort_keys=True, default=str).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'{func.__module__}.{func.__qualname__}:{digest}'
+
+
+async def _lock_acquire(lock_key: str, timeout_sec: float) -> str | None:
+    """Захватывает блокировку вычисления значения. Возвращает токен владельца или None."""
+    lock_token: str = uuid4().hex
+    is_acquired: bool | None = await redis_async.engine.set(
+        name=lock_key,
+        value=lock_token,
+        nx=True,
+        px=int(timeout_sec * 1000),
+    )
+    return lock_token if is_acquired else None
@@ -0,0 +1,121 @@
+"""
+Модуль с вспомогательными функциями курсорной (keyset) пагинации.
+
+Курсор является непрозрачной для клиента строкой, в которой закодированы
+значения ключа сортировки последнего объекта страницы: (id) или (sort_key, id).
+
+Курсор приходит от клиента и может быть подделан, поэтому при декодировании
+проверяются количество и типы значений: недействительный курсор вызывает
+ошибку 422, а не ошибку базы данных.
+"""
+
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
+from binascii import Error as BinasciiError
+from datetime import (
+    date,
+    datetime,
+)
+from decimal import (
+    Decimal,
+    InvalidOperation,
+)
+import json
+
+from fastapi import (
+    HTTPException,
+    status,
+)
+
+from src.utils.custom_exception import (
+    CustomValidationTypes,
+    form_pydantic_like_validation_error,
+)
+
+
+def cursor_encode(values: list[any]) -> str:
+    """Кодирует значения ключа сортировки в курсор."""
+    data: bytes = json.dumps(
+        values,
+        default=__json_default,
+        separators=(',', ':'),
+    ).encode()
+    return urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def cursor_decode(cursor: str, sort_type: type | None = None) -> list[any]:
+    """
+    Декодирует курсор в значения ключа сортировки: [id] или [sort_key, id].
+
+    sort_type - тип Python колонки сортировки (None - сортировка только по id,
+    object - тип колонки неизвестен). Значение sort_key приводится к этому типу.
+
+    Вызывает HTTPException со статусом 422, если курсор невалидный.
+    """
+    try:
+        data: bytes = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values: list[any] | None = __cursor_values_parse(values=json.loads(data), sort_type=sort_type)
+    except (BinasciiError, InvalidOperation, TypeError, UnicodeDecodeError, ValueError):
+        values = None
+
+    if values is None:
+        detail: dict[str, any] = form_pydantic_like_validation_error(
+            type_=CustomValidationTypes.VALUE_ERROR,
+            loc=['query', 'cursor'],
+            msg='Указан недействительный курсор',
+            input_=cursor,
+        )
+        raise HTTPException(
+            detail=detail,
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    return values
+
+
+def __cursor_values_parse(values: any, sort_type: type | None) -> list[any]:
+    """Проверяет значения курсора и приводит ключ сортировки к типу колонки."""
+    if not isinstance(values, list) or len(values) != (1 if sort_type is None else 2):
+        raise ValueError('Недопустимое количество значений курсора')
+    # INFO. bool является подклассом int, поэтому тип проверяется точно.
+    obj_id: any = values[-1]
+    if type(obj_id) is not int:
+        raise ValueError('Недопустимый id курсора')
+    if sort_type is None:
+        return [obj_id]
+    return [__cursor_value_parse(value=values[0], sort_type=sort_type), obj_id]
+
+
+def __cursor_value_parse(value: any, sort_type: type) -> any:
+    """Приводит значение ключа сортировки из курсора к типу колонки."""
+    # INFO. Keyset пагинация работает только по колонкам NOT NULL.
+    if value is None:
+        raise ValueError('Недопустимое пустое значение курсора')
+    if sort_type in (date, datetime):
+        if not isinstance(value, str):
+            raise ValueError('Недопустимая дата курсора')
+        return sort_type.fromisoformat(value)
+    if sort_type is Decimal:
+        if type(value) not in (str, int, float):
+            raise ValueError('Недопустимое число курсора')
+        return Decimal(str(value))
+    if sort_type is float:
+        if type(value) not in (int, float):
+            raise ValueError('Недопустимое число курсора')
+        return float(value)
+    if sort_type in (bool, int, str):
+        if type(value) is not sort_type:
+            raise ValueError('Недопустимый тип значения курсора')
+        return value
+    if type(value) not in (bool, float, int, str):
+        raise ValueError('Недопустимый тип значения курсора')
+    return value
+
+
+def __json_default(value: any) -> str:
+    """Преобразует не сериализуемые в JSON значения в строку."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
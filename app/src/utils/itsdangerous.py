@@ -2,6 +2,9 @@
 Модуль с вспомогательными функциями приложения "auth".
 
 Включает в себя функции работы с библиотекой ItsDangerous.
+
+Сериализатор создается один раз при импорте модуля: ключи подписи
+(производные от SECRET_KEY и SALT) не вычисляются заново при каждом вызове.
 """
 
 from itsdangerous import (
@@ -22,11 +25,15 @@ logger: Logger = LoggerJsonAuth
 
 SALT: bytes = (settings.SALT).encode(settings.PASS_ENCODE)
 
+__dangerous_serializer: URLSafeTimedSerializer = URLSafeTimedSerializer(
+    secret_key=settings.SECRET_KEY,
+    salt=SALT,
+)
+
 
 async def dangerous_token_generate(data: dict[str, any]) -> str:
     """Генерирует уникальный токен, содержащий данные из параметров функции."""
-    serializer: URLSafeTimedSerializer = await __get_dangerous_serializer()
-    return serializer.dumps(obj=data)
+    return __dangerous_serializer.dumps(obj=data)
 
 
 async def dangerous_token_verify(token, expiration: int = TimeIntervals.SECONDS_IN_1_DAY) -> any:
@@ -35,10 +42,8 @@ async def dangerous_token_verify(token, expiration: int = TimeIntervals.SECONDS_
 
     Если токен невалидный - возвращает None.
     """
-    serializer: URLSafeTimedSerializer = await __get_dangerous_serializer()
-
     try:
-        return serializer.loads(token, max_age=expiration)
+        return __dangerous_serializer.loads(token, max_age=expiration)
 
     except BadSignature:
 
@@ -48,11 +53,3 @@ async def dangerous_token_verify(token, expiration: int = TimeIntervals.SECONDS_
         )
 
         return None
-
-
-async def __get_dangerous_serializer() -> URLSafeTimedSerializer:
-    """Инициализирует сериализатор генерации токенов."""
-    return URLSafeTimedSerializer(
-        secret_key=settings.SECRET_KEY,
-        salt=SALT,
-    )
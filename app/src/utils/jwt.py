@@ -2,18 +2,276 @@
 Модуль с вспомогательными функциями приложения "auth".
 
 Включает в себя функции работы с JWT токенами.
+
+Ключи подписи хранятся в связке ключей jwt_keyring (объекты алгоритмов
+python-jose создаются один раз при загрузке, а не при каждом вызове
+jwt.encode / jwt.decode). Каждый токен содержит заголовок kid - идентификатор
+ключа подписи, по которому выбирается ключ проверки.
+
+Алгоритмы:
+    - HS256 / HS384 / HS512: общий секрет SECRET_KEY (kid = JWT_KEY_ID или "default")
+    - RS256 / RS384 / RS512 / ES256 / ES384 / ES512: приватные ключи PEM
+      из директории JWT_KEYS_DIR, kid - имя файла без расширения
+
+Ротация асимметричных ключей:
+    1) добавить файл нового ключа и указать его в JWT_KEY_ID (или jwt_keyring.add
+       с activate=True): новые токены подписываются новым ключом, старые
+       продолжают проверяться старым
+    2) через JWT_REFRESH_EXPIRATION_SEC удалить старый ключ (jwt_key_retire)
+
+Публичные ключи доступны в формате JWKS по адресу /api/v1/auth/jwks.json:
+другие сервисы (например, потребители событий RabbitMQ) проверяют токены
+локально без обращения к приложению:
+
+    ```
+    jwt.decode(token=token, key=jwks, algorithms=[...])
+    ```
+
+Результаты проверки токенов хранятся в ограниченном LRU кэше jwt_verified_cache
+(ключ - SHA-256 дайджест токена) до истечения срока жизни токена (exp):
+повторные запросы с тем же токеном не разбирают и не проверяют подпись заново.
+Отзыв токенов проверяется отдельно при каждом запросе (смотри revocation.py).
+
+Выпуск и проверка токенов - синхронные функции (чистая работа процессора
+без ввода-вывода) и вызываются без await. Для кода, которому нужна
+корутина, есть обертки jwt_generate_pair_async и jwt_decode_async.
+Сегменты заголовков токенов формируются связкой ключей заранее, поэтому
+выпуск и проверка токенов этого модуля не разбирают и не сериализуют заголовок.
 """
 
-from datetime import datetime, timedelta
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from uuid import uuid4
 
 from fastapi import HTTPException
-from jose import jwt
+from jose import (
+    jwk,
+    jwt,
+)
+from jose.backends.base import Key
 from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+import orjson
 
 from src.config.config import settings
 
+JWT_ALGORITHMS: list[str] = [settings.JWT_ALGORITHM]
+JWT_KID_DEFAULT: str = 'default'
+
+JWT_EXPIRATION_SEC: dict[str, int] = {
+    settings.JWT_TYPE_ACCESS: settings.JWT_ACCESS_EXPIRATION_SEC,
+    settings.JWT_TYPE_REFRESH: settings.JWT_REFRESH_EXPIRATION_SEC,
+}
+# INFO. Постоянная часть payload токенов каждого типа.
+JWT_PAYLOAD_TEMPLATES: dict[str, dict[str, any]] = {
+    token_type: {
+        'iss': settings.DOMAIN_NAME,
+        'type': token_type,
+    }
+    for token_type in JWT_EXPIRATION_SEC
+}
+JWT_PAYLOAD_TEMPLATE_UNKNOWN: dict[str, any] = {
+    'iss': settings.DOMAIN_NAME,
+    'type': 'unknown',
+}
+
+
+class JwtKeyring:
+    """
+    Класс связки ключей подписи JWT токенов в памяти процесса.
+
+    Токены подписываются активным ключом (kid_active) и проверяются
+    ключом из заголовка kid. Токены без kid (выпущенные до появления связки)
+    проверяются активным ключом.
+    """
+
+    def __init__(self, *, algorithm: str):
+        self.algorithm = algorithm
+        self.kid_active: str | None = None
+        self.__keys: dict[str, Key] = {}
+        # INFO. Для асимметричных алгоритмов подпись проверяется публичным ключом,
+        #       который создается один раз при добавлении ключа.
+        self.__verification_keys: dict[str, Key] = {}
+        # INFO. Готовые сегменты заголовков токенов (base64url) по kid и обратно.
+        self.__header_segments: dict[str, str] = {}
+        self.__kids_by_header_segment: dict[str, str] = {}
+        self.__jwks: dict[str, list[dict[str, any]]] | None = None
+
+    @property
+    def is_asymmetric(self) -> bool:
+        """Используется ли асимметричный алгоритм (RS / ES)."""
+        return not self.algorithm.startswith('HS')
+
+    def add(self, *, kid: str, key_data: str, activate: bool = False) -> None:
+        """
+        Добавляет ключ в связку.
+
+        Первый добавленный ключ становится активным.
+        """
+        key: Key = jwk.construct(key_data=key_data, algorithm=self.algorithm)
+        self.__keys[kid] = key
+        self.__verification_keys[kid] = key.public_key() if self.is_asymmetric else key
+        header_segment: str = _b64encode(
+            orjson.dumps({'alg': self.algorithm, 'kid': kid, 'typ': 'JWT'}),
+        )
+        self.__header_segments[kid] = header_segment
+        self.__kids_by_header_segment[header_segment] = kid
+        self.__jwks = None
+        if activate or self.kid_active is None:
+            self.activate(kid=kid)
+        return
+
+    def activate(self, *, kid: str) -> None:
+        """
+        Делает ключ активным (ключом подписи новых токенов).
+
+        Вызывает ValueError, если ключа нет в связке.
+        """
+        if kid not in self.__keys:
+            raise ValueError(f'Ключ JWT kid={kid} отсутствует в связке ключей')
+        self.kid_active = kid
+        return
+
+    def remove(self, *, kid: str) -> None:
+        """
+        Удаляет ключ из связки: токены, подписанные им, становятся недействительными.
+
+        Вызывает ValueError при попытке удалить активный ключ.
+        """
+        if kid == self.kid_active:
+            raise ValueError(f'Нельзя удалить активный ключ JWT kid={kid}')
+        self.__keys.pop(kid, None)
+        self.__verification_keys.pop(kid, None)
+        self.__kids_by_header_segment.pop(self.__header_segments.pop(kid, None), None)
+        self.__jwks = None
+        return
+
+    def signing_key(self) -> tuple[str, Key]:
+        """Возвращает kid и активный ключ подписи."""
+        return self.kid_active, self.__keys[self.kid_active]
+
+    def header_segment(self, *, kid: str) -> str:
+        """Возвращает готовый сегмент заголовка токенов ключа."""
+        return self.__header_segments[kid]
+
+    def kid_by_header_segment(self, *, header_segment: str) -> str | None:
+        """Возвращает kid по сегменту заголовка (None, если заголовок выпущен не связкой)."""
+        return self.__kids_by_header_segment.get(header_segment)
+
+    def verification_key(self, *, kid: str | None) -> Key | None:
+        """Возвращает ключ проверки по kid (None, если ключа нет в связке)."""
+        return self.__verification_keys.get(self.kid_active if kid is None else kid)
+
+    def jwks(self) -> dict[str, list[dict[str, any]]]:
+        """
+        Возвращает публичные ключи связки в формате JWKS.
+
+        Для симметричных алгоритмов (HS) список ключей пуст: секрет не публикуется.
+        """
+        if self.__jwks is None:
+            keys: list[dict[str, any]] = []
+            if self.is_asymmetric:
+                for kid, key in self.__verification_keys.items():
+                    public_jwk: dict[str, any] = key.to_dict()
+                    public_jwk['kid'] = kid
+                    public_jwk['use'] = 'sig'
+                    keys.append(public_jwk)
+            self.__jwks = {'keys': keys}
+        return self.__jwks
+
+
+def jwt_keyring_build() -> JwtKeyring:
+    """
+    Создает связку ключей по настройкам.
+
+    Вызывает ValueError, если для асимметричного алгоритма
+    в JWT_KEYS_DIR нет ключей или нет ключа JWT_KEY_ID.
+    """
+    keyring: JwtKeyring = JwtKeyring(algorithm=settings.JWT_ALGORITHM)
+    if not keyring.is_asymmetric:
+        keyring.add(kid=settings.JWT_KEY_ID or JWT_KID_DEFAULT, key_data=settings.SECRET_KEY)
+        return keyring
+
+    paths: list[Path] = sorted(Path(settings.JWT_KEYS_DIR).glob('*.pem'))
+    if not paths:
+        raise ValueError(f'Для алгоритма {settings.JWT_ALGORITHM} нет ключей в JWT_KEYS_DIR')
+    for path in paths:
+        keyring.add(kid=path.stem, key_data=path.read_text())
+    # INFO. По умолчанию активен последний ключ по имени файла (например, по дате).
+    keyring.activate(kid=settings.JWT_KEY_ID or paths[-1].stem)
+    return keyring
+
+
+jwt_keyring: JwtKeyring = jwt_keyring_build()
+
+
+class JwtVerifiedCache:
+    """
+    Класс ограниченного LRU кэша payload проверенных JWT токенов.
+
+    Атрибуты:
+        hits: int - количество попаданий
+        misses: int - количество промахов
+    """
+
+    def __init__(self, *, max_size: int):
+        self.max_size = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__data: OrderedDict[bytes, dict[str, any]] = OrderedDict()
+
+    def get(self, token: str) -> dict[str, any] | None:
+        """Возвращает копию payload или None, если токена нет или его срок жизни истек."""
+        digest: bytes = sha256(token.encode()).digest()
+        payload: dict[str, any] | None = self.__data.get(digest)
+        if payload is None:
+            self.misses += 1
+            return None
+        if payload.get('exp', 0) <= time():
+            self.__data.pop(digest, None)
+            self.misses += 1
+            return None
+        self.__data.move_to_end(digest)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: dict[str, any]) -> None:
+        """Сохраняет копию payload проверенного токена."""
+        if not self.max_size:
+            return
+        digest: bytes = sha256(token.encode()).digest()
+        self.__data[digest] = dict(payload)
+        self.__data.move_to_end(digest)
+        while len(self.__data) > self.max_size:
+            self.__data.popitem(last=False)
+        return
+
+    def clear(self) -> None:
+        """Удаляет все значения."""
+        self.__data.clear()
+        return
+
+    def metrics(self) -> dict[str, int]:
+        """Возвращает метрики кэша."""
+        return {
+            'size': len(self.__data),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
 
-async def jwt_generate_pair(
+
+jwt_verified_cache: JwtVerifiedCache = JwtVerifiedCache(
+    max_size=settings.JWT_VERIFIED_CACHE_MAX_SIZE,
+)
+
+
+def jwt_generate_pair(
     user_id: int,
     is_admin: bool = False,
     is_to_refresh: bool = False,
@@ -24,6 +282,8 @@ async def jwt_generate_pair(
         - id: ID пользователя
         - exp: дата окончания срока жизни (Unix Epoch)
         - is_admin: статус администратора (если пользователь им является)
+        - jti: уникальный идентификатор токена (для точечного отзыва)
+        - ver: версия токена - время выпуска в мс (для отзыва всех токенов пользователя)
 
     Возвращает кортеж, содержащий данные в следующем порядке:
         1) JWT access
@@ -33,77 +293,163 @@ async def jwt_generate_pair(
 
     Если "is_to_refresh == True" - создает и возвращает только токен доступа.
     """
-    payload: dict[str, dict[str, any]] = {
+    claims: dict[str, any] = {
         'sub': str(user_id)
     }
     if is_admin:
-        payload['is_admin'] = is_admin
+        claims['is_admin'] = is_admin
     if is_salesman:
-        payload['is_salesman'] = is_salesman
+        claims['is_salesman'] = is_salesman
 
-    access_token, exp_access = await _jwt_generate(
-        payload=payload,
+    access_token, exp_access = _jwt_generate(
+        claims=claims,
         token_type=settings.JWT_TYPE_ACCESS,
     )
     if is_to_refresh:
         refresh_token = None
         exp_refresh = None
     else:
-        refresh_token, exp_refresh = await _jwt_generate(
-            payload=payload,
+        refresh_token, exp_refresh = _jwt_generate(
+            claims=claims,
             token_type=settings.JWT_TYPE_REFRESH,
         )
 
     return access_token, exp_access, refresh_token, exp_refresh
 
 
-async def jwt_decode(jwt_token: str) -> dict[str, any]:
+async def jwt_generate_pair_async(
+    user_id: int,
+    is_admin: bool = False,
+    is_to_refresh: bool = False,
+    is_salesman: bool = False,
+) -> tuple[str, int, str, int]:
+    """Асинхронная обертка jwt_generate_pair."""
+    return jwt_generate_pair(
+        user_id=user_id,
+        is_admin=is_admin,
+        is_to_refresh=is_to_refresh,
+        is_salesman=is_salesman,
+    )
+
+
+def jwt_decode(jwt_token: str) -> dict[str, any]:
     """
     Читает, валидирует информацию JWT токена.
 
     Возвращает данные из payload.
 
-    Вызывает HTTPException при возникновении исключений:
-        - ExpiredSignatureError: если подпись недействительна
-        - JWTClaimsError: если истек срок действия
-        - JWTError: произошла ошибка чтения
+    Вызывает HTTPException 401, если подпись недействительна,
+    истек срок действия или произошла ошибка чтения токена.
     """
-    try:
-        return jwt.decode(
-            token=jwt_token,
-            key=settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM,],
-        )
-    except (ExpiredSignatureError, JWTClaimsError, JWTError):
+    payload: dict[str, any] | None = jwt_verified_cache.get(token=jwt_token)
+    if payload is not None:
+        return payload
+
+    payload = _jwt_verify(token=jwt_token)
+    if payload is None:
         raise HTTPException(
             detail='Токен недействителен или срок его действия истек',
             status_code=401,
         )
 
+    jwt_verified_cache.set(token=jwt_token, payload=payload)
+    return payload
+
+
+async def jwt_decode_async(jwt_token: str) -> dict[str, any]:
+    """Асинхронная обертка jwt_decode."""
+    return jwt_decode(jwt_token=jwt_token)
 
-async def _jwt_generate(payload: dict[str, any], token_type: str) -> tuple[str, int]:
+
+def jwt_key_retire(kid: str) -> None:
+    """
+    Удаляет ключ из связки после ротации.
+
+    Кэш проверенных токенов очищается: токены, подписанные удаленным ключом,
+    становятся недействительными сразу.
     """
-    Создает JWT токен с указанными параметрами payload и token_type.
+    jwt_keyring.remove(kid=kid)
+    jwt_verified_cache.clear()
+    return
+
+
+def _b64decode(data: str) -> bytes:
+    """Декодирует сегмент токена из base64url без выравнивания."""
+    return urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+def _b64encode(data: bytes) -> str:
+    """Кодирует сегмент токена в base64url без выравнивания."""
+    return urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def _jwt_generate(claims: dict[str, any], token_type: str) -> tuple[str, int]:
+    """
+    Создает JWT токен с указанными claims и token_type.
+
+    Сегмент заголовка берется готовым из связки ключей, а постоянная часть
+    payload - из шаблона JWT_PAYLOAD_TEMPLATES: при выпуске токена
+    сериализуются только claims пользователя, exp, jti и ver.
 
     Возвращает токен и время жизни (Unix).
     """
-    if token_type == settings.JWT_TYPE_ACCESS:
-        exp_time_sec: int = settings.JWT_ACCESS_EXPIRATION_SEC
-    elif token_type == settings.JWT_TYPE_REFRESH:
-        exp_time_sec: int = settings.JWT_REFRESH_EXPIRATION_SEC
-    else:
-        token_type: str = 'unknown'
-        exp_time_sec: int = 0
-
-    exp_datetime: datetime = datetime.now() + timedelta(seconds=exp_time_sec)
-    exp_unix: int = int(exp_datetime.timestamp())
-    payload['exp'] = exp_unix
-    payload['iss'] = settings.DOMAIN_NAME
-    payload['type'] = token_type
-
-    token: str = jwt.encode(
-        claims=payload,
-        key=settings.SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
-    )
-    return token, exp_unix
+    template: dict[str, any] = JWT_PAYLOAD_TEMPLATES.get(token_type, JWT_PAYLOAD_TEMPLATE_UNKNOWN)
+    now: float = time()
+    exp_unix: int = int(now) + JWT_EXPIRATION_SEC.get(token_type, 0)
+    payload: dict[str, any] = {
+        **claims,
+        **template,
+        'exp': exp_unix,
+        'jti': uuid4().hex,
+        'ver': int(now * 1000),
+    }
+
+    kid, key = jwt_keyring.signing_key()
+    signing_input: str = jwt_keyring.header_segment(kid=kid) + '.' + _b64encode(orjson.dumps(payload))
+    signature: bytes = key.sign(signing_input.encode())
+    return signing_input + '.' + _b64encode(signature), exp_unix
+
+
+def _jwt_verify(token: str) -> dict[str, any] | None:
+    """
+    Проверяет подпись и срок жизни токена. Возвращает payload или None.
+
+    Токены с заголовком, выпущенным этим модулем, проверяются без разбора
+    заголовка: алгоритм и kid однозначно определяются сегментом заголовка.
+    Остальные токены (например, выпущенные до появления kid) проверяются python-jose.
+    """
+    header_segment, _, rest = token.partition('.')
+    kid: str | None = jwt_keyring.kid_by_header_segment(header_segment=header_segment)
+    if kid is None:
+        return _jwt_verify_jose(token=token)
+
+    payload_segment, _, signature_segment = rest.partition('.')
+    key: Key | None = jwt_keyring.verification_key(kid=kid)
+    try:
+        signature: bytes = _b64decode(signature_segment)
+        if key is None or not key.verify((header_segment + '.' + payload_segment).encode(), signature):
+            return None
+        payload: any = orjson.loads(_b64decode(payload_segment))
+    # INFO. binascii.Error и orjson.JSONDecodeError являются подклассами ValueError.
+    except ValueError:
+        return None
+
+    if not isinstance(payload, dict) or not isinstance(payload.get('exp'), int) or payload['exp'] <= time():
+        return None
+    return payload
+
+
+def _jwt_verify_jose(token: str) -> dict[str, any] | None:
+    """Проверяет токен средствами python-jose. Возвращает payload или None."""
+    try:
+        kid: str | None = jwt.get_unverified_header(token=token).get('kid')
+        key: Key | None = jwt_keyring.verification_key(kid=kid)
+        if key is None:
+            return None
+        return jwt.decode(
+            token=token,
+            key=key,
+            algorithms=JWT_ALGORITHMS,
+        )
+    except (ExpiredSignatureError, JWTClaimsError, JWTError):
+        return None
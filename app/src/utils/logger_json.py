@@ -98,6 +98,11 @@ LoggerJsonAuth: Logger = LoggerJson(
     log_min_level=LOG_LEVEL_DEFAULT,
 ).logger
 
+LoggerJsonCache: Logger = LoggerJson(
+    logger_name='Cache',
+    log_min_level=LOG_LEVEL_DEFAULT,
+).logger
+
 LoggerJsonEmail: Logger = LoggerJson(
     logger_name='Email',
     log_min_level=LOG_LEVEL_DEFAULT,
@@ -108,6 +113,11 @@ LoggerJsonFeedback: Logger = LoggerJson(
     log_min_level=LOG_LEVEL_DEFAULT,
 ).logger
 
+LoggerJsonOutbox: Logger = LoggerJson(
+    logger_name='Outbox',
+    log_min_level=LOG_LEVEL_DEFAULT,
+).logger
+
 LoggerJsonRabbitMQ: Logger = LoggerJson(
     logger_name='RabbitMQ',
     log_min_level=LOG_LEVEL_DEFAULT,
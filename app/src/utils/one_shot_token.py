@@ -0,0 +1,73 @@
+"""
+Модуль с вспомогательными функциями приложения "auth".
+
+Включает в себя функции одноразовых токенов (например, токенов восстановления пароля).
+
+Использованный токен отмечается в Redis ключом с коротким дайджестом токена
+(BLAKE2b, 16 байт) вместо полной строки токена. Отметка ставится атомарно
+(SET NX EX в Lua скрипте): из нескольких одновременных запросов с одним токеном
+токен "погашает" только один, без гонки между проверкой и записью.
+
+Назначение токена (purpose) входит в ключ, поэтому одинаковые строки токенов
+разного назначения не пересекаются.
+
+Токены восстановления пароля, использованные до появления модуля, отмечены
+ключами устаревшего формата (RedisKeys.USED_PASSWORD_RESET_TOKEN_LEGACY):
+в течение срока жизни токена такие ключи также проверяются.
+"""
+
+from hashlib import blake2b
+
+
+from src.database.database import RedisKeys
+from src.utils.redis_data import (
+    RedisScriptAsync,
+    redis_script_register_async,
+)
+
+# INFO. Отказывает, если токен отмечен ключом устаревшего формата (KEYS[2]),
+#       иначе атомарно ставит отметку использования (KEYS[1]).
+LUA_ONE_SHOT_TOKEN_CONSUME: str = """
+if KEYS[2] and redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+if redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) then
+    return 1
+end
+return 0
+"""
+
+ONE_SHOT_TOKEN_DIGEST_SIZE: int = 16
+
+ONE_SHOT_TOKEN_PURPOSE_PASSWORD_RESET: str = 'password_reset'
+
+# INFO. Шаблоны ключей устаревшего формата по назначению токена.
+ONE_SHOT_TOKEN_LEGACY_KEYS: dict[str, str] = {
+    ONE_SHOT_TOKEN_PURPOSE_PASSWORD_RESET: RedisKeys.USED_PASSWORD_RESET_TOKEN_LEGACY,
+}
+
+__one_shot_token_consume: RedisScriptAsync = redis_script_register_async(script=LUA_ONE_SHOT_TOKEN_CONSUME)
+
+
+def one_shot_token_digest(token: str) -> str:
+    """Возвращает короткий дайджест токена для ключа Redis."""
+    return blake2b(token.encode(), digest_size=ONE_SHOT_TOKEN_DIGEST_SIZE).hexdigest()
+
+
+async def one_shot_token_consume(purpose: str, token: str, ex_sec: int) -> bool:
+    """
+    Атомарно "погашает" одноразовый токен.
+
+    Возвращает True, если токен использован впервые, и False, если он уже был использован.
+    Отметка хранится ex_sec секунд: не меньше срока жизни самого токена.
+    """
+    keys: list[str] = [
+        RedisKeys.AUTH_ONE_SHOT_TOKEN.format(
+            purpose=purpose,
+            digest=one_shot_token_digest(token=token),
+        ),
+    ]
+    legacy_key: str | None = ONE_SHOT_TOKEN_LEGACY_KEYS.get(purpose)
+    if legacy_key is not None:
+        keys.append(legacy_key.format(reset_token=token))
+    return bool(await __one_shot_token_consume(keys=keys, args=[ex_sec]))
@@ -0,0 +1,160 @@
+"""
+Модуль очереди исходящих задач Celery (transactional outbox).
+
+Обработчики запросов не отправляют задачи в брокер напрямую (apply_async
+блокирует event loop на время обмена с брокером, а задача теряется или,
+наоборот, уходит в брокер, если commit изменений затем не удался).
+Вместо этого задача сохраняется строкой таблицы OutboxTask в той же сессии,
+что и изменение данных, и фиксируется вместе с ним одним commit:
+
+    ```
+    outbox_task_add(
+        session=session,
+        task=send_password_has_changed_to_mail_task,
+        args=(user.get_full_name, user.email),
+    )
+    await user_v1_crud.update_by_id(..., session=session)  # commit
+    ```
+
+Фоновый ретранслятор outbox_relay_run (запускается в lifespan каждого воркера)
+выбирает строки пачками (SELECT ... FOR UPDATE SKIP LOCKED: ретрансляторы
+разных воркеров не отправляют одну задачу дважды), отправляет задачи в брокер
+в отдельном потоке и удаляет отправленные строки в той же транзакции.
+
+Доставка "как минимум один раз": если процесс завершится между отправкой
+задачи и commit, задача будет отправлена повторно.
+"""
+
+import asyncio
+from logging import Logger
+
+from celery import Task
+from sqlalchemy import (
+    Select,
+    delete,
+    select,
+    update,
+)
+
+from src.celery_app.celery_app import celery_app
+from src.config.config import settings
+from src.database.database import (
+    AsyncSession,
+    async_session_maker,
+)
+from src.models.outbox import OutboxTask
+from src.utils.logger_json import LoggerJsonOutbox
+
+logger: Logger = LoggerJsonOutbox
+
+__query_pending: Select = (
+    select(
+        OutboxTask.id,
+        OutboxTask.task_name,
+        OutboxTask.args,
+        OutboxTask.kwargs,
+        OutboxTask.priority,
+        OutboxTask.attempts,
+    )
+    .where(OutboxTask.attempts < settings.OUTBOX_RELAY_MAX_ATTEMPTS)
+    .order_by(OutboxTask.id)
+    .with_for_update(skip_locked=True)
+)
+
+
+def outbox_task_add(
+    session: AsyncSession,
+    task: Task,
+    args: tuple = (),
+    kwargs: dict[str, any] | None = None,
+    priority: int | None = None,
+) -> None:
+    """
+    Добавляет задачу Celery в очередь исходящих задач сессии.
+
+    Задача фиксируется следующим commit сессии (вместе с изменениями данных).
+    Аргументы задачи должны быть JSON-совместимыми.
+    Если priority не указан, используется приоритет из декоратора задачи.
+    """
+    session.add(
+        OutboxTask(
+            task_name=task.name,
+            args=list(args),
+            kwargs=kwargs or {},
+            priority=priority if priority is not None else task.priority,
+        ),
+    )
+    return
+
+
+async def outbox_relay_batch(batch_size: int = settings.OUTBOX_RELAY_BATCH_SIZE) -> int:
+    """
+    Отправляет в брокер одну пачку задач из очереди исходящих задач.
+
+    Возвращает количество отправленных задач.
+    """
+    async with async_session_maker() as session:
+        rows: list[tuple] = (await session.execute(__query_pending.limit(batch_size))).all()
+        if not rows:
+            return 0
+
+        # INFO. Отправка задач блокирующая: выполняется вне event loop.
+        sent_ids, failed_row = await asyncio.to_thread(_outbox_rows_send, rows)
+
+        if sent_ids:
+            await session.execute(delete(OutboxTask).where(OutboxTask.id.in_(sent_ids)))
+        if failed_row is not None:
+            await session.execute(
+                update(OutboxTask)
+                .where(OutboxTask.id == failed_row.id)
+                .values(attempts=OutboxTask.attempts + 1),
+            )
+            if failed_row.attempts + 1 >= settings.OUTBOX_RELAY_MAX_ATTEMPTS:
+                logger.error(
+                    msg=f'Outbox task id={failed_row.id} exceeded send attempts and will not be retried.',
+                    extra={'task_name': failed_row.task_name},
+                )
+        await session.commit()
+
+    return len(sent_ids)
+
+
+async def outbox_relay_run() -> None:
+    """
+    Фоновый ретранслятор очереди исходящих задач.
+
+    Пока очередь заполнена, пачки отправляются без пауз; когда очередь пуста
+    (или брокер недоступен), таблица опрашивается раз в OUTBOX_RELAY_INTERVAL_SEC.
+    Ошибки пачки логируются, и ретранслятор продолжает работу.
+    """
+    while True:
+        try:
+            sent: int = await outbox_relay_batch()
+        except Exception:
+            logger.exception(msg='Outbox relay batch failed.')
+            sent = 0
+        if sent < settings.OUTBOX_RELAY_BATCH_SIZE:
+            await asyncio.sleep(settings.OUTBOX_RELAY_INTERVAL_SEC)
+
+
+def _outbox_rows_send(rows: list[tuple]) -> tuple[list[int], tuple | None]:
+    """
+    Отправляет задачи в брокер по порядку.
+
+    Возвращает id отправленных задач и строку задачи, отправка которой не удалась.
+    После первой ошибки отправка пачки прекращается: брокер, скорее всего,
+    недоступен, и остальные задачи будут отправлены следующими пачками.
+    """
+    sent_ids: list[int] = []
+    for row in rows:
+        options: dict[str, any] = {} if row.priority is None else {'priority': row.priority}
+        try:
+            celery_app.send_task(row.task_name, args=row.args, kwargs=row.kwargs, **options)
+        except Exception as exc:
+            logger.warning(
+                msg=f'Outbox task id={row.id} send failed: {exc}',
+                extra={'task_name': row.task_name},
+            )
+            return sent_ids, row
+        sent_ids.append(row.id)
+    return sent_ids, None
@@ -2,24 +2,322 @@
 Модуль с вспомогательными функциями приложения "auth".
 
 Включает в себя функции шифрования паролей.
+
+Хэш пароля хранится в версионированном формате:
+
+    algorithm$cost$salt$digest
+
+    - algorithm: название алгоритма из PASSWORD_HASHERS (pbkdf2 / scrypt)
+    - cost: параметры стоимости алгоритма (например, "sha256:600000" для pbkdf2)
+    - salt: индивидуальная соль пользователя (base64)
+    - digest: хэш пароля (base64)
+
+Если алгоритм или параметры стоимости в настройках изменились, хэш
+пересчитывается при следующем успешном входе пользователя (password_needs_rehash),
+поэтому стоимость можно менять без миграции базы данных.
+
+Хэши устаревшего формата (str(bytes) с глобальной SALT) продолжают проверяться
+с закрепленными параметрами LEGACY_HASH_NAME / LEGACY_ITERATIONS (независимо
+от текущей стоимости) и также пересчитываются при входе.
+
+Хэширование занимает процессор, поэтому в асинхронных обработчиках используются
+hash_password_async / verify_password_async: вычисление выполняется в отдельном
+пуле потоков ограниченного размера (pbkdf2_hmac и scrypt освобождают GIL),
+а event loop продолжает обслуживать запросы.
+При переполнении очереди пула вызывается HTTPException 503.
+Метрики пула (глубина очереди, насыщение) доступны администраторам
+по адресу /api/v1/metrics/.
 """
 
-from hashlib import pbkdf2_hmac
+import asyncio
+from base64 import (
+    b64decode,
+    b64encode,
+)
+from binascii import Error as BinasciiError
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from hashlib import (
+    pbkdf2_hmac,
+    scrypt,
+)
+from hmac import compare_digest
+from os import urandom
+from typing import Callable
+
+from fastapi import (
+    HTTPException,
+    status,
+)
+
 from src.config.config import settings
+from src.utils.logger_json import (
+    Logger,
+    LoggerJsonAuth,
+)
+
+logger: Logger = LoggerJsonAuth
 
+# INFO. Глобальная соль используется только для проверки хэшей устаревшего формата.
 SALT: bytes = (settings.SALT).encode(settings.PASS_ENCODE)
+SALT_LEN: int = 16
+SEPARATOR: str = '$'
+
+
+class Pbkdf2Hasher:
+    """Класс хэширования паролей алгоритмом PBKDF2-HMAC."""
+
+    algorithm: str = 'pbkdf2'
+
+    @staticmethod
+    def cost_current() -> str:
+        """Возвращает параметры стоимости из настроек."""
+        return f'{settings.HASH_NAME}:{settings.ITERATIONS}'
+
+    @staticmethod
+    def digest(password: bytes, salt: bytes, cost: str) -> bytes:
+        """Вычисляет хэш пароля с указанными параметрами стоимости."""
+        hash_name, iterations = cost.split(':')
+        return pbkdf2_hmac(
+            hash_name=hash_name,
+            password=password,
+            salt=salt,
+            iterations=int(iterations),
+        )
+
+
+class ScryptHasher:
+    """Класс хэширования паролей алгоритмом scrypt."""
+
+    algorithm: str = 'scrypt'
+
+    @staticmethod
+    def cost_current() -> str:
+        """Возвращает параметры стоимости из настроек."""
+        return f'{settings.SCRYPT_N}:{settings.SCRYPT_R}:{settings.SCRYPT_P}'
+
+    @staticmethod
+    def digest(password: bytes, salt: bytes, cost: str) -> bytes:
+        """Вычисляет хэш пароля с указанными параметрами стоимости."""
+        n, r, p = (int(value) for value in cost.split(':'))
+        return scrypt(
+            password=password,
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            # INFO. Лимит памяти с запасом относительно требуемых 128 * n * r байт.
+            maxmem=256 * n * r,
+        )
+
+
+PASSWORD_HASHERS: dict[str, type[Pbkdf2Hasher] | type[ScryptHasher]] = {
+    Pbkdf2Hasher.algorithm: Pbkdf2Hasher,
+    ScryptHasher.algorithm: ScryptHasher,
+}
+
+if settings.PASSWORD_HASHER not in PASSWORD_HASHERS:
+    raise ValueError(
+        f'Неизвестный алгоритм PASSWORD_HASHER={settings.PASSWORD_HASHER!r}, '
+        f'допустимые значения: {sorted(PASSWORD_HASHERS)}',
+    )
+PASSWORD_HASHER_CURRENT: type[Pbkdf2Hasher] | type[ScryptHasher] = PASSWORD_HASHERS[settings.PASSWORD_HASHER]
+
+
+class PasswordHashPool:
+    """
+    Класс пула потоков хэширования паролей с ограничением очереди.
+
+    Место в пуле освобождается по завершении задачи в потоке, а не при отмене
+    ожидающей ее корутины (например, при разрыве соединения клиентом):
+    поток продолжает вычисление, и учет мест должен это отражать.
+
+    Атрибуты:
+        in_flight: int - количество задач в работе и в очереди
+        in_flight_max: int - максимальное количество задач в работе и в очереди
+        completed_total: int - количество успешно выполненных задач
+        failed_total: int - количество задач, завершившихся исключением
+        rejected_total: int - количество отклоненных задач (503)
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        queue_max: int,
+    ):
+        self.workers = workers
+        self.queue_max = queue_max
+        self.in_flight: int = 0
+        self.in_flight_max: int = 0
+        self.completed_total: int = 0
+        self.failed_total: int = 0
+        self.rejected_total: int = 0
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='password_hash',
+        )
+
+    async def run(self, func: Callable, *args: any) -> any:
+        """
+        Выполняет функцию хэширования в пуле потоков.
+
+        Вызывает HTTPException 503, если очередь пула переполнена.
+        """
+        if self.in_flight >= self.workers + self.queue_max:
+            self.rejected_total += 1
+            logger.warning(
+                msg='Password hash pool is saturated, request rejected.',
+                extra=self.metrics(),
+            )
+            raise HTTPException(
+                detail='Сервис перегружен, пожалуйста, повторите попытку позже',
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: Future = self.__executor.submit(func, *args)
+        self.in_flight += 1
+        self.in_flight_max = max(self.in_flight_max, self.in_flight)
+        future.add_done_callback(lambda done: self.__release_threadsafe(loop=loop, future=done))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def metrics(self) -> dict[str, int | float]:
+        """
+        Возвращает метрики пула.
+
+        saturation - доля занятых мест пула (работа и очередь), 1 - пул переполнен.
+        """
+        return {
+            'workers': self.workers,
+            'queue_max': self.queue_max,
+            'queue_depth': max(self.in_flight - self.workers, 0),
+            'queue_depth_max': max(self.in_flight_max - self.workers, 0),
+            'in_flight': self.in_flight,
+            'saturation': round(self.in_flight / (self.workers + self.queue_max), 3),
+            'completed_total': self.completed_total,
+            'failed_total': self.failed_total,
+            'rejected_total': self.rejected_total,
+        }
+
+    def shutdown(self) -> None:
+        """Останавливает пул потоков."""
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        return
+
+    def __release_threadsafe(self, *, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        """Освобождает место пула в потоке event loop (вызывается из потока пула)."""
+        try:
+            loop.call_soon_threadsafe(self.__release, future)
+        except RuntimeError:
+            # INFO. Event loop уже закрыт (остановка приложения): учет мест не нужен.
+            pass
+        return
+
+    def __release(self, future: Future) -> None:
+        """Освобождает место пула и учитывает результат задачи."""
+        self.in_flight -= 1
+        if future.cancelled() or future.exception() is not None:
+            self.failed_total += 1
+        else:
+            self.completed_total += 1
+        return
+
+
+password_hash_pool: PasswordHashPool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_max=settings.PASSWORD_HASH_QUEUE_MAX,
+)
 
 
 def hash_password(raw_password: str) -> str:
-    """Создает хэш пароля для сохранения в базе данных."""
-    hashed_password: str = str(
-        # TODO: перейти на passlib
-        #       https://fastapi.tiangolo.com/tutorial/security/oauth2-jwt/#install-passlib
+    """
+    Создает хэш пароля для сохранения в базе данных
+    алгоритмом settings.PASSWORD_HASHER с индивидуальной солью.
+    """
+    hasher: type[Pbkdf2Hasher] | type[ScryptHasher] = PASSWORD_HASHER_CURRENT
+    cost: str = hasher.cost_current()
+    salt: bytes = urandom(SALT_LEN)
+    digest: bytes = hasher.digest(
+        password=raw_password.encode(settings.PASS_ENCODE),
+        salt=salt,
+        cost=cost,
+    )
+    return SEPARATOR.join(
+        (
+            hasher.algorithm,
+            cost,
+            b64encode(salt).decode(),
+            b64encode(digest).decode(),
+        ),
+    )
+
+
+def verify_password(raw_password: str, hashed_password: str | None) -> bool:
+    """Проверяет соответствие пароля хэшу за постоянное время."""
+    if not hashed_password:
+        return False
+
+    password: bytes = raw_password.encode(settings.PASS_ENCODE)
+
+    parts: list[str] = hashed_password.split(SEPARATOR)
+    if len(parts) != 4 or parts[0] not in PASSWORD_HASHERS:
+        return compare_digest(
+            __hash_password_legacy(password=password).encode(),
+            hashed_password.encode(),
+        )
+
+    algorithm, cost, salt, digest = parts
+    try:
+        digest_expected: bytes = b64decode(digest)
+        digest_actual: bytes = PASSWORD_HASHERS[algorithm].digest(
+            password=password,
+            salt=b64decode(salt),
+            cost=cost,
+        )
+    except (BinasciiError, ValueError):
+        return False
+    return compare_digest(digest_actual, digest_expected)
+
+
+def password_needs_rehash(hashed_password: str | None) -> bool:
+    """Проверяет, отличаются ли алгоритм или стоимость хэша от текущих настроек."""
+    if not hashed_password:
+        return False
+    parts: list[str] = hashed_password.split(SEPARATOR)
+    if len(parts) != 4:
+        return True
+    hasher: type[Pbkdf2Hasher] | type[ScryptHasher] = PASSWORD_HASHER_CURRENT
+    return parts[0] != hasher.algorithm or parts[1] != hasher.cost_current()
+
+
+async def hash_password_async(raw_password: str) -> str:
+    """
+    Создает хэш пароля в пуле потоков, не блокируя event loop.
+
+    Вызывает HTTPException 503, если пул хэширования перегружен.
+    """
+    return await password_hash_pool.run(hash_password, raw_password)
+
+
+async def verify_password_async(raw_password: str, hashed_password: str | None) -> bool:
+    """
+    Проверяет пароль в пуле потоков, не блокируя event loop.
+
+    Вызывает HTTPException 503, если пул хэширования перегружен.
+    """
+    return await password_hash_pool.run(verify_password, raw_password, hashed_password)
+
+
+def __hash_password_legacy(password: bytes) -> str:
+    """Создает хэш пароля устаревшего формата (глобальная соль, закрепленные параметры)."""
+    return str(
         pbkdf2_hmac(
-            hash_name=settings.HASH_NAME,
-            password=raw_password.encode(settings.PASS_ENCODE),
+            hash_name=settings.LEGACY_HASH_NAME,
+            password=password,
             salt=SALT,
-            iterations=settings.ITERATIONS,
+            iterations=settings.LEGACY_ITERATIONS,
         ),
     )
-    return hashed_password
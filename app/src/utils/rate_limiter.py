@@ -0,0 +1,308 @@
+"""
+Модуль ограничения частоты запросов (rate limiting) на базе Redis.
+
+Проверка лимита, инкремент счетчика и установка TTL выполняются одним
+атомарным Lua скриптом (EVALSHA), поэтому конкурентные запросы не могут
+обойти лимит, а каждая операция занимает один сетевой запрос к Redis.
+
+Поддерживаемые политики:
+    - SlidingWindowPolicy: не более limit событий за последние window_sec секунд
+      (опционально с блокировкой на ban_sec после достижения лимита)
+    - TokenBucketPolicy: корзина из capacity токенов, пополняемая
+      со скоростью refill_per_sec токенов в секунду
+
+Ключ лимита формируется по email, IP адресу клиента или их сочетанию.
+IP адрес клиента за прокси (gateway) восстанавливается uvicorn из заголовка
+X-Forwarded-For только для доверенных адресов FORWARDED_ALLOW_IPS (смотри main.py).
+
+Пример использования в качестве зависимости FastAPI:
+
+    rate_limiter_register = RateLimiter(
+        policy=SlidingWindowPolicy(name='register', limit=5, window_sec=3600),
+        key_by=(RateLimitKeys.IP,),
+    )
+
+    @router.post(path='/register/', dependencies=[Depends(rate_limiter_register)])
+    async def post_register(...):
+        ...
+"""
+
+from time import time
+from typing import NamedTuple
+from uuid import uuid4
+
+from fastapi import (
+    HTTPException,
+    Request,
+    status,
+)
+
+from src.config.config import (
+    TimeIntervals,
+    settings,
+)
+from src.database.database import RedisKeys
+from src.utils.redis_data import (
+    RedisScriptAsync,
+    redis_pipeline_async,
+    redis_script_register_async,
+)
+
+LUA_SLIDING_WINDOW: str = """
+local key = KEYS[1]
+local key_ban = KEYS[2]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local ban = tonumber(ARGV[4])
+local consume = tonumber(ARGV[5])
+local member = ARGV[6]
+
+local ban_ttl = redis.call('PTTL', key_ban)
+if ban_ttl > 0 then
+    return {0, 0, ban_ttl}
+end
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+if count >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return {0, 0, tonumber(oldest[2]) + window - now}
+end
+
+if consume == 0 then
+    return {1, math.max(limit - count, 0), 0}
+end
+
+redis.call('ZADD', key, now, member)
+redis.call('PEXPIRE', key, window)
+count = count + 1
+
+if count >= limit and ban > 0 then
+    redis.call('SET', key_ban, 1, 'PX', ban)
+end
+
+return {1, math.max(limit - count, 0), 0}
+"""
+
+LUA_TOKEN_BUCKET: str = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local refill_per_ms = tonumber(ARGV[3])
+local consume = tonumber(ARGV[4])
+
+local data = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * refill_per_ms)
+
+if tokens < 1 then
+    return {0, 0, math.ceil((1 - tokens) / refill_per_ms)}
+end
+
+if consume == 0 then
+    return {1, math.floor(tokens), 0}
+end
+
+tokens = tokens - 1
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', key, math.ceil(capacity / refill_per_ms))
+return {1, math.floor(tokens), 0}
+"""
+
+
+class RateLimitKeys:
+    """Класс представления источников ключа лимита."""
+
+    EMAIL: str = 'email'
+    IP: str = 'ip'
+
+
+class RateLimitResult(NamedTuple):
+    """Результат проверки лимита."""
+
+    allowed: bool
+    remaining: int
+    retry_after_sec: int
+
+
+class SlidingWindowPolicy:
+    """Политика скользящего окна: не более limit событий за window_sec секунд."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        limit: int,
+        window_sec: int,
+        ban_sec: int = 0,
+    ):
+        self.name = name
+        self.limit = limit
+        self.window_sec = window_sec
+        self.ban_sec = ban_sec
+        self.__script: RedisScriptAsync = redis_script_register_async(script=LUA_SLIDING_WINDOW)
+
+    async def execute(self, *, key: str, consume: bool) -> RateLimitResult:
+        """Выполняет проверку (и при consume=True - учет события) одним запросом."""
+        allowed, remaining, retry_after_ms = await self.__script(
+            keys=[key, key + '_ban'],
+            args=[
+                int(time() * 1000),
+                self.window_sec * 1000,
+                self.limit,
+                self.ban_sec * 1000,
+                int(consume),
+                uuid4().hex,
+            ],
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            remaining=int(remaining),
+            retry_after_sec=-(-int(retry_after_ms) // 1000),
+        )
+
+    def keys(self, *, key: str) -> tuple[str, ...]:
+        """Возвращает все ключи Redis политики."""
+        return (key, key + '_ban')
+
+
+class TokenBucketPolicy:
+    """Политика корзины токенов: capacity токенов, пополнение refill_per_sec в секунду."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        capacity: int,
+        refill_per_sec: float,
+    ):
+        self.name = name
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.__script: RedisScriptAsync = redis_script_register_async(script=LUA_TOKEN_BUCKET)
+
+    async def execute(self, *, key: str, consume: bool) -> RateLimitResult:
+        """Выполняет проверку (и при consume=True - списание токена) одним запросом."""
+        allowed, remaining, retry_after_ms = await self.__script(
+            keys=[key],
+            args=[
+                int(time() * 1000),
+                self.capacity,
+                self.refill_per_sec / 1000,
+                int(consume),
+            ],
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            remaining=int(remaining),
+            retry_after_sec=-(-int(retry_after_ms) // 1000),
+        )
+
+    def keys(self, *, key: str) -> tuple[str, ...]:
+        """Возвращает все ключи Redis политики."""
+        return (key,)
+
+
+class RateLimiter:
+    """
+    Класс ограничения частоты запросов.
+
+    Может использоваться напрямую (check / hit / reset) или как зависимость
+    FastAPI: при вызове учитывает запрос и вызывает HTTPException 429
+    при превышении лимита.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: SlidingWindowPolicy | TokenBucketPolicy,
+        key_by: tuple[str, ...] = (RateLimitKeys.IP,),
+    ):
+        self.policy = policy
+        self.key_by = key_by
+
+    async def __call__(self, request: Request) -> None:
+        email: str | None = None
+        if RateLimitKeys.EMAIL in self.key_by:
+            try:
+                body: any = await request.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and isinstance(body.get('email'), str):
+                email = body['email'].lower()
+
+        result: RateLimitResult = await self.hit(
+            email=email,
+            ip=request.client.host if request.client else None,
+        )
+        if not result.allowed:
+            raise HTTPException(
+                detail=f'Превышено количество запросов. Пожалуйста, повторите попытку через {result.retry_after_sec} с.',
+                headers={'Retry-After': str(result.retry_after_sec)},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+        return
+
+    async def check(self, *, email: str | None = None, ip: str | None = None) -> RateLimitResult:
+        """Проверяет лимит без учета события."""
+        return await self.policy.execute(key=self._key(email=email, ip=ip), consume=False)
+
+    async def hit(self, *, email: str | None = None, ip: str | None = None) -> RateLimitResult:
+        """Проверяет лимит и учитывает событие, если лимит не превышен."""
+        return await self.policy.execute(key=self._key(email=email, ip=ip), consume=True)
+
+    async def reset(self, *, email: str | None = None, ip: str | None = None) -> None:
+        """Сбрасывает счетчик лимита."""
+        async with redis_pipeline_async() as batch:
+            for key in self.policy.keys(key=self._key(email=email, ip=ip)):
+                batch.pipeline.delete(key)
+        return
+
+    def _key(self, *, email: str | None, ip: str | None) -> str:
+        """Формирует ключ Redis для указанных источников."""
+        values: dict[str, str | None] = {
+            RateLimitKeys.EMAIL: email,
+            RateLimitKeys.IP: ip,
+        }
+        identity: str = '_'.join(
+            f'{source}:{values.get(source) or "unknown"}'
+            for source in self.key_by
+        )
+        return RedisKeys.RATE_LIMIT.format(policy=self.policy.name, identity=identity)
+
+
+# INFO. Попытка входа учитывается до проверки пароля (hit) и сбрасывается
+#       при успешном входе (см. post_login). Допускается BAD_LOGIN_MAX_ATTEMPTS
+#       неудачных попыток: попытка сверх них еще проверяется, но включает бан.
+RATE_LIMIT_LOGIN_ATTEMPTS: int = settings.BAD_LOGIN_MAX_ATTEMPTS + 1
+
+rate_limiter_login: RateLimiter = RateLimiter(
+    policy=SlidingWindowPolicy(
+        name='login',
+        limit=RATE_LIMIT_LOGIN_ATTEMPTS,
+        window_sec=settings.BAD_LOGIN_EXPIRATION_SEC,
+        ban_sec=settings.BAD_LOGIN_BAN_SEC,
+    ),
+    key_by=(RateLimitKeys.EMAIL,),
+)
+
+rate_limiter_password_reset: RateLimiter = RateLimiter(
+    policy=TokenBucketPolicy(
+        name='password_reset',
+        capacity=5,
+        refill_per_sec=1 / TimeIntervals.SECONDS_IN_5_MINUTES,
+    ),
+    key_by=(RateLimitKeys.EMAIL, RateLimitKeys.IP),
+)
+
+rate_limiter_register: RateLimiter = RateLimiter(
+    policy=SlidingWindowPolicy(
+        name='register',
+        limit=10,
+        window_sec=TimeIntervals.SECONDS_IN_1_HOUR,
+    ),
+    key_by=(RateLimitKeys.IP,),
+)
@@ -0,0 +1,209 @@
+"""
+Модуль кодека данных, сохраняемых в Redis.
+
+Значение сохраняется в Redis с заголовком из 4 байт:
+    - маркер формата: \\x00
+    - сериализатор: j (JSON, orjson) / m (MessagePack)
+    - сжатие: - (без сжатия) / z (zlib)
+    - тип значения: n (структура данных Python) / s (str) / b (bytes) / p (pydantic модель)
+
+Благодаря заголовку значение всегда декодируется в тот же тип данных,
+в котором было сохранено (например, строка "123" не превращается в число 123),
+а смена сериализатора в настройках не ломает уже сохраненные значения.
+
+Сжатие zlib применяется только к данным не меньше compress_min_bytes
+и только если оно действительно уменьшает размер значения.
+
+Значения без заголовка (сохраненные до появления кодека)
+декодируются из JSON, а при ошибке возвращаются как есть.
+
+Модуль не зависит от настроек приложения: экземпляр кодека
+создается в redis_data.py (смотри также src/tests/benchmark_redis_codec.py).
+"""
+
+from datetime import (
+    date,
+    datetime,
+)
+from decimal import Decimal
+import json
+from uuid import UUID
+import zlib
+
+import msgpack
+import orjson
+from pydantic import BaseModel
+
+HEADER_MARKER: bytes = b'\x00'
+HEADER_SIZE: int = 4
+
+
+class CompressionTags:
+    """Класс представления тегов сжатия."""
+
+    NONE: bytes = b'-'
+    ZLIB: bytes = b'z'
+
+
+class TypeTags:
+    """Класс представления тегов типа значения."""
+
+    BYTES: bytes = b'b'
+    MODEL: bytes = b'p'
+    NATIVE: bytes = b'n'
+    STR: bytes = b's'
+
+
+class JsonSerializer:
+    """Класс сериализации в JSON (orjson)."""
+
+    name: str = 'json'
+    tag: bytes = b'j'
+
+    @staticmethod
+    def dumps(value: any) -> bytes:
+        return orjson.dumps(
+            value,
+            default=_serialize_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+    @staticmethod
+    def loads(data: bytes) -> any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer:
+    """Класс бинарной сериализации в MessagePack."""
+
+    name: str = 'msgpack'
+    tag: bytes = b'm'
+
+    @staticmethod
+    def dumps(value: any) -> bytes:
+        return msgpack.packb(
+            value,
+            default=_serialize_default,
+            use_bin_type=True,
+        )
+
+    @staticmethod
+    def loads(data: bytes) -> any:
+        return msgpack.unpackb(
+            data,
+            raw=False,
+            strict_map_key=False,
+        )
+
+
+REDIS_SERIALIZERS: dict[str, type[JsonSerializer] | type[MsgpackSerializer]] = {
+    JsonSerializer.name: JsonSerializer,
+    MsgpackSerializer.name: MsgpackSerializer,
+}
+REDIS_SERIALIZERS_BY_TAG: dict[bytes, type[JsonSerializer] | type[MsgpackSerializer]] = {
+    serializer.tag: serializer for serializer in REDIS_SERIALIZERS.values()
+}
+
+
+class RedisCodec:
+    """
+    Класс кодека данных Redis.
+
+    Вызывает ValueError, если указан неизвестный сериализатор.
+    """
+
+    def __init__(
+        self,
+        *,
+        serializer: str = JsonSerializer.name,
+        compress_min_bytes: int = 1024,
+        compress_level: int = 1,
+    ):
+        if serializer not in REDIS_SERIALIZERS:
+            raise ValueError(
+                f'Неизвестный сериализатор Redis: {serializer}. '
+                f'Допустимые значения: {tuple(REDIS_SERIALIZERS)}',
+            )
+        self.serializer = REDIS_SERIALIZERS[serializer]
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+
+    def encode(self, value: any) -> bytes:
+        """Преобразует значение в байты с заголовком для сохранения в Redis."""
+        if isinstance(value, bytes):
+            type_tag, payload = TypeTags.BYTES, value
+        elif isinstance(value, str):
+            type_tag, payload = TypeTags.STR, value.encode()
+        elif isinstance(value, BaseModel):
+            type_tag, payload = TypeTags.MODEL, self.serializer.dumps(value.model_dump(mode='json'))
+        else:
+            type_tag, payload = TypeTags.NATIVE, self.serializer.dumps(value)
+
+        compression_tag: bytes = CompressionTags.NONE
+        if 0 < self.compress_min_bytes <= len(payload):
+            compressed: bytes = zlib.compress(payload, self.compress_level)
+            if len(compressed) < len(payload):
+                compression_tag, payload = CompressionTags.ZLIB, compressed
+
+        return HEADER_MARKER + self.serializer.tag + compression_tag + type_tag + payload
+
+    def decode(
+        self,
+        data: bytes | str | None,
+        schema: type[BaseModel] | None = None,
+    ) -> any:
+        """
+        Преобразует данные из Redis в типы данных Python.
+
+        Если указана pydantic схема schema, то сохраненная pydantic модель
+        (или структура данных) валидируется в экземпляр этой схемы.
+        """
+        if data is None:
+            return None
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        if len(data) < HEADER_SIZE or data[:1] != HEADER_MARKER:
+            return _decode_legacy(data=data)
+
+        serializer_tag, compression_tag, type_tag = data[1:2], data[2:3], data[3:4]
+        payload: bytes = data[HEADER_SIZE:]
+
+        if compression_tag == CompressionTags.ZLIB:
+            payload = zlib.decompress(payload)
+
+        if type_tag == TypeTags.BYTES:
+            return payload
+        if type_tag == TypeTags.STR:
+            return payload.decode()
+
+        value: any = REDIS_SERIALIZERS_BY_TAG[serializer_tag].loads(payload)
+        if schema is not None:
+            return schema.model_validate(value)
+        return value
+
+
+def _decode_legacy(data: bytes) -> any:
+    """Декодирует значение, сохраненное без заголовка кодека."""
+    try:
+        text: str = data.decode()
+    except UnicodeDecodeError:
+        return data
+    try:
+        return json.loads(s=text)
+    except json.JSONDecodeError:
+        return text
+
+
+def _serialize_default(value: any) -> any:
+    """Преобразует типы данных, не поддерживаемые сериализаторами напрямую."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode='json')
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f'Тип данных {type(value).__name__} не поддерживается кодеком Redis')
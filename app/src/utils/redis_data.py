@@ -3,23 +3,150 @@
 
 Использование хранилища Redis для ручного извлечения и сохранения данных
 осуществляется через функции redis_get и redis_set соответственно.
+Значения сериализуются кодеком redis_codec (смотри redis_codec.py)
+с сохранением типа данных и сжатием больших значений.
+
+В асинхронном коде (FastAPI) используются функции с суффиксом _async, работающие
+через общий асинхронный пул соединений redis_async (создается в lifespan)
+и не блокирующие event loop. Синхронные функции предназначены для Celery.
+
+Для объединения нескольких команд в один сетевой запрос используются
+функции *_many, redis_get_with_ttl и пакетный контекстный менеджер:
+
+    ```
+    async with redis_pipeline_async(binary=True) as batch:
+        batch.pipeline.get(key_1)
+        batch.pipeline.ttl(key_2)
+    value_1, ttl_2 = batch.results
+    value_1 = redis_decode(data=value_1)
+    ```
 
 Для кеширования Response данных используется декоратор @cache_data
-(инициализирован в lifespan при запуске FastAPI в main.py):
+с защитой от одновременного пересчета и отдачей устаревших данных
+на время обновления (смотри cache_decorator.py):
 
     ```
-    from fastapi_cache.decorator import cache
+    from src.utils.cache_decorator import cache_data
     @router.get(...)
-    @cache(expire=10)
+    @cache_data(expire=10)
     async def get(...):
         return Response(...)
     ```
 
+Декоратор @cache из fastapi_cache (инициализирован в lifespan
+при запуске FastAPI в main.py) выполняет простое кеширование по TTL.
+
 """
 
-import json
+from contextlib import (
+    asynccontextmanager,
+    contextmanager,
+)
+from typing import (
+    AsyncGenerator,
+    Generator,
+)
+
+from pydantic import BaseModel
+from redis import Redis
+from redis.asyncio import Redis as RedisAsync
+from redis.asyncio.client import Pipeline as PipelineAsync
+from redis.client import Pipeline
+from redis.commands.core import (
+    AsyncScript,
+    Script,
+)
+
+from src.config.config import settings
+from src.database.database import (
+    redis_async,
+    redis_binary_engine,
+    redis_engine,
+)
+from src.utils.redis_codec import RedisCodec
+
+redis_codec: RedisCodec = RedisCodec(
+    serializer=settings.REDIS_SERIALIZER,
+    compress_min_bytes=settings.REDIS_COMPRESS_MIN_BYTES,
+)
+
+
+class RedisBatch:
+    """
+    Класс пакета команд Redis.
+
+    Команды добавляются в batch.pipeline и отправляются одним сетевым запросом
+    при выходе из контекстного менеджера, после чего их ответы доступны
+    в batch.results в порядке добавления.
+    """
+
+    def __init__(self, *, pipeline: Pipeline | PipelineAsync):
+        self.pipeline = pipeline
+        self.results: list[any] = []
+
+
+class RedisScriptAsync:
+    """
+    Класс Lua скрипта для асинхронного клиента Redis.
+
+    Скрипты объявляются при импорте модулей, а пул соединений создается
+    позже в lifespan, поэтому скрипт регистрируется в клиенте redis_async.engine
+    при первом вызове (и повторно, если пул соединений был пересоздан).
+    """
+
+    def __init__(self, *, script: str):
+        self.script = script
+        self.__registered: AsyncScript | None = None
+
+    async def __call__(self, keys: list[any] | None = None, args: list[any] | None = None) -> any:
+        engine: RedisAsync = redis_async.engine
+        if self.__registered is None or self.__registered.registered_client is not engine:
+            self.__registered = engine.register_script(self.script)
+        return await self.__registered(keys=keys, args=args)
+
+
+@contextmanager
+def redis_pipeline(
+    transaction: bool = False,
+    binary: bool = False,
+) -> Generator[RedisBatch, None, None]:
+    """
+    Пакетный контекстный менеджер для синхронного кода (Celery).
+
+    Если binary=True, то ответы возвращаются в байтах (для значений redis_codec).
+    """
+    engine: Redis = redis_binary_engine if binary else redis_engine
+    with engine.pipeline(transaction=transaction) as pipeline:
+        batch: RedisBatch = RedisBatch(pipeline=pipeline)
+        yield batch
+        batch.results = pipeline.execute()
+
+
+@asynccontextmanager
+async def redis_pipeline_async(
+    transaction: bool = False,
+    binary: bool = False,
+) -> AsyncGenerator[RedisBatch, None]:
+    """
+    Пакетный контекстный менеджер для асинхронного кода (FastAPI).
+
+    Если binary=True, то ответы возвращаются в байтах (для значений redis_codec).
+    """
+    engine: RedisAsync = redis_async.binary if binary else redis_async.engine
+    async with engine.pipeline(transaction=transaction) as pipeline:
+        batch: RedisBatch = RedisBatch(pipeline=pipeline)
+        yield batch
+        batch.results = await pipeline.execute()
+
+
+def redis_decode(data: any, schema: type[BaseModel] | None = None) -> any:
+    """Преобразует данные из Redis в типы данных Python (смотри redis_codec.py)."""
+    return redis_codec.decode(data=data, schema=schema)
 
-from src.database.database import redis_engine
+
+def redis_encode(value: any) -> bytes:
+    """Преобразует данные Python в байты с заголовком кодека для сохранения в Redis."""
+    return redis_codec.encode(value=value)
 
 
 def redis_delete(key: str) -> None:
@@ -31,24 +158,21 @@ def redis_delete(key: str) -> None:
 def redis_get(
     key: str,
     get_ttl: bool = False,
+    schema: type[BaseModel] | None = None,
 ) -> any:
     """
     Извлекает данные из Redis по указанному ключу
-    в типах данных Python.
+    в типах данных Python (декодируются кодеком redis_codec).
 
+    Значения, сохраненные до появления кодека, декодируются из JSON,
+    а при ошибке возвращаются строкой.
     Если get_ttl=True, то возвращается TTL в секундах (-1, если ключа не существует).
+    Если указана pydantic схема schema, то возвращается экземпляр этой схемы.
     """
-    data: any = redis_engine.get(name=key)
-    if data is not None:
-        try:
-            data: any = json.loads(s=data)
-        except json.JSONDecodeError:
-            pass
-
     if get_ttl:
-        return data, redis_engine.ttl(name=key)
+        return redis_get_with_ttl(key=key, schema=schema)
 
-    return data
+    return redis_decode(data=redis_binary_engine.get(name=key), schema=schema)
 
 
 def redis_get_ttl(key: str) -> int:
@@ -59,17 +183,239 @@ def redis_get_ttl(key: str) -> int:
     return redis_engine.ttl(name=key)
 
 
+def redis_get_many(
+    keys: list[str],
+    schema: type[BaseModel] | None = None,
+) -> list[any]:
+    """
+    Извлекает данные из Redis по нескольким ключам одной командой MGET.
+
+    Возвращает список значений, декодированных кодеком redis_codec,
+    в порядке ключей (None для отсутствующих).
+    """
+    if not keys:
+        return []
+    return [redis_decode(data=data, schema=schema) for data in redis_binary_engine.mget(keys)]
+
+
+def redis_get_with_ttl(
+    key: str,
+    schema: type[BaseModel] | None = None,
+) -> tuple[any, int]:
+    """
+    Извлекает данные (декодированные кодеком redis_codec) и TTL из Redis
+    по указанному ключу одним сетевым запросом (pipeline).
+    """
+    with redis_pipeline(binary=True) as batch:
+        batch.pipeline.get(name=key)
+        batch.pipeline.ttl(name=key)
+    data, ttl = batch.results
+    return redis_decode(data=data, schema=schema), ttl
+
+
+def redis_set_many(
+    items: dict[str, any],
+    ex_sec: int | dict[str, int] = 10,
+) -> None:
+    """
+    Сохраняет данные в Redis по нескольким ключам одним сетевым запросом (pipeline).
+
+    Значения сериализуются кодеком redis_codec, как в redis_set.
+    ex_sec может быть общим TTL или словарем TTL по ключам.
+    """
+    if not items:
+        return
+    with redis_pipeline(binary=True) as batch:
+        for key, value in items.items():
+            batch.pipeline.set(
+                name=key,
+                value=redis_encode(value=value),
+                ex=ex_sec.get(key) if isinstance(ex_sec, dict) else ex_sec,
+            )
+    return
+
+
 def redis_set(key: str, value: any, ex_sec: int = 10) -> None:
     """
     Сохраняет данные в Redis по указанному ключу.
 
-    Преобразует тип данных dict в JSON.
+    Значение любого типа сериализуется кодеком redis_codec (REDIS_SERIALIZER)
+    с заголовком типа данных, поэтому redis_get возвращает значение того же типа.
+    Значения не меньше REDIS_COMPRESS_MIN_BYTES сжимаются.
+    """
+    redis_binary_engine.set(
+        name=key,
+        value=redis_encode(value=value),
+        ex=ex_sec,
+    )
+    return
+
+
+def redis_set_add(key: str, *values: any) -> None:
+    """
+    Добавляет значения в множество (SET) Redis по указанному ключу.
+
+    Элементы множества не кодируются redis_codec и хранятся строками.
+    """
+    redis_engine.sadd(key, *values)
+    return
+
+
+def redis_set_remove(key: str, *values: any) -> None:
+    """Удаляет значения из множества (SET) Redis по указанному ключу."""
+    redis_engine.srem(key, *values)
+    return
+
+
+def redis_set_is_member(key: str, value: any) -> bool:
+    """Проверяет наличие значения во множестве (SET) Redis по указанному ключу."""
+    return bool(redis_engine.sismember(name=key, value=value))
+
+
+def redis_script_register(script: str) -> Script:
+    """
+    Регистрирует Lua скрипт в Redis.
+
+    Возвращает объект Script, который выполняется атомарно через EVALSHA
+    (с автоматическим EVAL, если скрипт отсутствует в кэше Redis):
+
+        script(keys=[...], args=[...])
+    """
+    return redis_engine.register_script(script)
+
+
+async def redis_delete_async(key: str) -> None:
+    """Удаляет данные из Redis по указанному ключу."""
+    await redis_async.engine.delete(key)
+    return
+
+
+async def redis_get_async(
+    key: str,
+    get_ttl: bool = False,
+    schema: type[BaseModel] | None = None,
+) -> any:
+    """
+    Извлекает данные из Redis по указанному ключу
+    в типах данных Python (декодируются кодеком redis_codec).
+
+    Значения, сохраненные до появления кодека, декодируются из JSON,
+    а при ошибке возвращаются строкой.
+    Если get_ttl=True, то возвращается TTL в секундах (-1, если ключа не существует).
+    Если указана pydantic схема schema, то возвращается экземпляр этой схемы.
+    """
+    if get_ttl:
+        return await redis_get_with_ttl_async(key=key, schema=schema)
+
+    return redis_decode(data=await redis_async.binary.get(name=key), schema=schema)
+
+
+async def redis_get_ttl_async(key: str) -> int:
+    """
+    Извлекает TTL из Redis по указанному ключу
+    (-1, если ключа не существует).
+    """
+    return await redis_async.engine.ttl(name=key)
+
+
+async def redis_get_many_async(
+    keys: list[str],
+    schema: type[BaseModel] | None = None,
+) -> list[any]:
+    """
+    Извлекает данные из Redis по нескольким ключам одной командой MGET.
+
+    Возвращает список значений, декодированных кодеком redis_codec,
+    в порядке ключей (None для отсутствующих).
+    """
+    if not keys:
+        return []
+    return [
+        redis_decode(data=data, schema=schema)
+        for data in await redis_async.binary.mget(keys)
+    ]
+
+
+async def redis_get_with_ttl_async(
+    key: str,
+    schema: type[BaseModel] | None = None,
+) -> tuple[any, int]:
+    """
+    Извлекает данные (декодированные кодеком redis_codec) и TTL из Redis
+    по указанному ключу одним сетевым запросом (pipeline).
+    """
+    async with redis_pipeline_async(binary=True) as batch:
+        batch.pipeline.get(name=key)
+        batch.pipeline.ttl(name=key)
+    data, ttl = batch.results
+    return redis_decode(data=data, schema=schema), ttl
+
+
+async def redis_set_many_async(
+    items: dict[str, any],
+    ex_sec: int | dict[str, int] = 10,
+) -> None:
+    """
+    Сохраняет данные в Redis по нескольким ключам одним сетевым запросом (pipeline).
+
+    Значения сериализуются кодеком redis_codec, как в redis_set.
+    ex_sec может быть общим TTL или словарем TTL по ключам.
+    """
+    if not items:
+        return
+    async with redis_pipeline_async(binary=True) as batch:
+        for key, value in items.items():
+            batch.pipeline.set(
+                name=key,
+                value=redis_encode(value=value),
+                ex=ex_sec.get(key) if isinstance(ex_sec, dict) else ex_sec,
+            )
+    return
+
+
+async def redis_set_async(key: str, value: any, ex_sec: int = 10) -> None:
+    """
+    Сохраняет данные в Redis по указанному ключу.
+
+    Значение любого типа сериализуется кодеком redis_codec (REDIS_SERIALIZER)
+    с заголовком типа данных, поэтому redis_get возвращает значение того же типа.
+    Значения не меньше REDIS_COMPRESS_MIN_BYTES сжимаются.
     """
-    if isinstance(value, dict):
-        value = json.dumps(value)
-    redis_engine.set(
+    await redis_async.binary.set(
         name=key,
-        value=value,
+        value=redis_encode(value=value),
         ex=ex_sec,
     )
     return
+
+
+async def redis_set_add_async(key: str, *values: any) -> None:
+    """
+    Добавляет значения в множество (SET) Redis по указанному ключу.
+
+    Элементы множества не кодируются redis_codec и хранятся строками.
+    """
+    await redis_async.engine.sadd(key, *values)
+    return
+
+
+async def redis_set_remove_async(key: str, *values: any) -> None:
+    """Удаляет значения из множества (SET) Redis по указанному ключу."""
+    await redis_async.engine.srem(key, *values)
+    return
+
+
+async def redis_set_is_member_async(key: str, value: any) -> bool:
+    """Проверяет наличие значения во множестве (SET) Redis по указанному ключу."""
+    return bool(await redis_async.engine.sismember(name=key, value=value))
+
+
+def redis_script_register_async(script: str) -> RedisScriptAsync:
+    """
+    Регистрирует Lua скрипт в Redis для асинхронного клиента.
+
+    Возвращает объект RedisScriptAsync, который выполняется атомарно через EVALSHA:
+
+        await script(keys=[...], args=[...])
+    """
+    return RedisScriptAsync(script=script)
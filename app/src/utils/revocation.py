@@ -0,0 +1,150 @@
+"""
+Модуль с вспомогательными функциями приложения "auth".
+
+Включает в себя функции отзыва доступа пользователей и JWT токенов.
+
+Заблокированные (is_active=False) и удаленные пользователи
+хранятся компактным множеством id в Redis: проверка доступа по JWT токену
+выполняется одной командой SISMEMBER без запроса строки пользователя в БД.
+
+Отзыв JWT токенов:
+    - точечный: jti токена сохраняется в Redis до истечения срока его жизни
+    - всех токенов пользователя: сохраняется минимальная допустимая версия (ver),
+      токены с меньшей версией считаются отозванными (O(1), одна команда SET)
+"""
+
+from time import time
+
+from sqlalchemy import select
+
+from src.config.config import settings
+from src.database.database import (
+    AsyncSession,
+    RedisKeys,
+)
+from src.models.user import User
+from src.utils.redis_data import (
+    redis_decode,
+    redis_pipeline_async,
+    redis_set_add_async,
+    redis_set_async,
+    redis_set_is_member_async,
+    redis_set_remove_async,
+)
+
+
+async def revocation_user_add(user_id: int) -> None:
+    """Отзывает доступ пользователя."""
+    await redis_set_add_async(RedisKeys.AUTH_REVOKED_USERS, user_id)
+    return
+
+
+async def revocation_user_remove(user_id: int) -> None:
+    """Восстанавливает доступ пользователя."""
+    await redis_set_remove_async(RedisKeys.AUTH_REVOKED_USERS, user_id)
+    return
+
+
+async def revocation_user_is_revoked(user_id: int) -> bool:
+    """Проверяет, отозван ли доступ пользователя."""
+    return await redis_set_is_member_async(key=RedisKeys.AUTH_REVOKED_USERS, value=user_id)
+
+
+def revocation_user_should_be_revoked(user: any) -> bool:
+    """Проверяет по строке пользователя, должен ли быть отозван его доступ (is_active=False)."""
+    return not user.is_active
+
+
+async def revocation_user_sync(user: any) -> None:
+    """
+    Синхронизирует множество отозванных пользователей с актуальной строкой
+    пользователя (например, строкой RETURNING запроса UPDATE).
+
+    Состояние вычисляется по строке после обновления, а не по обновляемым полям.
+    """
+    if revocation_user_should_be_revoked(user=user):
+        await revocation_user_add(user_id=user.id)
+    else:
+        await revocation_user_remove(user_id=user.id)
+    return
+
+
+async def revocation_users_backfill(session: AsyncSession, batch_size: int = 1000) -> int:
+    """
+    Добавляет в множество отозванных пользователей всех заблокированных
+    пользователей из БД (однократно после ввода множества,
+    смотри AUTH_REVOKED_USERS_IS_AUTHORITATIVE).
+
+    Возвращает количество найденных пользователей.
+    """
+    count: int = 0
+    user_ids: list[int] = []
+    async for user_id in await session.stream_scalars(select(User.id).where(User.is_active.is_(False))):
+        user_ids.append(user_id)
+        if len(user_ids) >= batch_size:
+            await redis_set_add_async(RedisKeys.AUTH_REVOKED_USERS, *user_ids)
+            count += len(user_ids)
+            user_ids = []
+    if user_ids:
+        await redis_set_add_async(RedisKeys.AUTH_REVOKED_USERS, *user_ids)
+        count += len(user_ids)
+    return count
+
+
+async def revocation_token_add(payload: dict[str, any]) -> None:
+    """Отзывает JWT токен по его jti до истечения срока его жизни."""
+    jti: str | None = payload.get('jti')
+    ex_sec: int = int(payload.get('exp', 0) - time())
+    if jti is None or ex_sec <= 0:
+        return
+    await redis_set_async(
+        key=RedisKeys.AUTH_REVOKED_JTI.format(jti=jti),
+        value=1,
+        ex_sec=ex_sec,
+    )
+    return
+
+
+async def revocation_user_tokens_revoke_all(user_id: int) -> None:
+    """
+    Отзывает все выпущенные ранее JWT токены пользователя.
+
+    Ключ хранится не дольше срока жизни токена обновления:
+    после этого все отозванные токены истекают сами.
+    """
+    await redis_set_async(
+        key=RedisKeys.AUTH_USER_TOKEN_VERSION_MIN.format(user_id=user_id),
+        value=int(time() * 1000),
+        ex_sec=settings.JWT_REFRESH_EXPIRATION_SEC,
+    )
+    return
+
+
+async def revocation_payload_is_revoked(payload: dict[str, any]) -> bool:
+    """
+    Проверяет, отозван ли JWT токен:
+        - отозван доступ пользователя
+        - отозван jti токена
+        - версия токена ниже минимальной допустимой версии пользователя
+    """
+    user_id: int = int(payload.get('sub'))
+    jti: str | None = payload.get('jti')
+
+    # INFO. Все проверки выполняются одним сетевым запросом (pipeline).
+    async with redis_pipeline_async(binary=True) as batch:
+        batch.pipeline.sismember(name=RedisKeys.AUTH_REVOKED_USERS, value=user_id)
+        batch.pipeline.get(name=RedisKeys.AUTH_REVOKED_JTI.format(jti=jti))
+        batch.pipeline.get(name=RedisKeys.AUTH_USER_TOKEN_VERSION_MIN.format(user_id=user_id))
+    is_user_revoked, is_jti_revoked, version_min = batch.results
+
+    if is_user_revoked:
+        return True
+
+    if jti is not None and is_jti_revoked is not None:
+        return True
+
+    version_min: int | None = redis_decode(data=version_min)
+    if version_min is not None and payload.get('ver', 0) < version_min:
+        return True
+
+    return False
@@ -0,0 +1,115 @@
+"""
+Модуль с тестами двухуровневого кэша и тегов кэша.
+"""
+
+import asyncio
+from typing import (
+    AsyncGenerator,
+    Generator,
+)
+from uuid import uuid4
+
+import pytest
+
+from src.database.database import (
+    RedisKeys,
+    redis_async,
+)
+from src.utils.cache import (
+    CACHE_REGISTRY,
+    INVALIDATION_ALL,
+    INVALIDATION_PROCESS_ID,
+    INVALIDATION_SEPARATOR,
+    TAG_PURGE_BATCH_SIZE,
+    TieredCache,
+    cache_invalidation_listen,
+    cache_tags_add,
+    cache_tags_purge,
+)
+
+
+@pytest.fixture()
+def tiered_cache() -> Generator[TieredCache, None, None]:
+    """Двухуровневый кэш с уникальным пространством имен."""
+    cache: TieredCache = TieredCache(namespace=f'test_{uuid4().hex}', ex_sec=60)
+    yield cache
+    CACHE_REGISTRY.pop(cache.namespace, None)
+
+
+@pytest.fixture()
+async def invalidation_listener() -> AsyncGenerator[None, None]:
+    """Запускает слушатель инвалидации, как lifespan, и дожидается подписки."""
+    task: asyncio.Task = asyncio.create_task(cache_invalidation_listen())
+    for _ in range(100):
+        if (await redis_async.engine.pubsub_numsub(RedisKeys.CACHE_INVALIDATION_CHANNEL))[0][1]:
+            break
+        await asyncio.sleep(0.01)
+    yield
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _publish(process_id: str, namespace: str, key: str) -> None:
+    """Публикует сообщение инвалидации от имени процесса process_id."""
+    await redis_async.engine.publish(
+        RedisKeys.CACHE_INVALIDATION_CHANNEL,
+        INVALIDATION_SEPARATOR.join((process_id, namespace, key)),
+    )
+
+
+async def _wait_local_deleted(cache: TieredCache, key: str) -> bool:
+    """Ожидает удаления ключа из локального кэша (до 1 секунды)."""
+    for _ in range(100):
+        if cache.local.get(key=key) is None:
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+async def test_tiered_cache_levels(tiered_cache: TieredCache) -> None:
+    """Чтение проверяет локальный кэш, затем Redis с сохранением в локальный кэш."""
+    await tiered_cache.set(key='key', value={'id': 1})
+    assert await tiered_cache.get(key='key') == {'id': 1}
+    assert tiered_cache.hits_local == 1
+
+    tiered_cache.local.clear()
+    assert await tiered_cache.get(key='key') == {'id': 1}
+    assert tiered_cache.hits_redis == 1
+    assert tiered_cache.local.get(key='key') is not None
+
+    await tiered_cache.delete(key='key')
+    assert await tiered_cache.get(key='key') is None
+    assert tiered_cache.misses_redis == 1
+
+
+async def test_tiered_cache_invalidation_pubsub(tiered_cache: TieredCache, invalidation_listener: None) -> None:
+    """Сообщение другого воркера удаляет ключ из локального кэша, собственное - пропускается."""
+    tiered_cache.local.set(key='key_1', data=b'data')
+    tiered_cache.local.set(key='key_2', data=b'data')
+
+    await _publish(process_id=INVALIDATION_PROCESS_ID, namespace=tiered_cache.namespace, key='key_2')
+    await _publish(process_id='other', namespace=tiered_cache.namespace, key='key_1')
+
+    assert await _wait_local_deleted(cache=tiered_cache, key='key_1')
+    assert tiered_cache.local.get(key='key_2') is not None
+
+    await _publish(process_id='other', namespace=tiered_cache.namespace, key=INVALIDATION_ALL)
+    assert await _wait_local_deleted(cache=tiered_cache, key='key_2')
+
+
+async def test_cache_tags_purge_batches() -> None:
+    """Все записи тега удаляются пачками, множество тега удаляется."""
+    tag: str = f'test:{uuid4().hex}'
+    keys: list[str] = [f'{RedisKeys.PREFIX}test_{uuid4().hex}' for _ in range(TAG_PURGE_BATCH_SIZE * 2 + 1)]
+    async with redis_async.engine.pipeline(transaction=False) as pipeline:
+        for key in keys:
+            pipeline.set(key, 1, ex=60)
+        await pipeline.execute()
+    for key in keys:
+        await cache_tags_add(key=key, tags=(tag,), ex_sec=60)
+
+    await cache_tags_purge(tags=(tag,))
+
+    assert await redis_async.engine.exists(*keys) == 0
+    assert await redis_async.engine.exists(RedisKeys.CACHE_TAG.format(tag=tag)) == 0
+    assert not [key async for key in redis_async.engine.scan_iter(match=RedisKeys.CACHE_TAG.format(tag=tag) + '*')]
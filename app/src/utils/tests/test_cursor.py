@@ -0,0 +1,76 @@
+"""
+Модуль с тестами функций курсорной (keyset) пагинации.
+"""
+
+from base64 import urlsafe_b64encode
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi import HTTPException
+import pytest
+
+from src.api.v1.crud.user import user_v1_crud
+from src.database.database import AsyncSession
+from src.utils.cursor import (
+    cursor_decode,
+    cursor_encode,
+)
+
+
+def _cursor_raw(data: bytes) -> str:
+    """Кодирует произвольные байты так же, как cursor_encode."""
+    return urlsafe_b64encode(data).decode().rstrip('=')
+
+
+@pytest.mark.parametrize(
+    ('values', 'sort_type'),
+    (
+        ([42], None),
+        (['Товар', 42], str),
+        ([100, 42], int),
+        ([1.5, 42], float),
+        ([Decimal('10.25'), 42], Decimal),
+        ([datetime(2024, 1, 2, 3, 4, 5), 42], datetime),
+    ),
+)
+def test_cursor_encode_decode(values: list[any], sort_type: type | None) -> None:
+    """Значения ключа сортировки восстанавливаются из курсора с типом колонки."""
+    cursor: str = cursor_encode(values=values)
+
+    assert '=' not in cursor
+    assert cursor_decode(cursor=cursor, sort_type=sort_type) == values
+
+
+@pytest.mark.parametrize(
+    ('cursor', 'sort_type'),
+    (
+        ('не base64', None),
+        (_cursor_raw(b'\xff\xfe'), None),
+        (_cursor_raw(b'{"id":1}'), None),
+        (_cursor_raw(b'[]'), None),
+        (_cursor_raw(b'[1,2]'), None),
+        (_cursor_raw(b'["1"]'), None),
+        (_cursor_raw(b'[true]'), None),
+        (_cursor_raw(b'[1.5]'), None),
+        (_cursor_raw(b'[42]'), str),
+        (_cursor_raw(b'[null,42]'), str),
+        (_cursor_raw(b'[100,42]'), str),
+        (_cursor_raw(b'["100",42]'), int),
+        (_cursor_raw(b'["not a date",42]'), datetime),
+        (_cursor_raw(b'["not a number",42]'), Decimal),
+        (_cursor_raw(b'[{"a":1},42]'), object),
+    ),
+)
+def test_cursor_decode_tampered(cursor: str, sort_type: type | None) -> None:
+    """Подделанный курсор вызывает ошибку 422, а не ошибку базы данных."""
+    with pytest.raises(HTTPException) as exc_info:
+        cursor_decode(cursor=cursor, sort_type=sort_type)
+
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.detail['loc'] == ['query', 'cursor']
+
+
+async def test_retrieve_page_after_nullable_column(test_async_session: AsyncSession) -> None:
+    """Сортировка по колонке, допускающей NULL, не поддерживается keyset пагинацией."""
+    with pytest.raises(ValueError):
+        await user_v1_crud.retrieve_page_after(order_by='password_hashed', session=test_async_session)
@@ -0,0 +1,111 @@
+"""
+Модуль с тестами функций работы с JWT токенами.
+"""
+
+from time import time
+from typing import Generator
+
+from fastapi import HTTPException
+from jose import jwt
+import pytest
+
+from src.config.config import settings
+from src.utils import jwt as jwt_module
+from src.utils.jwt import (
+    jwt_decode,
+    jwt_generate_pair,
+    jwt_keyring,
+    jwt_verified_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def jwt_verified_cache_clear() -> Generator[None, None, None]:
+    """Очищает кэш проверенных токенов: каждый тест проверяет подпись заново."""
+    jwt_verified_cache.clear()
+    yield
+    jwt_verified_cache.clear()
+
+
+def test_jwt_generate_pair_decode() -> None:
+    """Выпущенные токены проверяются без await и содержат claims пользователя и тип."""
+    access_token, exp_access, refresh_token, exp_refresh = jwt_generate_pair(
+        user_id=1,
+        is_admin=True,
+    )
+
+    access_payload: dict[str, any] = jwt_decode(jwt_token=access_token)
+    assert access_payload['sub'] == '1'
+    assert access_payload['is_admin'] is True
+    assert access_payload['type'] == settings.JWT_TYPE_ACCESS
+    assert access_payload['exp'] == exp_access
+
+    refresh_payload: dict[str, any] = jwt_decode(jwt_token=refresh_token)
+    assert refresh_payload['type'] == settings.JWT_TYPE_REFRESH
+    assert refresh_payload['exp'] == exp_refresh
+    assert refresh_payload['jti'] != access_payload['jti']
+
+
+def test_jwt_generate_pair_is_to_refresh() -> None:
+    """При is_to_refresh выпускается только токен доступа."""
+    access_token, _, refresh_token, exp_refresh = jwt_generate_pair(user_id=1, is_to_refresh=True)
+
+    assert jwt_decode(jwt_token=access_token)['type'] == settings.JWT_TYPE_ACCESS
+    assert refresh_token is None
+    assert exp_refresh is None
+
+
+def test_jwt_decode_kid_header_fast_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Токены с заголовком связки ключей проверяются без разбора заголовка python-jose."""
+    def _jwt_verify_jose(token: str) -> None:
+        raise AssertionError('Токен со знакомым заголовком проверен python-jose')
+
+    monkeypatch.setattr(jwt_module, '_jwt_verify_jose', _jwt_verify_jose)
+    access_token, *_ = jwt_generate_pair(user_id=1)
+
+    header: dict[str, any] = jwt.get_unverified_header(token=access_token)
+    assert header['kid'] == jwt_keyring.kid_active
+    assert header['alg'] == settings.JWT_ALGORITHM
+    assert jwt_keyring.kid_by_header_segment(header_segment=access_token.partition('.')[0]) == jwt_keyring.kid_active
+    assert jwt_decode(jwt_token=access_token)['sub'] == '1'
+
+
+@pytest.mark.skipif(jwt_keyring.is_asymmetric, reason='Токены без kid подписывались общим секретом')
+def test_jwt_decode_legacy_token_without_kid() -> None:
+    """Токены без kid (выпущенные до появления связки ключей) проверяются python-jose."""
+    legacy_token: str = jwt.encode(
+        claims={
+            'sub': '1',
+            'type': settings.JWT_TYPE_ACCESS,
+            'exp': int(time()) + settings.JWT_ACCESS_EXPIRATION_SEC,
+        },
+        key=settings.SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+
+    assert 'kid' not in jwt.get_unverified_header(token=legacy_token)
+    assert jwt_keyring.kid_by_header_segment(header_segment=legacy_token.partition('.')[0]) is None
+    assert jwt_decode(jwt_token=legacy_token)['sub'] == '1'
+
+
+def test_jwt_decode_expired() -> None:
+    """Токен с истекшим сроком жизни отклоняется с кодом 401."""
+    # INFO. Для неизвестного типа токена срок жизни равен 0: токен истекает сразу.
+    expired_token, exp_unix = jwt_module._jwt_generate(claims={'sub': '1'}, token_type='unknown')
+    assert exp_unix <= time()
+
+    with pytest.raises(HTTPException) as exc_info:
+        jwt_decode(jwt_token=expired_token)
+    assert exc_info.value.status_code == 401
+
+
+def test_jwt_decode_signature_invalid() -> None:
+    """Токен с измененным payload отклоняется с кодом 401."""
+    access_token, *_ = jwt_generate_pair(user_id=1)
+    _, _, refresh_token, _ = jwt_generate_pair(user_id=2, is_admin=True)
+    header_segment, payload_segment, _ = refresh_token.split('.')
+    forged_token: str = '.'.join((header_segment, payload_segment, access_token.rsplit('.', 1)[1]))
+
+    with pytest.raises(HTTPException) as exc_info:
+        jwt_decode(jwt_token=forged_token)
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,58 @@
+"""
+Модуль с тестами одноразовых токенов.
+"""
+
+import asyncio
+from uuid import uuid4
+
+from src.database.database import (
+    RedisKeys,
+    redis_async,
+)
+from src.utils.one_shot_token import (
+    ONE_SHOT_TOKEN_PURPOSE_PASSWORD_RESET,
+    one_shot_token_consume,
+    one_shot_token_digest,
+)
+
+PURPOSE: str = ONE_SHOT_TOKEN_PURPOSE_PASSWORD_RESET
+
+
+async def test_one_shot_token_consume_single_use() -> None:
+    """Токен "погашается" только при первом использовании."""
+    token: str = uuid4().hex
+
+    assert await one_shot_token_consume(purpose=PURPOSE, token=token, ex_sec=60) is True
+    assert await one_shot_token_consume(purpose=PURPOSE, token=token, ex_sec=60) is False
+    # INFO. Назначение токена входит в ключ: токены разного назначения не пересекаются.
+    assert await one_shot_token_consume(purpose='other', token=token, ex_sec=60) is True
+
+
+async def test_one_shot_token_consume_expiry() -> None:
+    """Отметка использования хранится ex_sec секунд, после чего токен снова принимается."""
+    token: str = uuid4().hex
+    key: str = RedisKeys.AUTH_ONE_SHOT_TOKEN.format(purpose=PURPOSE, digest=one_shot_token_digest(token=token))
+
+    assert await one_shot_token_consume(purpose=PURPOSE, token=token, ex_sec=1) is True
+    assert 0 < await redis_async.engine.pttl(key) <= 1000
+
+    await asyncio.sleep(1.1)
+    assert await one_shot_token_consume(purpose=PURPOSE, token=token, ex_sec=1) is True
+
+
+async def test_one_shot_token_consume_concurrent() -> None:
+    """Из одновременных запросов с одним токеном токен "погашает" только один."""
+    token: str = uuid4().hex
+
+    results: list[bool] = await asyncio.gather(
+        *(one_shot_token_consume(purpose=PURPOSE, token=token, ex_sec=60) for _ in range(20)),
+    )
+    assert results.count(True) == 1
+
+
+async def test_one_shot_token_consume_legacy_key() -> None:
+    """Токен, отмеченный ключом устаревшего формата, считается использованным."""
+    token: str = uuid4().hex
+    await redis_async.engine.set(RedisKeys.USED_PASSWORD_RESET_TOKEN_LEGACY.format(reset_token=token), 1, ex=60)
+
+    assert await one_shot_token_consume(purpose=PURPOSE, token=token, ex_sec=60) is False
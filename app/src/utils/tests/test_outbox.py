@@ -0,0 +1,95 @@
+"""
+Модуль с тестами очереди исходящих задач Celery (transactional outbox).
+"""
+
+import pytest
+from sqlalchemy import select
+
+from src.celery_app.auth.tasks import send_password_has_changed_to_mail_task
+from src.celery_app.celery_app import celery_app
+from src.conftest import test_async_session_maker
+from src.database.database import AsyncSession
+from src.models.outbox import OutboxTask
+from src.utils import outbox as outbox_module
+from src.utils.outbox import (
+    outbox_relay_batch,
+    outbox_task_add,
+)
+
+
+@pytest.fixture()
+def tasks_sent(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, list, dict]]:
+    """
+    Подменяет отправку задач в брокер и сессии ретранслятора.
+
+    Возвращает список отправленных задач (имя, args, kwargs).
+    """
+    sent: list[tuple[str, list, dict]] = []
+
+    def _send_task(name: str, args: list, kwargs: dict, **options: any) -> None:
+        sent.append((name, args, kwargs))
+        return
+
+    monkeypatch.setattr(celery_app, 'send_task', _send_task)
+    monkeypatch.setattr(outbox_module, 'async_session_maker', test_async_session_maker)
+    return sent
+
+
+async def _outbox_task_enqueue(session: AsyncSession) -> None:
+    """Добавляет задачу в очередь и фиксирует ее commit сессии."""
+    outbox_task_add(
+        session=session,
+        task=send_password_has_changed_to_mail_task,
+        args=('Имя Фамилия', 'user@example.com'),
+    )
+    await session.commit()
+    return
+
+
+async def test_outbox_task_not_visible_before_commit(
+    test_async_session: AsyncSession,
+    tasks_sent: list[tuple[str, list, dict]],
+) -> None:
+    """Задача без commit не видна ретранслятору и не отправляется."""
+    outbox_task_add(
+        session=test_async_session,
+        task=send_password_has_changed_to_mail_task,
+        args=('Имя Фамилия', 'user@example.com'),
+    )
+    await test_async_session.flush()
+
+    assert await outbox_relay_batch() == 0
+    assert tasks_sent == []
+
+
+async def test_outbox_relay_batch_sends_and_deletes(
+    test_async_session: AsyncSession,
+    tasks_sent: list[tuple[str, list, dict]],
+) -> None:
+    """Зафиксированная задача отправляется в брокер и удаляется из очереди."""
+    await _outbox_task_enqueue(session=test_async_session)
+
+    assert await outbox_relay_batch() == 1
+    assert tasks_sent == [
+        (send_password_has_changed_to_mail_task.name, ['Имя Фамилия', 'user@example.com'], {}),
+    ]
+    assert (await test_async_session.execute(select(OutboxTask.id))).all() == []
+
+
+async def test_outbox_relay_batch_skips_locked(
+    test_async_session: AsyncSession,
+    tasks_sent: list[tuple[str, list, dict]],
+) -> None:
+    """Строки, заблокированные другим ретранслятором (FOR UPDATE), пропускаются (SKIP LOCKED)."""
+    await _outbox_task_enqueue(session=test_async_session)
+
+    async with test_async_session_maker() as session_other:
+        await session_other.execute(select(OutboxTask.id).with_for_update())
+
+        assert await outbox_relay_batch() == 0
+        assert tasks_sent == []
+
+        await session_other.rollback()
+
+    assert await outbox_relay_batch() == 1
+    assert len(tasks_sent) == 1
@@ -0,0 +1,125 @@
+"""
+Модуль с тестами функций хэширования паролей.
+"""
+
+import asyncio
+from base64 import b64encode
+from hashlib import pbkdf2_hmac
+from threading import Event
+
+from fastapi import HTTPException
+import pytest
+
+from src.config.config import settings
+from src.utils.password import (
+    PASSWORD_HASHER_CURRENT,
+    SALT,
+    SEPARATOR,
+    PasswordHashPool,
+    Pbkdf2Hasher,
+    ScryptHasher,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+
+PASSWORD: str = 'Password_1'
+
+
+@pytest.mark.parametrize(
+    ('hasher', 'cost'),
+    (
+        (Pbkdf2Hasher, 'sha256:1000'),
+        (ScryptHasher, '1024:8:1'),
+    ),
+)
+def test_hasher_verify(hasher: type[Pbkdf2Hasher] | type[ScryptHasher], cost: str) -> None:
+    """Хэш любого поддерживаемого алгоритма проверяется по сохраненной стоимости."""
+    salt: bytes = b'0123456789abcdef'
+    digest: bytes = hasher.digest(password=PASSWORD.encode(), salt=salt, cost=cost)
+    hashed_password: str = SEPARATOR.join(
+        (hasher.algorithm, cost, b64encode(salt).decode(), b64encode(digest).decode()),
+    )
+
+    assert verify_password(raw_password=PASSWORD, hashed_password=hashed_password)
+    assert not verify_password(raw_password='Password_2', hashed_password=hashed_password)
+
+
+def test_hash_password_current() -> None:
+    """Новый хэш создается текущим алгоритмом с индивидуальной солью."""
+    hashed_password: str = hash_password(raw_password=PASSWORD)
+
+    assert hashed_password.split(SEPARATOR)[:2] == [
+        PASSWORD_HASHER_CURRENT.algorithm,
+        PASSWORD_HASHER_CURRENT.cost_current(),
+    ]
+    assert hashed_password != hash_password(raw_password=PASSWORD)
+    assert verify_password(raw_password=PASSWORD, hashed_password=hashed_password)
+    assert not password_needs_rehash(hashed_password=hashed_password)
+
+
+def test_verify_password_legacy() -> None:
+    """Хэш устаревшего формата проверяется и требует пересчета."""
+    hashed_password: str = str(
+        pbkdf2_hmac(
+            hash_name=settings.LEGACY_HASH_NAME,
+            password=PASSWORD.encode(settings.PASS_ENCODE),
+            salt=SALT,
+            iterations=settings.LEGACY_ITERATIONS,
+        ),
+    )
+
+    assert verify_password(raw_password=PASSWORD, hashed_password=hashed_password)
+    assert password_needs_rehash(hashed_password=hashed_password)
+
+
+@pytest.mark.parametrize(
+    'hashed_password',
+    (
+        None,
+        '',
+        'pbkdf2$sha256:1000$не base64$не base64',
+        'scrypt$не число$MDEy$MDEy',
+    ),
+)
+def test_verify_password_invalid(hashed_password: str | None) -> None:
+    """Пустой или поврежденный хэш не проходит проверку без исключения."""
+    assert not verify_password(raw_password=PASSWORD, hashed_password=hashed_password)
+
+
+def test_password_needs_rehash_cost_changed() -> None:
+    """Хэш с другим алгоритмом или стоимостью требует пересчета."""
+    algorithm, cost, salt, digest = hash_password(raw_password=PASSWORD).split(SEPARATOR)
+    hasher_other: type[Pbkdf2Hasher] | type[ScryptHasher] = (
+        ScryptHasher if PASSWORD_HASHER_CURRENT is Pbkdf2Hasher else Pbkdf2Hasher
+    )
+
+    assert password_needs_rehash(hashed_password=SEPARATOR.join((algorithm, cost + '0', salt, digest)))
+    assert password_needs_rehash(
+        hashed_password=SEPARATOR.join((hasher_other.algorithm, hasher_other.cost_current(), salt, digest)),
+    )
+    assert not password_needs_rehash(hashed_password=None)
+
+
+async def test_password_hash_pool_cancel_keeps_slot() -> None:
+    """Отмена ожидания не освобождает место пула, пока поток не завершил задачу."""
+    pool: PasswordHashPool = PasswordHashPool(workers=1, queue_max=0)
+    release: Event = Event()
+    task: asyncio.Task = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0.05)
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert pool.in_flight == 1
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(release.wait)
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    for _ in range(100):
+        if pool.in_flight == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert pool.in_flight == 0
+    assert pool.completed_total == 1
+    pool.shutdown()
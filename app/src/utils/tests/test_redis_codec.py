@@ -0,0 +1,96 @@
+"""
+Модуль с тестами кодека данных, сохраняемых в Redis.
+"""
+
+from pydantic import BaseModel
+import pytest
+
+from src.utils.redis_codec import (
+    HEADER_MARKER,
+    HEADER_SIZE,
+    CompressionTags,
+    JsonSerializer,
+    MsgpackSerializer,
+    RedisCodec,
+    TypeTags,
+)
+
+SERIALIZERS: tuple[str, ...] = (JsonSerializer.name, MsgpackSerializer.name)
+
+
+class _Schema(BaseModel):
+    id: int
+    title: str
+
+
+@pytest.mark.parametrize('serializer', SERIALIZERS)
+@pytest.mark.parametrize(
+    ('value', 'type_tag'),
+    (
+        (b'\x00\xffbytes', TypeTags.BYTES),
+        ('123', TypeTags.STR),
+        (123, TypeTags.NATIVE),
+        ({'id': 1, 'items': [1.5, None, True]}, TypeTags.NATIVE),
+        (_Schema(id=1, title='Товар'), TypeTags.MODEL),
+    ),
+)
+def test_codec_round_trip(serializer: str, value: any, type_tag: bytes) -> None:
+    """Значение декодируется в тот же тип данных, заголовок содержит теги."""
+    codec: RedisCodec = RedisCodec(serializer=serializer)
+    data: bytes = codec.encode(value=value)
+
+    assert data[:1] == HEADER_MARKER
+    assert data[1:2] == codec.serializer.tag
+    assert data[3:4] == type_tag
+    if isinstance(value, BaseModel):
+        assert codec.decode(data=data) == value.model_dump(mode='json')
+        assert codec.decode(data=data, schema=_Schema) == value
+    else:
+        assert codec.decode(data=data) == value
+        assert type(codec.decode(data=data)) is type(value)
+
+
+@pytest.mark.parametrize('serializer', SERIALIZERS)
+def test_codec_decode_other_serializer(serializer: str) -> None:
+    """Смена сериализатора в настройках не ломает уже сохраненные значения."""
+    data: bytes = RedisCodec(serializer=serializer).encode(value={'id': 1})
+    for serializer_other in SERIALIZERS:
+        assert RedisCodec(serializer=serializer_other).decode(data=data) == {'id': 1}
+
+
+def test_codec_compression_threshold() -> None:
+    """Сжимаются только значения не меньше compress_min_bytes, если сжатие уменьшает размер."""
+    codec: RedisCodec = RedisCodec(compress_min_bytes=100)
+
+    data_small: bytes = codec.encode(value='a' * 99)
+    data_large: bytes = codec.encode(value='a' * 100)
+    data_random: bytes = codec.encode(value=bytes(range(256)))
+
+    assert data_small[2:3] == CompressionTags.NONE
+    assert data_large[2:3] == CompressionTags.ZLIB
+    assert len(data_large) < HEADER_SIZE + 100
+    assert data_random[2:3] == CompressionTags.NONE
+    assert codec.decode(data=data_large) == 'a' * 100
+    assert RedisCodec(compress_min_bytes=0).encode(value='a' * 1000)[2:3] == CompressionTags.NONE
+
+
+@pytest.mark.parametrize(
+    ('data', 'expected'),
+    (
+        (None, None),
+        (b'{"id": 1}', {'id': 1}),
+        ('[1, 2]', [1, 2]),
+        (b'plain text', 'plain text'),
+        (b'123', 123),
+        (b'\xff\xfe', b'\xff\xfe'),
+    ),
+)
+def test_codec_decode_legacy(data: bytes | str | None, expected: any) -> None:
+    """Значения без заголовка кодека декодируются из JSON или возвращаются как есть."""
+    assert RedisCodec().decode(data=data) == expected
+
+
+def test_codec_serializer_unknown() -> None:
+    """Неизвестный сериализатор вызывает ValueError при создании кодека."""
+    with pytest.raises(ValueError):
+        RedisCodec(serializer='pickle')
@@ -0,0 +1,66 @@
+"""
+Модуль с тестами кэширования пользователей между запросами.
+"""
+
+import pytest
+
+from src.api.v1.crud.user import user_v1_crud
+from src.config.config import settings
+from src.database.database import AsyncSession
+from src.models.user import User
+from src.utils.user_cache import (
+    UserSnapshot,
+    user_cache_get,
+    user_cache_set,
+)
+
+
+@pytest.fixture(autouse=True)
+def user_cache_enable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Включает кэш пользователей независимо от настроек окружения."""
+    monkeypatch.setattr(settings, 'USER_CACHE_EXPIRATION_SEC', 60)
+
+
+async def _user_create(session: AsyncSession) -> User:
+    user: User = User(
+        email='user@example.com',
+        name_first='Имя',
+        name_last='Фамилия',
+        password_hashed='hash',
+    )
+    session.add(user)
+    await session.flush()
+    await session.refresh(user)
+    return user
+
+
+async def test_user_cache_snapshot(test_async_session: AsyncSession) -> None:
+    """Из кэша возвращается снимок колонок пользователя без учетных данных."""
+    user: User = await _user_create(session=test_async_session)
+
+    await user_cache_set(user=user)
+    snapshot: UserSnapshot | None = await user_cache_get(user_id=user.id)
+
+    assert isinstance(snapshot, UserSnapshot)
+    assert snapshot.email == user.email
+    assert snapshot.datetime_registration == user.datetime_registration
+    assert snapshot.get_full_name == user.get_full_name
+    assert not hasattr(snapshot, 'password_hashed')
+
+
+async def test_user_cache_invalidated_after_commit(test_async_session: AsyncSession) -> None:
+    """При perform_commit=False снимок сбрасывается только вызовом после commit."""
+    user: User = await _user_create(session=test_async_session)
+    await user_cache_set(user=user)
+
+    user_updated: User = await user_v1_crud.update_by_id(
+        obj_id=user.id,
+        obj_data={'name_first': 'Другое'},
+        session=test_async_session,
+        perform_commit=False,
+    )
+    assert await user_cache_get(user_id=user.id) is not None
+
+    await test_async_session.commit()
+    await user_v1_crud.cache_tags_purge_for_objs(objs=(user_updated,))
+    assert await user_cache_get(user_id=user.id) is None
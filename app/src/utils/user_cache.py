@@ -0,0 +1,145 @@
+"""
+Модуль с вспомогательными функциями кэширования пользователей.
+
+Включает в себя два уровня кэша объекта User:
+    - в рамках одного запроса (request.state), чтобы зависимости и эндпоинты
+      не запрашивали одного и того же пользователя повторно
+    - между запросами (Redis) с коротким TTL USER_CACHE_EXPIRATION_SEC;
+      кэш сбрасывается при обновлении и удалении пользователя через user_v1_crud
+      и админ-панель
+
+Снимок в Redis не содержит учетных данных (хэша пароля): эндпоинты,
+которым они нужны, используют зависимость get_user_fresh.
+
+Снимок из Redis возвращается неизменяемым объектом UserSnapshot, а не объектом
+ORM модели User: такой объект не связан с сессией, и его нельзя по ошибке
+сохранить в базу данных или обратиться к незагруженным связям.
+"""
+
+from dataclasses import (
+    dataclass,
+    fields,
+)
+from datetime import (
+    date,
+    datetime,
+)
+
+from fastapi import Request
+
+from src.config.config import settings
+from src.database.database import RedisKeys
+from src.models.user import User
+from src.utils.redis_data import (
+    redis_delete_async,
+    redis_get_async,
+    redis_set_async,
+)
+
+REQUEST_STATE_USER: str = 'user'
+
+# INFO. Колонки с учетными данными не сохраняются в общий кэш Redis.
+USER_CACHE_COLUMNS_EXCLUDED: frozenset[str] = frozenset((
+    'password_hashed',
+))
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """Снимок колонок пользователя (кроме учетных данных) из кэша Redis."""
+
+    id: int
+    email: str
+    email_is_confirmed: bool
+    is_active: bool
+    is_admin: bool
+    name_first: str
+    name_last: str
+    phone: str | None
+    phone_is_confirmed: bool
+    datetime_registration: datetime
+    address_id: int | None
+    user_salesman_id: int | None
+
+    @property
+    def get_full_name(self) -> str:
+        """Возвращает имя и фамилию пользователя."""
+        return f'{self.name_first} {self.name_last}'
+
+
+USER_SNAPSHOT_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(UserSnapshot))
+
+__columns_mismatched: set[str] = set(USER_SNAPSHOT_FIELDS) ^ (
+    {column.name for column in User.__table__.columns} - USER_CACHE_COLUMNS_EXCLUDED
+)
+if __columns_mismatched:
+    raise ValueError(
+        f'Поля UserSnapshot не совпадают с колонками User: {sorted(__columns_mismatched)}',
+    )
+
+
+def user_request_cache_get(request: Request, user_id: int) -> User | UserSnapshot | None:
+    """Возвращает пользователя, уже загруженного в рамках текущего запроса."""
+    user: User | UserSnapshot | None = getattr(request.state, REQUEST_STATE_USER, None)
+    if user is not None and user.id == user_id:
+        return user
+    return None
+
+
+def user_request_cache_set(request: Request, user: User | UserSnapshot) -> None:
+    """Сохраняет пользователя в рамках текущего запроса."""
+    setattr(request.state, REQUEST_STATE_USER, user)
+    return
+
+
+async def user_cache_get(user_id: int) -> UserSnapshot | None:
+    """
+    Возвращает снимок пользователя из Redis.
+
+    Если кэш отключен (USER_CACHE_EXPIRATION_SEC == 0), пуст или содержит снимок
+    с другим набором колонок (например, после изменения модели), возвращает None.
+    """
+    if not settings.USER_CACHE_EXPIRATION_SEC:
+        return None
+
+    data: dict[str, any] | None = await redis_get_async(key=RedisKeys.USER_CACHE.format(user_id=user_id))
+    if not isinstance(data, dict) or set(data) != set(USER_SNAPSHOT_FIELDS):
+        return None
+
+    for column in User.__table__.columns:
+        value: any = data.get(column.name)
+        if not isinstance(value, str):
+            continue
+        python_type: type = column.type.python_type
+        if python_type in (date, datetime):
+            data[column.name] = python_type.fromisoformat(value)
+
+    return UserSnapshot(**data)
+
+
+async def user_cache_set(user: User) -> None:
+    """Сохраняет снимок колонок пользователя (кроме учетных данных) в Redis."""
+    if not settings.USER_CACHE_EXPIRATION_SEC:
+        return
+
+    data: dict[str, any] = {}
+    for name in USER_SNAPSHOT_FIELDS:
+        value: any = getattr(user, name)
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        data[name] = value
+
+    await redis_set_async(
+        key=RedisKeys.USER_CACHE.format(user_id=user.id),
+        value=data,
+        ex_sec=settings.USER_CACHE_EXPIRATION_SEC,
+    )
+    return
+
+
+async def user_cache_delete(user_id: int) -> None:
+    """Удаляет снимок пользователя из Redis."""
+    if not settings.USER_CACHE_EXPIRATION_SEC:
+        return
+    await redis_delete_async(key=RedisKeys.USER_CACHE.format(user_id=user_id))
+    return